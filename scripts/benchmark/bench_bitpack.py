@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+三维 0/1 数组位打包性能测试
+校验 np3_to_np1/np1_to_np3 与原逐元素循环实现的结果一致，并对比在完整 Grid 尺寸上的耗时
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from mozi_ai_x.utils import Grid, np1_to_np3, np3_to_memoryview, np3_to_np1
+
+
+def reference_np3_to_np1(np_3: np.ndarray) -> np.ndarray:
+    """原逐元素循环实现"""
+    num = np_3.size // 8
+    if np_3.size % 8 > 0:
+        num += 1
+    np_1 = np.zeros(num, dtype=np.uint8)
+    (alt_num, lat_num, lon_num) = np_3.shape
+    for x in range(alt_num):
+        for y in range(lat_num):
+            for z in range(lon_num):
+                if np_3[x][y][z] > 0:
+                    n_num = x * lat_num * lon_num + y * lon_num + z
+                    np_1[n_num // 8] = np_1[n_num // 8] | (pow(2, n_num % 8))
+    return np_1
+
+
+def reference_np1_to_np3(np_1: np.ndarray, shape: tuple[int, int, int]) -> np.ndarray:
+    """原逐元素循环实现"""
+    (alt_num, lat_num, lon_num) = shape
+    np_3 = np.zeros(shape, dtype=np.uint8)
+    for x in range(alt_num):
+        for y in range(lat_num):
+            for z in range(lon_num):
+                n_num = x * lat_num * lon_num + y * lon_num + z
+                np_3[x][y][z] = (np_1[n_num // 8] >> (n_num % 8)) & 1
+    return np_3
+
+
+def _timeit(func, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def check_parity(rng: np.random.Generator) -> None:
+    """在不同形状（含不能被 8 整除的大小）上对比新旧实现"""
+    for shape in ((1, 1, 1), (2, 3, 5), (7, 9, 13), (3, 16, 8)):
+        np_3 = (rng.random(shape) < 0.3).astype(np.uint8)
+        expected = reference_np3_to_np1(np_3)
+        packed = np3_to_np1(np_3)
+        assert np.array_equal(packed, expected), shape
+        assert np.array_equal(np1_to_np3(packed, shape), reference_np1_to_np3(expected, shape)), shape
+        assert bytes(np3_to_memoryview(np_3)) == expected.tobytes(), shape
+
+        batch = (rng.random((4, *shape)) < 0.3).astype(np.uint8)
+        packed = np3_to_np1(batch)
+        assert np.array_equal(packed, np.stack([reference_np3_to_np1(item) for item in batch])), shape
+        assert np.array_equal(np1_to_np3(packed, shape), batch), shape
+    print("一致性校验通过")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="三维 0/1 数组位打包性能测试")
+    parser.add_argument("--skip-reference", action="store_true", help="不运行原循环实现（完整 Grid 上需要数秒）")
+    parser.add_argument("--batch", type=int, default=8, help="批量打包的数量")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    check_parity(rng)
+
+    shape = (len(Grid.ALTITUDE_BANDS), Grid.LAT_UNIT_COUNT, Grid.LON_UNIT_COUNT)
+    np_3 = (rng.random(shape) < 0.1).astype(np.uint8)
+    packed = np3_to_np1(np_3)
+    print(f"Grid 形状 {shape}，{np_3.size} 个元素，打包后 {packed.nbytes} 字节")
+
+    if not args.skip_reference:
+        print(
+            f"原实现  打包 {_timeit(lambda: reference_np3_to_np1(np_3)):.0f} ms，解包 {_timeit(lambda: reference_np1_to_np3(packed, shape)):.0f} ms"
+        )
+    print(
+        f"packbits 打包 {_timeit(lambda: np3_to_np1(np_3), 10):.2f} ms，解包 {_timeit(lambda: np1_to_np3(packed, shape), 10):.2f} ms"
+    )
+
+    batch = np.repeat(np_3[None], args.batch, axis=0)
+    print(f"批量 {args.batch} 个 打包 {_timeit(lambda: np3_to_np1(batch), 5):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
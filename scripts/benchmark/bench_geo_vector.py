@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+向量化地理计算性能测试
+校验 geo_vector 与 geo 标量函数的计算结果一致，并对比单元 × 目标距离、方位矩阵的计算耗时
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from mozi_ai_x.utils import geo, geo_vector
+
+
+def _timeit(func) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def _angle_diff(a: np.ndarray, b: np.ndarray) -> float:
+    """方位角差值，考虑 0/360 环绕"""
+    diff = np.abs(np.asarray(a, dtype=np.float64) - b) % 360
+    return float(np.max(np.minimum(diff, 360 - diff)))
+
+
+def check_parity(rng: np.random.Generator, count: int) -> None:
+    """逐点对比标量与向量化结果，输出最大误差"""
+    lat1, lat2 = rng.uniform(-80, 80, (2, count))
+    lon1, lon2 = rng.uniform(-180, 180, (2, count))
+    alt1, alt2 = rng.uniform(0, 12000, (2, count))
+    distance = rng.uniform(0, 2000, count)
+    bearing = rng.uniform(0, 360, count)
+
+    scalar = {
+        "horizontal_distance": [
+            geo.get_horizontal_distance(p, q)
+            for p, q in zip(zip(lat1, lon1, strict=True), zip(lat2, lon2, strict=True), strict=True)
+        ],
+        "slant_distance": [
+            geo.get_slant_distance(p, q)
+            for p, q in zip(zip(lat1, lon1, alt1, strict=True), zip(lat2, lon2, alt2, strict=True), strict=True)
+        ],
+        "azimuth": [
+            geo.get_azimuth(p, q) for p, q in zip(zip(lat1, lon1, strict=True), zip(lat2, lon2, strict=True), strict=True)
+        ],
+        "end_point": [
+            geo.get_end_point(p, d, b) for p, d, b in zip(zip(lat1, lon1, strict=True), distance, bearing, strict=True)
+        ],
+        "point_with_bearing_distance": [
+            tuple(geo.get_point_with_point_bearing_distance(la, lo, b, d).values())
+            for la, lo, b, d in zip(lat1, lon1, bearing, distance, strict=True)
+        ],
+    }
+
+    errors: dict[str, dict[str, float]] = {}
+    for dtype_name in ("float64", "float32"):
+        dtype = np.dtype(dtype_name)
+        vector = {
+            "horizontal_distance": geo_vector.horizontal_distance(lat1, lon1, lat2, lon2, dtype=dtype),
+            "slant_distance": geo_vector.slant_distance(lat1, lon1, alt1, lat2, lon2, alt2, dtype=dtype),
+            "azimuth": geo_vector.azimuth(lat1, lon1, lat2, lon2, dtype=dtype),
+            "end_point": np.stack(geo_vector.end_point(lat1, lon1, distance, bearing, dtype=dtype), axis=-1),
+            "point_with_bearing_distance": np.stack(
+                geo_vector.point_with_bearing_distance(lat1, lon1, bearing, distance, dtype=dtype), axis=-1
+            ),
+        }
+        for name, expected in scalar.items():
+            expected = np.asarray(expected)
+            if name == "azimuth":
+                error = _angle_diff(vector[name], expected)
+            else:
+                error = float(np.max(np.abs(vector[name].astype(np.float64) - expected)))
+            errors.setdefault(name, {})[dtype_name] = error
+
+    print(f"{'函数':<30}{'float64 最大误差':>18}{'float32 最大误差':>18}")
+    for name, error in errors.items():
+        print(f"{name:<30}{error['float64']:>18.3e}{error['float32']:>18.3e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="向量化地理计算性能测试")
+    parser.add_argument("--units", type=int, default=500, help="单元数量")
+    parser.add_argument("--contacts", type=int, default=2000, help="目标数量")
+    parser.add_argument("--parity", type=int, default=20000, help="一致性校验的点对数量")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    check_parity(rng, args.parity)
+
+    unit_lats, contact_lats = rng.uniform(20, 45, args.units), rng.uniform(20, 45, args.contacts)
+    unit_lons, contact_lons = rng.uniform(110, 140, args.units), rng.uniform(110, 140, args.contacts)
+    units = list(zip(unit_lats.tolist(), unit_lons.tolist(), strict=True))
+    contacts = list(zip(contact_lats.tolist(), contact_lons.tolist(), strict=True))
+
+    print(f"\n{args.units} 个单元 × {args.contacts} 个目标")
+    print(f"{'计算':<16}{'标量(ms)':>12}{'float64(ms)':>14}{'float32(ms)':>14}")
+    for name, scalar_func, matrix_func in (
+        ("距离矩阵", geo.get_horizontal_distance, geo_vector.distance_matrix),
+        ("方位矩阵", geo.get_azimuth, geo_vector.azimuth_matrix),
+    ):
+        scalar_cost, _ = _timeit(lambda f=scalar_func: [[f(u, c) for c in contacts] for u in units])
+        f64_cost, _ = _timeit(lambda f=matrix_func: f(unit_lats, unit_lons, contact_lats, contact_lons))
+        f32_cost, _ = _timeit(lambda f=matrix_func: f(unit_lats, unit_lons, contact_lats, contact_lons, dtype=np.float32))
+        print(f"{name:<16}{scalar_cost:>12.1f}{f64_cost:>14.1f}{f32_cost:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+网格距离覆盖性能测试
+模拟每步为一批单元计算探测覆盖范围（Grid.get_grids_within_distance），
+对比首次计算（距离核未缓存）与后续计算（命中缓存）的耗时，并与逐网格精确计算的结果比较
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from mozi_ai_x.utils import Grid, geo_vector
+
+
+def brute_force_area(location: tuple[float, float], distance_km: float) -> np.ndarray:
+    """对全部网格中心计算距离的精确结果"""
+    lons, lats, _ = Grid.get_positions(np.arange(Grid.LON_UNIT_COUNT)[None, :], np.arange(Grid.LAT_UNIT_COUNT)[:, None], 0)
+    distances = geo_vector.horizontal_distance(location[0], location[1], lats, lons)
+    return (distances < round(distance_km, 1)).astype(np.int8)
+
+
+def check_accuracy(rng: np.random.Generator, count: int) -> None:
+    """统计与精确结果不一致的网格比例（距离核按网格中心计算，差异位于覆盖范围边缘）"""
+    mismatched = covered = 0
+    for _ in range(count):
+        location = (rng.uniform(Grid.MIN_LATITUDE, Grid.MAX_LATITUDE), rng.uniform(Grid.MIN_LONGITUDE, Grid.MAX_LONGITUDE))
+        distance = float(rng.choice([rng.uniform(0.5, 5), rng.uniform(5, 40), rng.uniform(40, 250)]))
+        area, _ = Grid._get_area_within_distance(location, distance)
+        expected = brute_force_area(location, distance)
+        mismatched += int(np.count_nonzero(area != expected))
+        covered += int(expected.sum())
+    print(f"{count} 次随机查询，与精确结果不一致的网格占覆盖网格的 {mismatched / covered:.3%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="网格距离覆盖性能测试")
+    parser.add_argument("--units", type=int, default=100, help="每步计算覆盖范围的单元数量")
+    parser.add_argument("--steps", type=int, default=10, help="模拟步数")
+    parser.add_argument("--accuracy", type=int, default=100, help="精度校验的查询次数")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    check_accuracy(rng, args.accuracy)
+
+    # 单元位于左侧区域内，探测距离取几种常见值
+    lats = rng.uniform(Grid.MIN_LATITUDE + 0.5, Grid.MAX_LATITUDE - 0.5, args.units)
+    lons = rng.uniform(Grid.MIN_LONGITUDE + 0.5, Grid.MID_LONGITUDE - 1.5, args.units)
+    distances = rng.choice([20.0, 40.0, 80.0, 120.0], args.units)
+
+    Grid.clear_kernel_cache()
+    print(f"\n{args.units} 个单元 × {args.steps} 步")
+    for step in range(args.steps):
+        start = time.perf_counter()
+        for lat, lon, distance in zip(lats.tolist(), lons.tolist(), distances.tolist(), strict=True):
+            Grid._get_area_within_distance((lat, lon), distance, True)
+        area_cost = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        for lat, lon, distance in zip(lats.tolist(), lons.tolist(), distances.tolist(), strict=True):
+            Grid.get_grids_within_distance((lat, lon), distance)
+        ids_cost = (time.perf_counter() - start) * 1000
+        print(
+            f"第 {step + 1} 步: 覆盖掩码 {area_cost:.1f} ms，网格ID列表 {ids_cost:.1f} ms，缓存距离核 {len(Grid.default()._kernel_cache)} 个"
+        )
+        # 单元移动
+        lats += rng.normal(0, 0.01, args.units)
+        lons += rng.normal(0, 0.01, args.units)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+网格批量查询性能测试
+校验 Grid 数组版本的索引、ID、中心位置查询与逐点标量查询结果一致，
+矩形区域、全部网格枚举与原逐步累加实现结果一致，并对比耗时
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from mozi_ai_x.utils import Grid
+
+
+def reference_grids_in_rectangle(
+    max_latitude: float, min_latitude: float, min_longitude: float, max_longitude: float, altitude: float
+) -> set[int]:
+    """原逐步累加实现"""
+    grid_ids = set()
+    lon = min_longitude
+    while lon < max_longitude:
+        lat = min_latitude
+        while lat < max_latitude:
+            index = Grid.get_index(lon, lat, altitude)
+            if index:
+                grid_ids.add(Grid.get_grid_id(lon, lat, altitude))
+            lat += Grid.DEGREE_UNIT
+        lon += Grid.DEGREE_UNIT
+    return grid_ids
+
+
+def _timeit(func, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def _random_points(rng: np.random.Generator, count: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """覆盖区域内外、经度分区边界和高度层边界的随机位置"""
+    lons = rng.uniform(Grid.MIN_LONGITUDE - 0.5, Grid.MAX_LONGITUDE + 0.5, count)
+    lats = rng.uniform(Grid.MIN_LATITUDE - 0.5, Grid.MAX_LATITUDE + 0.5, count)
+    alts = rng.uniform(-500, 12000, count)
+    edge = min(count, 64)
+    lons[: edge // 2] = rng.choice([Grid.MIN_LONGITUDE, Grid.MID_LONGITUDE, Grid.MAX_LONGITUDE], edge // 2)
+    alts[:edge] = rng.choice(Grid.ALTITUDE_BANDS, edge)
+    return lons, lats, alts
+
+
+def check_parity(rng: np.random.Generator, count: int) -> None:
+    lons, lats, alts = _random_points(rng, count)
+    lon_idx, lat_idx, alt_idx = Grid.get_indices(lons, lats, alts)
+    grid_ids = Grid.get_grid_ids(lons, lats, alts)
+    positions = np.stack(Grid.get_positions(lon_idx, lat_idx, alt_idx), axis=-1)
+    for i, (lon, lat, alt) in enumerate(zip(lons.tolist(), lats.tolist(), alts.tolist(), strict=True)):
+        index = Grid.get_index(lon, lat, alt)
+        if index is None:
+            assert grid_ids[i] == -1 and lon_idx[i] == -1, (lon, lat, alt)
+            continue
+        assert (lon_idx[i], lat_idx[i], alt_idx[i]) == index, (lon, lat, alt)
+        assert grid_ids[i] == Grid.get_grid_id(lon, lat, alt), (lon, lat, alt)
+        assert np.allclose(positions[i], Grid.get_position(*index)), index
+
+    for _ in range(50):
+        min_lon, max_lon = np.sort(rng.uniform(Grid.MIN_LONGITUDE - 0.2, Grid.MAX_LONGITUDE + 0.2, 2)).tolist()
+        min_lat, max_lat = np.sort(rng.uniform(Grid.MIN_LATITUDE - 0.2, Grid.MAX_LATITUDE + 0.2, 2)).tolist()
+        altitude = float(rng.choice(Grid.ALTITUDE_BANDS))
+        expected = reference_grids_in_rectangle(max_lat, min_lat, min_lon, max_lon, altitude)
+        assert set(Grid.get_grids_in_rectangle(max_lat, min_lat, min_lon, max_lon, altitude)) == expected
+    print("一致性校验通过")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="网格批量查询性能测试")
+    parser.add_argument("--points", type=int, default=100000, help="批量查询的位置数量")
+    parser.add_argument("--parity", type=int, default=20000, help="一致性校验的位置数量")
+    parser.add_argument("--skip-reference", action="store_true", help="不运行原实现的全部网格枚举（需要数秒）")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    check_parity(rng, args.parity)
+
+    lons, lats, alts = _random_points(rng, args.points)
+    points = list(zip(lons.tolist(), lats.tolist(), alts.tolist(), strict=True))
+    print(f"\n{args.points} 个位置")
+    print(f"{'查询':<12}{'逐点(ms)':>12}{'数组(ms)':>12}")
+    scalar_cost = _timeit(lambda: [Grid.get_index(*point) for point in points])
+    print(f"{'网格索引':<12}{scalar_cost:>12.1f}{_timeit(lambda: Grid.get_indices(lons, lats, alts), 5):>12.1f}")
+    scalar_cost = _timeit(lambda: [Grid.get_grid_id(*point) for point in points])
+    print(f"{'网格ID':<12}{scalar_cost:>12.1f}{_timeit(lambda: Grid.get_grid_ids(lons, lats, alts), 5):>12.1f}")
+
+    rectangle = (41.5, 39.0, 44.0, 50.0, 3000)
+    print(f"\n{'枚举':<12}{'原实现(ms)':>12}{'数组(ms)':>12}")
+    print(
+        f"{'矩形区域':<12}{_timeit(lambda: reference_grids_in_rectangle(*rectangle)):>12.1f}"
+        f"{_timeit(lambda: Grid.get_grids_in_rectangle(*rectangle), 5):>12.1f}"
+    )
+    if not args.skip_reference:
+        full = (Grid.MAX_LATITUDE, Grid.MIN_LATITUDE, Grid.MIN_LONGITUDE, Grid.MAX_LONGITUDE)
+        reference_cost = _timeit(lambda: [reference_grids_in_rectangle(*full, altitude) for altitude in Grid.ALTITUDE_BANDS])
+        print(f"{'全部网格':<12}{reference_cost:>12.1f}{_timeit(Grid.get_all_grids, 5):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+网格覆盖栅格性能测试
+对比每步用 Python 集合合并 Grid.get_grids_within_distance 结果重建覆盖范围，与 GridRaster 增量更新的耗时，
+并校验两者得到的覆盖网格一致
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from mozi_ai_x.utils import Grid, GridRaster
+
+
+def rebuild_with_sets(units: dict[str, SimpleNamespace]) -> set[int]:
+    """原做法：每步按全部单元重新合并覆盖网格"""
+    covered: set[int] = set()
+    for unit in units.values():
+        covered.update(Grid.get_grids_within_distance((unit.latitude, unit.longitude), unit.radius))
+    return covered
+
+
+def main():
+    parser = argparse.ArgumentParser(description="网格覆盖栅格性能测试")
+    parser.add_argument("--units", type=int, default=100, help="每个推演方的单元数量")
+    parser.add_argument("--sides", type=int, default=2, help="推演方数量")
+    parser.add_argument("--steps", type=int, default=20, help="模拟步数")
+    parser.add_argument("--moving", type=float, default=0.2, help="每步移动的单元比例")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    sides = {}
+    for side in range(args.sides):
+        sides[f"side{side}"] = {
+            f"unit{side}-{i}": SimpleNamespace(
+                latitude=float(rng.uniform(Grid.MIN_LATITUDE, Grid.MAX_LATITUDE)),
+                longitude=float(rng.uniform(Grid.MIN_LONGITUDE, Grid.MAX_LONGITUDE)),
+                radius=float(rng.choice([20.0, 40.0, 80.0, 120.0])),
+            )
+            for i in range(args.units)
+        }
+
+    raster = GridRaster()
+    rebuild_cost = raster_cost = 0.0
+    restamped = 0
+    for step in range(args.steps):
+        for units in sides.values():
+            for unit in units.values():
+                if rng.random() < args.moving:
+                    unit.latitude += float(rng.normal(0, 0.02))
+                    unit.longitude += float(rng.normal(0, 0.02))
+
+        start = time.perf_counter()
+        expected = {side: rebuild_with_sets(units) for side, units in sides.items()}
+        rebuild_cost += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for side, units in sides.items():
+            restamped += raster.sync(side, "sensor", units, radius_km=lambda unit: unit.radius)
+        for side in sides:
+            raster.get_mask(side, "sensor")
+        raster_cost += time.perf_counter() - start
+
+        if step == args.steps - 1:
+            for side in sides:
+                assert set(raster.get_grid_ids(side, "sensor")) == expected[side], side
+            print("覆盖网格与集合重建结果一致")
+
+    total = args.units * args.sides
+    print(f"{args.sides} 个推演方 × {args.units} 个单元，{args.steps} 步，每步约 {args.moving:.0%} 的单元移动")
+    print(f"集合重建: 每步 {rebuild_cost * 1000 / args.steps:.1f} ms")
+    print(
+        f"增量栅格: 每步 {raster_cost * 1000 / args.steps:.1f} ms（含首步全部计算），"
+        f"平均每步重新计算 {restamped / args.steps:.0f}/{total} 个单元"
+    )
+    packed = raster.pack("side0", "sensor")
+    print(f"打包后 {packed.nbytes} 字节，形状 (1, {Grid.LAT_UNIT_COUNT}, {Grid.LON_UNIT_COUNT})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+模型数据库查询性能测试
+在临时 SQLite 文件中生成合成的 dataweapon/dataaircraft/datafacility 表，模拟每步解析挂架、弹药库、挂载方案时
+逐条查询武器名称和类型，对比不缓存、LRU 缓存与整表预加载的耗时；模拟启动时为大量型号补充模型信息，
+对比逐个查询与批量查询（get_weapon_infos/get_model_infos）的耗时和查询次数，并校验各模式的查询结果一致；
+在事件循环中直接查询与通过 AsyncModelDatabase 在线程池中查询，对比事件循环的最长停顿
+"""
+
+import argparse
+import asyncio
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from mozi_ai_x.database.database import WEAPON_COLUMNS, AsyncModelDatabase, DBConfig, DBType, ModelDatabase, SQLiteBackend
+
+
+def create_database(path: Path, weapons: int, models: int, seed: int = 0) -> None:
+    """生成合成的模型表，ID 从 1 开始连续编号"""
+    rng = random.Random(seed)
+    columns = [name.strip() for name in WEAPON_COLUMNS.split(",")]
+    conn = sqlite3.connect(path)
+    types = {"ID": "INTEGER PRIMARY KEY", "Name": "TEXT", "Type": "INTEGER"}
+    definitions = ", ".join(f"{name} {types.get(name, 'REAL')}" for name in columns)
+    conn.execute(f"CREATE TABLE dataweapon ({definitions})")
+    conn.executemany(
+        f"INSERT INTO dataweapon VALUES ({', '.join('?' * len(columns))})",
+        [(i, f"weapon_{i}", rng.randint(1001, 9003), *(rng.uniform(0, 100) for _ in columns[3:])) for i in range(1, weapons + 1)],
+    )
+    for category in ("aircraft", "facility"):
+        conn.execute(f"CREATE TABLE data{category} (ID INTEGER PRIMARY KEY, Name TEXT, Type INTEGER)")
+        conn.executemany(
+            f"INSERT INTO data{category} VALUES (?, ?, ?)",
+            [(i, f"{category}_{i}", rng.randint(1000, 9999)) for i in range(1, models + 1)],
+        )
+    conn.commit()
+    conn.close()
+
+
+def open_database(path: Path, **kwargs) -> ModelDatabase:
+    config = DBConfig(db_type=DBType.SQLITE, host="", port=0, database=str(path), username="", password="")
+    return ModelDatabase(SQLiteBackend(config), **kwargs)
+
+
+def run_lookups(db: ModelDatabase, weapon_ids: list[int], aircraft_ids: list[int]) -> list:
+    results = [db.get_weapon_name_type(weapon_id) for weapon_id in weapon_ids]
+    results += [db.get_model_info("aircraft", db_id) for db_id in aircraft_ids]
+    return results
+
+
+def bench_bulk(path: Path, weapon_ids: list[int], aircraft_ids: list[int]) -> None:
+    """启动时补充模型信息：逐个查询与批量查询，均不使用缓存"""
+    single_db = open_database(path, cache_size=0)
+    start = time.perf_counter()
+    single = {weapon_id: single_db.get_weapon_info(weapon_id) for weapon_id in weapon_ids}
+    single_models = {db_id: single_db.get_model_info("aircraft", db_id) for db_id in aircraft_ids}
+    single_ms = (time.perf_counter() - start) * 1000
+
+    bulk_db = open_database(path, cache_size=0)
+    start = time.perf_counter()
+    bulk = bulk_db.get_weapon_infos(weapon_ids)
+    bulk_models = bulk_db.get_model_infos("aircraft", aircraft_ids)
+    bulk_ms = (time.perf_counter() - start) * 1000
+
+    assert bulk == single and bulk_models == single_models
+    for db in (single_db, bulk_db):
+        db.backend.disconnect()
+    count = len(weapon_ids) + len(aircraft_ids)
+    print(f"补充 {count} 个型号的信息：")
+    print(f"  逐个查询 {single_ms:8.1f} ms，{single_db.cache_stats['queries']} 次查询")
+    print(f"  批量查询 {bulk_ms:8.1f} ms，{bulk_db.cache_stats['queries']} 次查询")
+
+
+async def _max_stall(workload) -> tuple[float, float]:
+    """运行 workload，同时每 1 ms 唤醒一次的协程记录事件循环的最长停顿，返回 (耗时, 最长停顿)（毫秒）"""
+    stall = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await workload()
+    cost = time.perf_counter() - start
+    done = True
+    await task
+    return cost * 1000, stall * 1000
+
+
+def bench_async(path: Path, weapon_ids: list[int], workers: int) -> None:
+    """事件循环中的查询：直接调用与 AsyncModelDatabase（均不使用缓存）"""
+    chunks = [weapon_ids[i::workers] for i in range(workers)]
+
+    async def run():
+        db = open_database(path, cache_size=0)
+
+        async def direct():
+            for chunk in chunks:
+                for weapon_id in chunk:
+                    db.get_weapon_info(weapon_id)
+
+        async def offloaded():
+            async_db = AsyncModelDatabase(db)
+
+            async def worker(chunk):
+                for weapon_id in chunk:
+                    await async_db.get_weapon_info(weapon_id)
+
+            await asyncio.gather(*(worker(chunk) for chunk in chunks))
+
+        for label, workload in (("直接查询", direct), (f"AsyncModelDatabase，{workers} 个协程", offloaded)):
+            cost, stall = await _max_stall(workload)
+            print(f"  {label}: {cost:8.1f} ms，事件循环最长停顿 {stall:8.1f} ms")
+        db.backend.disconnect()
+
+    print(f"事件循环中查询 {len(weapon_ids)} 个武器：")
+    asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="模型数据库查询性能测试")
+    parser.add_argument("--weapons", type=int, default=5000, help="dataweapon 表的行数")
+    parser.add_argument("--models", type=int, default=3000, help="dataaircraft/datafacility 表的行数")
+    parser.add_argument("--lookups", type=int, default=20000, help="每步的武器查询次数")
+    parser.add_argument("--distinct", type=int, default=300, help="想定中出现的不同武器和飞机型号数量")
+    parser.add_argument("--steps", type=int, default=5, help="模拟的推演步数")
+    parser.add_argument("--workers", type=int, default=4, help="异步查询的并发协程数")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "modeldata.db"
+        create_database(path, args.weapons, args.models)
+        # 想定中只出现少量型号，每步反复查询；包含少量不存在的 ID
+        weapon_pool = rng.sample(range(1, args.weapons + 50), args.distinct)
+        aircraft_pool = rng.sample(range(1, args.models + 1), args.distinct)
+        weapon_ids = [rng.choice(weapon_pool) for _ in range(args.lookups)]
+        aircraft_ids = [rng.choice(aircraft_pool) for _ in range(args.lookups // 10)]
+
+        expected = None
+        for label, kwargs in (("不缓存", {"cache_size": 0}), ("LRU 缓存", {}), ("整表预加载", {"preload": True})):
+            db = open_database(path, **kwargs)
+            costs = []
+            for _ in range(args.steps):
+                start = time.perf_counter()
+                results = run_lookups(db, weapon_ids, aircraft_ids)
+                costs.append((time.perf_counter() - start) * 1000)
+            if expected is None:
+                expected = results
+            assert results == expected, label
+            db.backend.disconnect()
+            print(
+                f"{label:8s} 首步 {costs[0]:8.1f} ms，之后每步 {min(costs[1:] or costs):8.1f} ms，"
+                f"命中 {db.cache_stats['hits']}，访问数据库 {db.cache_stats['misses']}"
+            )
+        print("各模式查询结果一致")
+
+        bench_bulk(path, list(range(1, args.weapons + 50)), list(range(1, args.models + 1)))
+        bench_async(path, weapon_ids[:2000], args.workers)
+
+
+if __name__ == "__main__":
+    main()
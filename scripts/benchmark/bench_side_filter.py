@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Master 代理按推演方过滤态势的性能测试
+用合成的多推演方态势驱动 MoziProxyServer（以本地桩代替墨子服务器），对比完整态势与各推演方过滤后的回复长度、
+Client 端解析耗时，输出 Master 端划分和序列化的耗时，并校验过滤结果只包含该推演方的对象
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from types import SimpleNamespace
+
+from bench_situation_decode import synthesize
+
+from mozi_ai_x.simulation.proto.grpc import GrpcReply, GrpcRequest
+from mozi_ai_x.simulation.scenario import CScenario
+from mozi_ai_x.simulation.server.distributed import SIDE_FILTER_SEPARATOR, MoziProxyServer
+from mozi_ai_x.simulation.situ_schema import decode_situation
+
+# 挂在平台上的子对象，没有 m_Side，通过 m_ParentPlatform 确定推演方
+SUB_OBJECT_CLASSES = ("CSensor", "CMount")
+
+
+def synthesize_sides(units: int, sides: int) -> tuple[str, str, dict[str, str]]:
+    """
+    合成多个推演方的全量态势和一步增量更新，每个推演方的对象数量相同
+
+    Returns:
+        tuple[str, str, dict[str, str]]: (GetAllState 数据, UpdateState 数据, {推演方名称: 推演方 GUID})
+    """
+    full, update, side_names = {}, {}, {}
+    for index in range(sides):
+        side_full, side_update = (json.loads(data) for data in synthesize(units // sides, seed=index))
+        side_guid = next(guid for guid, item in side_full.items() if item["ClassName"] == "CSide")
+        name = f"推演方{index}"
+        side_full[side_guid]["strName"] = name
+        side_names[name] = side_guid
+        platforms = [guid for guid, item in side_full.items() if item["ClassName"] in ("CAircraft", "CShip")]
+        for i, item in enumerate(side_full.values()):
+            if item["ClassName"] in SUB_OBJECT_CLASSES:
+                del item["m_Side"]
+                item["m_ParentPlatform"] = platforms[i % len(platforms)]
+        full.update(side_full)
+        update.update(side_update)
+    return json.dumps(full, ensure_ascii=False), json.dumps(update, ensure_ascii=False), side_names
+
+
+class _Stub:
+    """代替墨子服务器，按命令返回固定的态势数据"""
+
+    def __init__(self, replies: dict[str, str]):
+        self.replies = replies
+
+    async def grpc_connect(self, request, timeout=None):
+        message = self.replies[request.name]
+        return GrpcReply(message=message, length=len(message))
+
+
+def _parse_ms(command: str, message: str) -> float:
+    start = time.perf_counter()
+    scenario = CScenario(None)
+    if command == "GetAllState":
+        scenario.situation._parse_full_situation(decode_situation(message), scenario)
+    else:
+        list(decode_situation(message, typed=False))
+    return (time.perf_counter() - start) * 1000
+
+
+def _check(message: str, side_guid: str, side_of: dict[str, str]) -> None:
+    """过滤结果中可确定推演方的对象都属于该推演方"""
+    for guid in json.loads(message):
+        assert side_of.get(guid, side_guid) == side_guid, guid
+
+
+async def run(args) -> None:
+    full_data, update_data, side_names = synthesize_sides(args.units, args.sides)
+    full = json.loads(full_data)
+    side_of = {guid: item["m_Side"] for guid, item in full.items() if "m_Side" in item}
+    for item in full.values():
+        if item["ClassName"] == "CContact":
+            side_of[item["strGuid"]] = item["m_OriginalDetectorSide"]
+        elif "m_ParentPlatform" in item:
+            side_of[item["strGuid"]] = side_of[item["m_ParentPlatform"]]
+    print(f"{args.sides} 个推演方，共 {len(full)} 个对象")
+
+    proxy = MoziProxyServer(SimpleNamespace(scenario=None), 0, cache_ttl=None)
+    proxy._mozi_stub = _Stub({"GetAllState": full_data, "UpdateState": update_data})
+
+    for command, data in (("GetAllState", full_data), ("UpdateState", update_data)):
+        # 每轮使缓存失效，模拟一个新的推演时刻
+        proxy.invalidate()
+        start = time.perf_counter()
+        replies = {}
+        for name, side_guid in side_names.items():
+            replies[side_guid] = await proxy._forward(GrpcRequest(name=f"{command}{SIDE_FILTER_SEPARATOR}{name}"))
+        master_ms = (time.perf_counter() - start) * 1000
+        for side_guid, reply in replies.items():
+            _check(reply.message, side_guid, side_of)
+
+        full_parse = statistics.median(_parse_ms(command, data) for _ in range(args.repeat))
+        side_sizes = [len(reply.message) for reply in replies.values()]
+        side_parse = statistics.median(_parse_ms(command, reply.message) for reply in replies.values())
+        print(f"{command}:")
+        print(f"  完整态势   {len(data) / 1024:8.0f} KB，Client 解析 {full_parse:7.1f} ms")
+        print(f"  单推演方   {statistics.mean(side_sizes) / 1024:8.0f} KB，Client 解析 {side_parse:7.1f} ms")
+        print(f"  Master 划分并序列化 {len(replies)} 个推演方 {master_ms:.1f} ms")
+    print(f"回复长度合计 {proxy.side_stats['full_size']} -> {proxy.side_stats['sent_size']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Master 代理按推演方过滤态势的性能测试")
+    parser.add_argument("--units", type=int, default=6000, help="合成态势的对象数量（各推演方平分）")
+    parser.add_argument("--sides", type=int, default=3, help="推演方数量")
+    parser.add_argument("--repeat", type=int, default=3, help="Client 解析完整态势的重复次数")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+态势解码性能测试
+对比各 JSON 解码后端下 GetAllState/UpdateState 的“解码 + 应用”耗时
+
+默认使用按 var_map 合成的大规模态势，也可以通过 --full/--update 指定录制的服务端返回数据
+（GetAllState/UpdateState 的原始 JSON 文本）。
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+import uuid
+from pathlib import Path
+
+from mozi_ai_x.simulation import situ_interpret
+from mozi_ai_x.simulation.scenario import CScenario
+from mozi_ai_x.simulation.situ_schema import decode_situation
+from mozi_ai_x.utils.json_codec import available_backends
+
+# 合成态势中各类型对象的占比
+SYNTHETIC_MIX = {
+    "CAircraft": 0.35,
+    "CShip": 0.1,
+    "CContact": 0.3,
+    "CWeapon": 0.15,
+    "CSensor": 0.05,
+    "CMount": 0.05,
+}
+
+# 每步更新中会变化的字段（位置、姿态、状态等）
+UPDATE_FIELDS = ("dLatitude", "dLongitude", "fCurrentHeading", "fCurrentSpeed", "fCurrentAlt", "strActiveUnitStatus")
+
+
+def _fake_value(key: str, rng: random.Random):
+    """按字段名前缀生成取值"""
+    if key.startswith(("b", "m_b")):
+        return rng.random() < 0.5
+    if key.startswith(("d", "f")):
+        return rng.uniform(-180, 180)
+    if key.startswith(("i", "n", "m_i")):
+        return rng.randint(0, 10000)
+    return f"{key}_{rng.randint(0, 999)}"
+
+
+def synthesize(count: int, seed: int = 0) -> tuple[str, str]:
+    """
+    合成全量态势和一步增量更新
+
+    Returns:
+        tuple[str, str]: (GetAllState 数据, UpdateState 数据)
+    """
+    rng = random.Random(seed)
+    side_guid = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    full = {side_guid: {"ClassName": "CSide", "strGuid": side_guid, "strName": "红方"}}
+    update = {}
+    for class_name, ratio in SYNTHETIC_MIX.items():
+        var_map = getattr(situ_interpret, f"{class_name}Dict").var_map
+        for _ in range(int(count * ratio)):
+            guid = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+            item = {key: _fake_value(key, rng) for key in var_map}
+            item.update({"ClassName": class_name, "strGuid": guid, "m_Side": side_guid, "m_OriginalDetectorSide": side_guid})
+            full[guid] = item
+            changed = {key: _fake_value(key, rng) for key in UPDATE_FIELDS if key in var_map}
+            update[guid] = {"ClassName": class_name, "strGuid": guid, **changed}
+    return json.dumps(full, ensure_ascii=False), json.dumps(update, ensure_ascii=False)
+
+
+def _timeit(func, repeat: int) -> float:
+    """返回 repeat 次调用的中位数耗时（毫秒）"""
+    costs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        costs.append((time.perf_counter() - start) * 1000)
+    return statistics.median(costs)
+
+
+def bench_backend(backend: str, full_data: str, update_data: str, steps: int) -> dict[str, float]:
+    scenario = CScenario(None)
+    situation = scenario.situation
+
+    def decode_full():
+        list(decode_situation(full_data, backend))
+
+    def init_step():
+        fresh = CScenario(None)
+        fresh.situation._parse_full_situation(decode_situation(full_data, backend), fresh)
+
+    def update_step():
+        situation._prepare_for_update()
+        situation._process_update_data(decode_situation(update_data, backend, typed=False), scenario)
+
+    situation._parse_full_situation(decode_situation(full_data, backend), scenario)
+    return {
+        "decode_full": _timeit(decode_full, steps),
+        "init": _timeit(init_step, steps),
+        "update": _timeit(update_step, steps),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="态势解码性能测试")
+    parser.add_argument("--full", type=Path, help="录制的 GetAllState 返回数据文件")
+    parser.add_argument("--update", type=Path, help="录制的 UpdateState 返回数据文件，默认与 --full 相同")
+    parser.add_argument("--units", type=int, default=5000, help="合成态势的对象数量")
+    parser.add_argument("--steps", type=int, default=10, help="每项测试的重复次数")
+    parser.add_argument("--backends", nargs="*", default=None, help="参与测试的后端，默认为全部可用后端")
+    args = parser.parse_args()
+
+    if args.full:
+        full_data = args.full.read_text(encoding="utf-8")
+        update_data = args.update.read_text(encoding="utf-8") if args.update else full_data
+    else:
+        full_data, update_data = synthesize(args.units)
+
+    print(f"全量数据 {len(full_data) / 1e6:.2f} MB，增量数据 {len(update_data) / 1e6:.2f} MB，重复 {args.steps} 次取中位数")
+    print(f"{'后端':<10}{'全量解码(ms)':>14}{'全量解码+应用(ms)':>20}{'增量解码+应用(ms)':>20}")
+    for backend in args.backends or available_backends():
+        result = bench_backend(backend, full_data, update_data, args.steps)
+        print(f"{backend:<10}{result['decode_full']:>14.1f}{result['init']:>20.1f}{result['update']:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+空间查询性能测试
+对比“每个本方单元查询一定半径内的目标”在逐一计算距离与使用 SpatialIndex 时的耗时
+"""
+
+import argparse
+import random
+import time
+
+from mozi_ai_x.utils.geo import get_horizontal_distance
+from mozi_ai_x.utils.spatial import SpatialIndex
+
+
+def random_positions(count: int, rng: random.Random, lat_range: tuple[float, float], lon_range: tuple[float, float]):
+    return {f"obj-{i}": (rng.uniform(*lat_range), rng.uniform(*lon_range)) for i in range(count)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="空间查询性能测试")
+    parser.add_argument("--units", type=int, default=2000, help="本方单元数量")
+    parser.add_argument("--contacts", type=int, default=2000, help="目标数量")
+    parser.add_argument("--radius", type=float, default=200, help="查询半径（km）")
+    parser.add_argument("--cell-size", type=float, default=1.0, help="网格大小（度）")
+    parser.add_argument(
+        "--area", type=float, nargs=4, default=(20, 45, 110, 140), help="分布范围：最小纬度 最大纬度 最小经度 最大经度"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    lat_range, lon_range = tuple(args.area[:2]), tuple(args.area[2:])
+    units = random_positions(args.units, rng, lat_range, lon_range)
+    contacts = random_positions(args.contacts, rng, lat_range, lon_range)
+
+    start = time.perf_counter()
+    brute = {
+        guid: [c for c, pos in contacts.items() if get_horizontal_distance(unit_pos, pos) <= args.radius]
+        for guid, unit_pos in units.items()
+    }
+    brute_cost = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = SpatialIndex(args.cell_size)
+    for guid, (lat, lon) in contacts.items():
+        index.update(guid, None, lat, lon)
+    build_cost = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = {guid: [c for _, c, _ in index.within_radius(*unit_pos, args.radius)] for guid, unit_pos in units.items()}
+    query_cost = time.perf_counter() - start
+
+    mismatched = sum(set(brute[guid]) != set(indexed[guid]) for guid in units)
+    hits = sum(map(len, indexed.values())) / max(len(units), 1)
+    print(f"{args.units} 个单元 × {args.contacts} 个目标，半径 {args.radius} km，平均每个单元 {hits:.1f} 个目标")
+    print(f"逐一计算: {brute_cost * 1000:.1f} ms")
+    print(f"空间索引: 构建 {build_cost * 1000:.1f} ms，查询 {query_cost * 1000:.1f} ms，加速 {brute_cost / query_cost:.1f}x")
+    if mismatched:
+        print(f"结果不一致的单元: {mismatched}")
+
+    # 最近邻查询
+    start = time.perf_counter()
+    for unit_pos in units.values():
+        index.nearest(*unit_pos, k=5)
+    print(f"最近 5 个目标: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
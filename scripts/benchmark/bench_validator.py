@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+参数校验装饰器性能测试
+校验 validate_uuid4_args/validate_literal_args 与原实现（每次调用解析签名、类型标注，构造 uuid.UUID）的结果一致，
+并对比每次调用的额外开销：原实现、当前实现、运行时关闭校验（set_validation_enabled(False)）与未装饰的函数。
+环境变量 MOZI_VALIDATION=0 时装饰器直接返回原函数，开销与未装饰的函数相同。
+"""
+
+import argparse
+import random
+import timeit
+import uuid
+from functools import wraps
+from inspect import signature
+from typing import Literal, get_type_hints
+
+from mozi_ai_x.utils.validator import (
+    _is_uuid4_string,
+    set_validation_enabled,
+    validate_literal_args,
+    validate_uuid4_args,
+)
+
+
+def reference_validate_literal_args(func):
+    """原实现"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        hints = get_type_hints(func)
+
+        sig = signature(func)
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        for name, value in bound.arguments.items():
+            typ = hints.get(name)
+            if typ is not None and getattr(typ, "__origin__", None) is Literal:
+                if value not in typ.__args__:
+                    raise ValueError(f"参数{name}={value!r} 不符合约束，期望值之一为 {typ.__args__}")
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def reference_validate_uuid4_args(param_names):
+    """原实现"""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            sig = signature(func)
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            for name in param_names:
+                value = bound.arguments.get(name)
+                if not (isinstance(value, str) and _is_uuid4_string(value)):
+                    raise ValueError(f"参数{name}={value!r} 不是合法的UUID4字符串")
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class Situation:
+    """模拟 CSituation.get_obj_by_guid、CSide.set_doctrine 等热点方法"""
+
+    def get_obj_by_guid(self, guid: str, default=None):
+        return default
+
+    def set_state(self, state: Literal["on", "off"], mode: Literal[1, 2, 3] = 1, note: str = ""):
+        return state
+
+
+def _decorate(uuid_decorator, literal_decorator) -> Situation:
+    obj = Situation()
+    obj.get_obj_by_guid = uuid_decorator(["guid"])(Situation.get_obj_by_guid).__get__(obj)
+    obj.set_state = literal_decorator(Situation.set_state).__get__(obj)
+    return obj
+
+
+def _outcome(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    except (ValueError, TypeError) as e:
+        return type(e)
+
+
+def check_parity(rng: random.Random) -> None:
+    """新旧实现对同一组参数的返回值和异常类型一致"""
+    guids = [str(uuid.uuid4()) for _ in range(200)]
+    guids += [guid.upper() for guid in guids[:20]] + [guid.replace("-", "") for guid in guids[:20]]
+    guids += ["{" + guids[0] + "}", "urn:uuid:" + guids[1], guids[2][:-1], guids[3] + "0", "", None, 123]
+    guids += [str(uuid.uuid1()), str(uuid.UUID(int=rng.getrandbits(128)))]
+    # 随机修改版本位、变体位和任意字符
+    for guid in guids[:100]:
+        chars = list(guid)
+        chars[rng.randrange(len(chars))] = rng.choice("0123456789abcdefxg-{ ")
+        guids.append("".join(chars))
+
+    new, old = (
+        _decorate(validate_uuid4_args, validate_literal_args),
+        _decorate(reference_validate_uuid4_args, reference_validate_literal_args),
+    )
+    for guid in guids:
+        for kwargs in ({}, {"default": 1}):
+            assert _outcome(new.get_obj_by_guid, guid, **kwargs) == _outcome(old.get_obj_by_guid, guid, **kwargs), guid
+            assert _outcome(new.get_obj_by_guid, guid=guid) == _outcome(old.get_obj_by_guid, guid=guid), guid
+    assert _outcome(new.get_obj_by_guid) == _outcome(old.get_obj_by_guid)
+    for state in ("on", "off", "bad", None):
+        for mode in (1, 3, 4, "1"):
+            for call in (
+                lambda o, state=state, mode=mode: o.set_state(state, mode),
+                lambda o, state=state, mode=mode: o.set_state(state=state, mode=mode),
+                lambda o, state=state: o.set_state(state),
+            ):
+                assert _outcome(call, new) == _outcome(call, old), (state, mode)
+    print(f"一致性校验通过（{len(guids)} 个 GUID 参数）")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="参数校验装饰器性能测试")
+    parser.add_argument("--number", type=int, default=200000, help="每项测试的调用次数")
+    args = parser.parse_args()
+
+    check_parity(random.Random(0))
+
+    guid = str(uuid.uuid4())
+    plain = Situation()
+    old = _decorate(reference_validate_uuid4_args, reference_validate_literal_args)
+    new = _decorate(validate_uuid4_args, validate_literal_args)
+
+    def per_call(func) -> float:
+        return min(timeit.repeat(func, number=args.number, repeat=3)) / args.number * 1e9
+
+    cases = {
+        "get_obj_by_guid(guid)": lambda obj: lambda: obj.get_obj_by_guid(guid),
+        "set_state('on', mode=2)": lambda obj: lambda: obj.set_state("on", mode=2),
+    }
+    for label, make in cases.items():
+        baseline = per_call(make(plain))
+        old_cost = per_call(make(old))
+        new_cost = per_call(make(new))
+        set_validation_enabled(False)
+        disabled_cost = per_call(make(new))
+        set_validation_enabled(True)
+        print(f"{label}:")
+        print(f"  未装饰   {baseline:8.0f} ns/次")
+        print(f"  原实现   {old_cost:8.0f} ns/次（额外 {old_cost - baseline:8.0f} ns）")
+        print(f"  当前实现 {new_cost:8.0f} ns/次（额外 {new_cost - baseline:8.0f} ns）")
+        print(f"  关闭校验 {disabled_cost:8.0f} ns/次（额外 {disabled_cost - baseline:8.0f} ns）")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,55 +6,87 @@ Provides asynchronous Python API for interacting with Mozi simulation platform.
 
 __version__ = "0.3.5"
 
-# Core service classes
-from .simulation.server import MoziServer, ServerResponse
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Distributed support
-from .simulation.server.distributed import MoziProxyServer, MoziProxyClient
+if TYPE_CHECKING:
+    from .simulation.server import MoziServer, ServerResponse
+    from .simulation.server.distributed import MoziProxyServer, MoziProxyClient
+    from .simulation.scenario import CScenario
+    from .simulation.situation import CSituation
+    from .simulation.side import CSide
+    from .simulation.active_unit import CActiveUnit, CAircraft, CShip, CSubmarine, CFacility, CSatellite, CGroup
+    from .simulation.mission import (
+        CPatrolMission,
+        CStrikeMission,
+        CSupportMission,
+        CCargoMission,
+        CFerryMission,
+        CMiningMission,
+        CMineClearingMission,
+    )
+    from .simulation.zone import CNoNavZone, CExclusionZone
+    from .simulation.reference_point import CReferencePoint
+    from .simulation.contact import CContact
+    from .simulation.doctrine import CDoctrine
+    from .simulation.weather import CWeather
 
-# Scenario and situation
-from .simulation.scenario import CScenario
-from .simulation.situation import CSituation
-
-# Side
-from .simulation.side import CSide
-
-# Active units
-from .simulation.active_unit import (
-    CActiveUnit,
-    CAircraft,
-    CShip,
-    CSubmarine,
-    CFacility,
-    CSatellite,
-    CGroup,
-)
-
-# Missions
-from .simulation.mission import (
-    CPatrolMission,
-    CStrikeMission,
-    CSupportMission,
-    CCargoMission,
-    CFerryMission,
-    CMiningMission,
-    CMineClearingMission,
-)
+# 导出名称 -> 所在模块，首次访问时才导入，只导入 mozi_ai_x 不会加载 simulation 及其依赖（grpclib、numpy 等）
+_LAZY_ATTRS = {
+    # Core service classes
+    "MoziServer": ".simulation.server",
+    "ServerResponse": ".simulation.server",
+    # Distributed support
+    "MoziProxyServer": ".simulation.server.distributed",
+    "MoziProxyClient": ".simulation.server.distributed",
+    # Scenario and situation
+    "CScenario": ".simulation.scenario",
+    "CSituation": ".simulation.situation",
+    # Side
+    "CSide": ".simulation.side",
+    # Active units
+    "CActiveUnit": ".simulation.active_unit",
+    "CAircraft": ".simulation.active_unit",
+    "CShip": ".simulation.active_unit",
+    "CSubmarine": ".simulation.active_unit",
+    "CFacility": ".simulation.active_unit",
+    "CSatellite": ".simulation.active_unit",
+    "CGroup": ".simulation.active_unit",
+    # Missions
+    "CPatrolMission": ".simulation.mission",
+    "CStrikeMission": ".simulation.mission",
+    "CSupportMission": ".simulation.mission",
+    "CCargoMission": ".simulation.mission",
+    "CFerryMission": ".simulation.mission",
+    "CMiningMission": ".simulation.mission",
+    "CMineClearingMission": ".simulation.mission",
+    # Zones
+    "CNoNavZone": ".simulation.zone",
+    "CExclusionZone": ".simulation.zone",
+    # Reference point
+    "CReferencePoint": ".simulation.reference_point",
+    # Contact
+    "CContact": ".simulation.contact",
+    # Doctrine
+    "CDoctrine": ".simulation.doctrine",
+    # Weather
+    "CWeather": ".simulation.weather",
+}
 
-# Zones
-from .simulation.zone import CNoNavZone, CExclusionZone
 
-# Reference point
-from .simulation.reference_point import CReferencePoint
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # 缓存到模块命名空间，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
 
-# Contact
-from .simulation.contact import CContact
 
-# Doctrine
-from .simulation.doctrine import CDoctrine
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Weather
-from .simulation.weather import CWeather
 
 __all__ = [
     # Version
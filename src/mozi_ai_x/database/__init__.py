@@ -1,4 +1,13 @@
-from .database import default_db, ModelDatabase
+from typing import Any
 
+from .database import AsyncModelDatabase, ModelDatabase, get_default_db, set_default_db
 
-__all__ = ["default_db", "ModelDatabase"]
+
+def __getattr__(name: str) -> Any:
+    # default_db 在首次访问时创建，见 get_default_db
+    if name == "default_db":
+        return get_default_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["default_db", "get_default_db", "set_default_db", "AsyncModelDatabase", "ModelDatabase"]
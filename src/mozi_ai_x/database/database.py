@@ -1,17 +1,36 @@
 import os
+import asyncio
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
 from enum import Enum
 from pathlib import Path
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Any, cast, LiteralString
+from typing import Any, TypeVar, cast, LiteralString
 
 # 常量定义
 NM2KM = 1.852  # 海里转千米
 FEET2M = 0.3048  # 英尺转米
 WEAPONS_ASSIST = {1001, 2005, 2006, 2007, 2008, 3001, 3002, 3003, 3004, 4003, 4101, 6001, 7001, 9001, 9002, 9003}
 
+# 可查询模型信息的类别，对应 data{类别} 表
+MODEL_CATEGORIES = ("aircraft", "facility", "weapon")
+# dataweapon 表中 WeaponInfo 使用的列，顺序与 WeaponInfo.from_db_row 一致
+WEAPON_COLUMNS = (
+    "ID, Name, Type, AirRangeMin, AirRangeMax, LandRangeMin, LandRangeMax, "
+    "LaunchSpeedMax, LaunchSpeedMin, LaunchAltitudeMin_ASL, LaunchAltitudeMax_ASL, "
+    "TargetSpeedMax, TargetSpeedMin, TargetAltitudeMax, TargetAltitudeMin"
+)
+# 查询结果缓存的默认容量（每类缓存的条目数）
+DEFAULT_CACHE_SIZE = 4096
+
+_MISSING = object()
+_T = TypeVar("_T")
+
 
 class DBType(str, Enum):
     """数据库类型枚举"""
@@ -31,6 +50,10 @@ class DBConfig:
     database: str
     username: str
     password: str
+    # MySQL/PostgreSQL 连接池的连接数上限
+    pool_size: int = 4
+    # SQLite 以只读、immutable 方式打开数据库文件
+    read_only: bool = True
 
     @classmethod
     def from_env(cls) -> "DBConfig":
@@ -42,6 +65,8 @@ class DBConfig:
             database=os.environ.get("MOZI_DB_NAME", str(Path("./data/modeldata.db").absolute())),
             username=os.environ.get("MOZI_DB_USER", "root"),
             password=os.environ.get("MOZI_DB_PASSWORD", ""),
+            pool_size=int(os.environ.get("MOZI_DB_POOL_SIZE", "4")),
+            read_only=os.environ.get("MOZI_DB_READ_ONLY", "1") not in ("0", "false", "False"),
         )
 
 
@@ -98,6 +123,11 @@ class ModelInfo:
 class DatabaseBackend(ABC):
     """数据库后端抽象基类"""
 
+    # 查询参数占位符
+    placeholder = "?"
+    # 单条查询的参数数量上限，批量查询超过时分批执行
+    max_params = 900
+
     def __init__(self, config: DBConfig):
         self.config = config
 
@@ -117,126 +147,258 @@ class DatabaseBackend(ABC):
         pass
 
 
+class QueryResult:
+    """已读取全部行的查询结果，连接池后端在归还连接前读取结果，提供与游标相同的 fetchone/fetchall"""
+
+    def __init__(self, rows: list[tuple]):
+        self._rows = rows
+        self._index = 0
+
+    def fetchone(self) -> tuple | None:
+        if self._index >= len(self._rows):
+            return None
+        row = self._rows[self._index]
+        self._index += 1
+        return row
+
+    def fetchall(self) -> list[tuple]:
+        rows = self._rows[self._index :]
+        self._index = len(self._rows)
+        return rows
+
+
 class SQLiteBackend(DatabaseBackend):
-    """SQLite数据库后端实现"""
+    """
+    SQLite数据库后端实现
+
+    每个线程使用各自的连接，各线程可同时查询。config.read_only 为 True 时以只读、immutable 方式打开数据库文件，
+    SQLite 不再为并发读取加锁和检查文件变化（推演期间模型数据库文件不应被修改）。
+    """
 
     def __init__(self, config: DBConfig):
         super().__init__(config)
-        self._conn: sqlite3.Connection | None = None
-        self._cursor: sqlite3.Cursor | None = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []  # 全部线程的连接，用于 disconnect
+        self._generation = 0  # disconnect 后递增，各线程据此重新建立连接
 
     def connect(self) -> sqlite3.Connection:
-        if not self._conn:
-            self._conn = sqlite3.connect(self.config.database)
-            self._cursor = self._conn.cursor()
-        return self._conn
+        """获取当前线程的连接，不存在时建立"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.generation == self._generation:
+            return conn
+        if self.config.read_only:
+            uri = f"{Path(self.config.database).absolute().as_uri()}?mode=ro&immutable=1"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.config.database, check_same_thread=False)
+        with self._lock:
+            self._connections.append(conn)
+            self._local.generation = self._generation
+        self._local.conn = conn
+        return conn
 
     def disconnect(self) -> None:
-        if self._cursor:
-            self._cursor.close()
-        if self._conn:
-            self._conn.close()
-            self._conn = None
-            self._cursor = None
+        """关闭全部线程的连接，之后的查询重新建立连接"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            conn.close()
+        self._local.conn = None
 
     def execute_query(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
-        if not self._cursor:
-            self.connect()
-        assert self._cursor is not None  # 帮助类型检查器理解
-        return self._cursor.execute(query, params)
+        return self.connect().execute(query, params)
 
 
 # 可选数据库后端
 
 
-class MySQLBackend(DatabaseBackend):
+class _PooledBackend(DatabaseBackend):
+    """
+    连接池后端基类
+
+    最多建立 config.pool_size 个连接，每次查询从池中取出一个空闲连接，读取全部结果后归还，
+    连接都在使用中时等待其他查询归还。查询出错的连接会被关闭并从池中移除。
+    """
+
+    def __init__(self, config: DBConfig):
+        super().__init__(config)
+        self._idle: list[Any] = []  # 空闲连接，后进先出
+        self._cond = threading.Condition()
+        self._size = 0  # 已建立且未关闭（空闲 + 使用中）的连接数，包括 disconnect 前取出的连接
+        self._generation = 0  # disconnect 后递增，之前取出的连接归还时关闭
+
+    @abstractmethod
+    def _open(self) -> Any:
+        """建立一个新连接"""
+
+    @abstractmethod
+    def _execute(self, conn: Any, query: str, params: tuple) -> list[tuple]:
+        """在连接上执行查询并读取全部结果"""
+
+    def connect(self) -> Any:
+        """预先建立一个连接（检查数据库是否可用），返回该连接，调用方不应在池外使用"""
+        conn, generation = self._acquire()
+        self._release(conn, generation)
+        return conn
+
+    def disconnect(self) -> None:
+        """关闭空闲连接，使用中的连接在查询结束后关闭"""
+        with self._cond:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            conn.close()
+
+    def execute_query(self, query: str, params: tuple = ()) -> QueryResult:
+        conn, generation = self._acquire()
+        try:
+            rows = self._execute(conn, query, params)
+        except Exception:
+            self._discard(conn)
+            raise
+        self._release(conn, generation)
+        return QueryResult(rows)
+
+    def _acquire(self) -> tuple[Any, int]:
+        with self._cond:
+            # 没有空闲连接且已达上限时，等待其他查询归还或关闭连接
+            while not self._idle and self._size >= max(self.config.pool_size, 1):
+                self._cond.wait()
+            generation = self._generation
+            if self._idle:
+                return self._idle.pop(), generation
+            self._size += 1
+        try:
+            return self._open(), generation
+        except Exception:
+            self._closed()
+            raise
+
+    def _release(self, conn: Any, generation: int) -> None:
+        with self._cond:
+            if generation == self._generation:
+                self._idle.append(conn)
+                self._cond.notify()
+                return
+        # disconnect 之前取出的连接
+        self._closed()
+        conn.close()
+
+    def _discard(self, conn: Any) -> None:
+        self._closed()
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _closed(self) -> None:
+        """一个连接被关闭（或建立失败），唤醒一个等待的查询"""
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+
+class MySQLBackend(_PooledBackend):
     """MySQL数据库后端实现"""
 
+    placeholder = "%s"
+    max_params = 10000
+
     def __init__(self, config: DBConfig):
         try:
             import mysql.connector  # noqa: F401
         except ImportError as e:
             raise ImportError("MySQL support requires mysql-connector-python package") from e
         super().__init__(config)
-        self._conn = None
-        self._cursor = None
 
-    def connect(self) -> Any:
-        try:
-            import mysql.connector as mysql_db
-        except ImportError as e:
-            raise ImportError("MySQL support requires mysql-connector-python package") from e
-        if not self._conn:
-            self._conn = mysql_db.connect(
-                host=self.config.host,
-                port=self.config.port,
-                database=self.config.database,
-                user=self.config.username,
-                password=self.config.password,
-            )
-            self._cursor = self._conn.cursor()
-        return self._conn
+    def _open(self) -> Any:
+        import mysql.connector as mysql_db
 
-    def disconnect(self) -> None:
-        if self._cursor:
-            self._cursor.close()
-        if self._conn:
-            self._conn.close()
-            self._conn = None
-            self._cursor = None
+        return mysql_db.connect(
+            host=self.config.host,
+            port=self.config.port,
+            database=self.config.database,
+            user=self.config.username,
+            password=self.config.password,
+            autocommit=True,
+        )
 
-    def execute_query(self, query: str, params: tuple = ()) -> Any:
-        if not self._cursor:
-            self.connect()
-        assert self._cursor is not None
-        return self._cursor.execute(query, params)
+    def _execute(self, conn: Any, query: str, params: tuple) -> list[tuple]:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
 
 
-class PostgreSQLBackend(DatabaseBackend):
+class PostgreSQLBackend(_PooledBackend):
     """PostgreSQL数据库后端实现"""
 
+    placeholder = "%s"
+    max_params = 10000
+
     def __init__(self, config: DBConfig):
         try:
             import psycopg  # noqa: F401
         except ImportError as e:
             raise ImportError("PostgreSQL support requires psycopg package") from e
         super().__init__(config)
-        self._conn = None
-        self._cursor = None
 
-    def connect(self) -> Any:
-        try:
-            from psycopg.connection import Connection  # noqa: F401
-        except ImportError as e:
-            raise ImportError("PostgreSQL support requires psycopg package") from e
-        if not self._conn:
-            self._conn = Connection.connect(
-                host=self.config.host,
-                port=self.config.port,
-                database=self.config.database,
-                user=self.config.username,
-                password=self.config.password,
-            )
-            self._cursor = self._conn.cursor()
-        return self._conn
+    def _open(self) -> Any:
+        from psycopg.connection import Connection
 
-    def disconnect(self) -> None:
-        if self._cursor:
-            self._cursor.close()
-        if self._conn:
-            self._conn.close()
-            self._conn = None
-            self._cursor = None
+        return Connection.connect(
+            host=self.config.host,
+            port=self.config.port,
+            database=self.config.database,
+            user=self.config.username,
+            password=self.config.password,
+            autocommit=True,
+        )
 
-    def execute_query(self, query: str, params: tuple = ()) -> Any:
-        try:
-            from psycopg.sql import SQL
-        except ImportError as e:
-            raise ImportError("PostgreSQL support requires psycopg package") from e
-        if not self._cursor:
-            self.connect()
-        assert self._cursor is not None
-        return self._cursor.execute(SQL(cast(LiteralString, query)), params)
+    def _execute(self, conn: Any, query: str, params: tuple) -> list[tuple]:
+        from psycopg.sql import SQL
+
+        with conn.cursor() as cursor:
+            cursor.execute(SQL(cast(LiteralString, query)), params)
+            return cursor.fetchall()
+
+
+class _LRUCache:
+    """有界 LRU 缓存，maxsize 为 None 时不限制条目数，为 0 时不缓存"""
+
+    def __init__(self, maxsize: int | None):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Any) -> Any:
+        """获取缓存值并标记为最近使用，不存在时返回 _MISSING"""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is not _MISSING:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
 
 
 def create_backend(config: DBConfig) -> DatabaseBackend:
@@ -251,17 +413,46 @@ def create_backend(config: DBConfig) -> DatabaseBackend:
 
 
 class ModelDatabase:
-    """模型数据库管理类"""
+    """
+    模型数据库管理类
+
+    推演期间模型数据库只读，查询结果（包括不存在的 ID）按表缓存，重复查询同一 ID 只需一次字典查找：
+
+    - 默认使用容量为 cache_size 的 LRU 缓存，cache_size 为 None 时不限制容量，为 0 时不缓存
+    - preload 为 True 时，首次查询某个表时将整表读入内存，之后该表的查询不再访问数据库；
+      也可以调用 preload_tables 在启动时预先加载
+    - 命中情况见 cache_stats，hits 为命中缓存的 ID 数，misses 为从数据库读取的 ID 数，queries 为执行的查询数
 
-    def __init__(self, backend: DatabaseBackend):
+    批量查询（get_weapon_infos、get_model_infos 等）对未缓存的 ID 只执行一条 WHERE ID IN (...) 查询
+    （ID 数量超过后端参数上限时分批）。
+    """
+
+    def __init__(self, backend: DatabaseBackend, cache_size: int | None = DEFAULT_CACHE_SIZE, preload: bool = False):
+        """
+        Args:
+            backend: 数据库后端
+            cache_size: 每个表的 LRU 缓存容量，None 表示不限制，0 表示不缓存
+            preload: 是否在首次查询某个表时将整表读入内存
+        """
         self.backend = backend
+        self.preload = preload
+        # 武器 ID -> dataweapon 行（WEAPON_COLUMNS 各列），名称、类型、射程等查询共用
+        self._weapon_rows = _LRUCache(cache_size)
+        # (类别, ID) -> (名称, 类型)
+        self._model_rows = _LRUCache(cache_size)
+        # 已整表加载的类别 -> {ID: 行}，weapon 的行为 WEAPON_COLUMNS 各列，其他类别为 (名称, 类型)
+        self._tables: dict[str, dict[int, tuple]] = {}
+        # 整表加载时持有，多个线程首次查询同一个表时只加载一次
+        self._table_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.cache_stats = {"hits": 0, "misses": 0, "queries": 0}
 
     @classmethod
-    def from_env(cls) -> "ModelDatabase":
+    def from_env(cls, cache_size: int | None = DEFAULT_CACHE_SIZE, preload: bool = False) -> "ModelDatabase":
         """从环境变量创建数据库实例"""
         config = DBConfig.from_env()
         backend = create_backend(config)
-        return cls(backend)
+        return cls(backend, cache_size=cache_size, preload=preload)
 
     @contextmanager
     def connection(self):
@@ -272,28 +463,149 @@ class ModelDatabase:
         finally:
             self.backend.disconnect()
 
+    def preload_tables(self, categories: Iterable[str] = MODEL_CATEGORIES) -> None:
+        """
+        将模型表整表读入内存，之后这些表的查询不再访问数据库
+
+        Args:
+            categories: 模型类别，见 MODEL_CATEGORIES
+
+        Raises:
+            ValueError: 未知的模型类别
+        """
+        for category in categories:
+            if category not in MODEL_CATEGORIES:
+                raise ValueError(f"未知的模型类别: {category}，可选值为 {MODEL_CATEGORIES}")
+            with self._table_lock:
+                self._load_table(category)
+
+    def clear_cache(self) -> None:
+        """清空查询缓存、已整表加载的表和命中统计（如切换数据库文件后）"""
+        self._weapon_rows.clear()
+        self._model_rows.clear()
+        with self._table_lock:
+            self._tables.clear()
+        with self._stats_lock:
+            self.cache_stats = {"hits": 0, "misses": 0, "queries": 0}
+
+    def _count(self, hits: int = 0, misses: int = 0, queries: int = 0) -> None:
+        """更新命中统计，各线程的查询同时更新时不丢失计数"""
+        with self._stats_lock:
+            stats = self.cache_stats
+            stats["hits"] += hits
+            stats["misses"] += misses
+            stats["queries"] += queries
+
+    def _load_table(self, category: str) -> dict[int, tuple]:
+        """整表读取一个模型表，调用方需持有 _table_lock"""
+        self._count(queries=1)
+        if category == "weapon":
+            rows = self.backend.execute_query(f"SELECT {WEAPON_COLUMNS} FROM dataweapon").fetchall()
+            table = {row[0]: tuple(row) for row in rows}
+        else:
+            rows = self.backend.execute_query(f"SELECT ID, Name, Type FROM data{category}").fetchall()
+            table = {row[0]: (row[1], row[2]) for row in rows}
+        self._tables[category] = table
+        return table
+
+    def _get_table(self, category: str) -> dict[int, tuple] | None:
+        """获取已整表加载的表，preload 为 True 时在首次访问时加载"""
+        table = self._tables.get(category)
+        if table is None and self.preload:
+            with self._table_lock:
+                # 等待锁期间其他线程可能已加载
+                table = self._tables.get(category)
+                if table is None:
+                    table = self._load_table(category)
+        return table
+
+    def _get_weapon_row(self, weapon_id: int) -> tuple | None:
+        """获取 dataweapon 中的一行（WEAPON_COLUMNS 各列），不存在时为 None"""
+        table = self._get_table("weapon")
+        if table is not None:
+            self._count(hits=1)
+            return table.get(weapon_id)
+        row = self._weapon_rows.get(weapon_id)
+        if row is not _MISSING:
+            self._count(hits=1)
+            return row
+        self._count(misses=1, queries=1)
+        query = f"SELECT {WEAPON_COLUMNS} FROM dataweapon WHERE ID = {self.backend.placeholder}"
+        row = self.backend.execute_query(query, (weapon_id,)).fetchone()
+        row = tuple(row) if row else None
+        self._weapon_rows.put(weapon_id, row)
+        return row
+
+    def _get_weapon_rows(self, weapon_ids: Iterable[int]) -> dict[int, tuple | None]:
+        """批量获取 dataweapon 中的行，未缓存的 ID 一次查询"""
+        ids = list(dict.fromkeys(weapon_ids))
+        table = self._get_table("weapon")
+        if table is not None:
+            self._count(hits=len(ids))
+            return {weapon_id: table.get(weapon_id) for weapon_id in ids}
+
+        rows = {weapon_id: self._weapon_rows.get(weapon_id) for weapon_id in ids}
+        missing = [weapon_id for weapon_id, row in rows.items() if row is _MISSING]
+        self._count(hits=len(ids) - len(missing), misses=len(missing))
+        if missing:
+            fetched = {row[0]: tuple(row) for row in self._select_in(f"SELECT {WEAPON_COLUMNS} FROM dataweapon", missing)}
+            for weapon_id in missing:
+                rows[weapon_id] = fetched.get(weapon_id)
+                self._weapon_rows.put(weapon_id, rows[weapon_id])
+        return rows
+
+    def _select_in(self, query: str, ids: list[int]) -> list[tuple]:
+        """执行 query WHERE ID IN (...)，ID 数量超过后端参数上限时分批执行"""
+        backend = self.backend
+        rows = []
+        for start in range(0, len(ids), backend.max_params):
+            chunk = ids[start : start + backend.max_params]
+            placeholders = ", ".join([backend.placeholder] * len(chunk))
+            self._count(queries=1)
+            rows += backend.execute_query(f"{query} WHERE ID IN ({placeholders})", tuple(chunk)).fetchall()
+        return rows
+
     def get_weapon_info(self, weapon_id: int) -> WeaponInfo | None:
         """获取武器信息"""
-        query = """
-            SELECT ID, Name, Type, AirRangeMin, AirRangeMax, LandRangeMin, LandRangeMax,
-                   LaunchSpeedMax, LaunchSpeedMin, LaunchAltitudeMin_ASL, LaunchAltitudeMax_ASL,
-                   TargetSpeedMax, TargetSpeedMin, TargetAltitudeMax, TargetAltitudeMin
-            FROM dataweapon WHERE ID = ?
-        """
-        result = self.backend.execute_query(query, (weapon_id,)).fetchone()
-        return WeaponInfo.from_db_row(result) if result else None
+        row = self._get_weapon_row(weapon_id)
+        return WeaponInfo.from_db_row(row) if row else None
 
     def get_weapon_name_type(self, weapon_id: int) -> tuple[str, int]:
         """获取武器名称和类型"""
-        query = "SELECT Name, Type FROM dataweapon WHERE ID = ?"
-        result = self.backend.execute_query(query, (weapon_id,)).fetchone()
-        return (result[0], result[1]) if result else ("", 0)
+        row = self._get_weapon_row(weapon_id)
+        return (row[1], row[2]) if row else ("", 0)
 
     def get_weapon_type(self, weapon_id: int) -> int:
         """获取武器类型"""
-        query = "SELECT Type FROM dataweapon WHERE ID = ?"
-        result = self.backend.execute_query(query, (weapon_id,)).fetchone()
-        return result[0] if result else 0
+        row = self._get_weapon_row(weapon_id)
+        return row[2] if row else 0
+
+    def get_weapon_infos(self, weapon_ids: Iterable[int]) -> dict[int, WeaponInfo | None]:
+        """
+        批量获取武器信息
+
+        Args:
+            weapon_ids: 武器 ID
+
+        Returns:
+            dict[int, WeaponInfo | None]: {武器 ID: 武器信息}，不存在的武器为 None
+        """
+        return {
+            weapon_id: WeaponInfo.from_db_row(row) if row else None
+            for weapon_id, row in self._get_weapon_rows(weapon_ids).items()
+        }
+
+    def get_weapon_name_types(self, weapon_ids: Iterable[int]) -> dict[int, tuple[str, int]]:
+        """
+        批量获取武器名称和类型
+
+        Args:
+            weapon_ids: 武器 ID
+
+        Returns:
+            dict[int, tuple[str, int]]: {武器 ID: (名称, 类型)}，不存在的武器为 ("", 0)
+        """
+        return {weapon_id: (row[1], row[2]) if row else ("", 0) for weapon_id, row in self._get_weapon_rows(weapon_ids).items()}
 
     def check_weapon_attack(self, weapon_id: int) -> bool:
         """检查武器是否可以攻击"""
@@ -302,13 +614,166 @@ class ModelDatabase:
 
     def get_model_info(self, category: str, db_id: int) -> ModelInfo | None:
         """获取模型信息"""
-        if category not in {"aircraft", "facility", "weapon"}:
+        if category not in MODEL_CATEGORIES:
             return None
-
-        query = f"SELECT Name, Type FROM data{category} WHERE ID = ?"
-        result = self.backend.execute_query(query, (db_id,)).fetchone()
+        if category == "weapon":
+            row = self._get_weapon_row(db_id)
+            return ModelInfo(name=row[1], type=row[2]) if row else None
+
+        table = self._get_table(category)
+        if table is not None:
+            self._count(hits=1)
+            result = table.get(db_id)
+        else:
+            key = (category, db_id)
+            result = self._model_rows.get(key)
+            if result is not _MISSING:
+                self._count(hits=1)
+            else:
+                self._count(misses=1, queries=1)
+                query = f"SELECT Name, Type FROM data{category} WHERE ID = {self.backend.placeholder}"
+                row = self.backend.execute_query(query, (db_id,)).fetchone()
+                result = (row[0], row[1]) if row else None
+                self._model_rows.put(key, result)
         return ModelInfo(name=result[0], type=result[1]) if result else None
 
+    def get_model_infos(self, category: str, db_ids: Iterable[int]) -> dict[int, ModelInfo | None]:
+        """
+        批量获取模型信息
+
+        Args:
+            category: 模型类别，见 MODEL_CATEGORIES
+            db_ids: 数据库 ID
+
+        Returns:
+            dict[int, ModelInfo | None]: {数据库 ID: 模型信息}，不存在的模型及未知类别为 None
+        """
+        if category not in MODEL_CATEGORIES:
+            return dict.fromkeys(db_ids)
+        if category == "weapon":
+            rows = self._get_weapon_rows(db_ids)
+            return {db_id: ModelInfo(name=row[1], type=row[2]) if row else None for db_id, row in rows.items()}
+
+        ids = list(dict.fromkeys(db_ids))
+        table = self._get_table(category)
+        if table is not None:
+            self._count(hits=len(ids))
+            results = {db_id: table.get(db_id) for db_id in ids}
+        else:
+            results = {db_id: self._model_rows.get((category, db_id)) for db_id in ids}
+            missing = [db_id for db_id, result in results.items() if result is _MISSING]
+            self._count(hits=len(ids) - len(missing), misses=len(missing))
+            if missing:
+                fetched = {
+                    row[0]: (row[1], row[2]) for row in self._select_in(f"SELECT ID, Name, Type FROM data{category}", missing)
+                }
+                for db_id in missing:
+                    results[db_id] = fetched.get(db_id)
+                    self._model_rows.put((category, db_id), results[db_id])
+        return {db_id: ModelInfo(name=result[0], type=result[1]) if result else None for db_id, result in results.items()}
+
+
+class AsyncModelDatabase:
+    """
+    ModelDatabase 的异步封装
+
+    查询在线程池中执行，不阻塞驱动 MoziServer 的事件循环。后端支持多线程同时查询（SQLite 每个线程一个连接，
+    MySQL/PostgreSQL 使用连接池），多个协程的查询可以并行执行。
+
+    示例
+    ```python
+    db = AsyncModelDatabase(ModelDatabase.from_env())
+    weapons = await db.get_weapon_infos(weapon_ids)
+    ```
+    """
+
+    def __init__(self, db: ModelDatabase, executor: Executor | None = None):
+        """
+        Args:
+            db: 模型数据库
+            executor: 执行查询的线程池，None 表示使用事件循环的默认线程池
+        """
+        self.db = db
+        self.executor = executor
+
+    async def _run(self, func: Callable[..., _T], *args: Any) -> _T:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def preload_tables(self, categories: Iterable[str] = MODEL_CATEGORIES) -> None:
+        """见 ModelDatabase.preload_tables"""
+        await self._run(self.db.preload_tables, tuple(categories))
+
+    async def get_weapon_info(self, weapon_id: int) -> WeaponInfo | None:
+        """获取武器信息"""
+        return await self._run(self.db.get_weapon_info, weapon_id)
+
+    async def get_weapon_name_type(self, weapon_id: int) -> tuple[str, int]:
+        """获取武器名称和类型"""
+        return await self._run(self.db.get_weapon_name_type, weapon_id)
+
+    async def get_weapon_type(self, weapon_id: int) -> int:
+        """获取武器类型"""
+        return await self._run(self.db.get_weapon_type, weapon_id)
+
+    async def check_weapon_attack(self, weapon_id: int) -> bool:
+        """检查武器是否可以攻击"""
+        return await self._run(self.db.check_weapon_attack, weapon_id)
+
+    async def get_model_info(self, category: str, db_id: int) -> ModelInfo | None:
+        """获取模型信息"""
+        return await self._run(self.db.get_model_info, category, db_id)
+
+    async def get_weapon_infos(self, weapon_ids: Iterable[int]) -> dict[int, WeaponInfo | None]:
+        """批量获取武器信息"""
+        return await self._run(self.db.get_weapon_infos, list(weapon_ids))
+
+    async def get_weapon_name_types(self, weapon_ids: Iterable[int]) -> dict[int, tuple[str, int]]:
+        """批量获取武器名称和类型"""
+        return await self._run(self.db.get_weapon_name_types, list(weapon_ids))
+
+    async def get_model_infos(self, category: str, db_ids: Iterable[int]) -> dict[int, ModelInfo | None]:
+        """批量获取模型信息"""
+        return await self._run(self.db.get_model_infos, category, list(db_ids))
+
+
+# 默认数据库实例，首次使用时按环境变量创建
+_default_db: ModelDatabase | None = None
+_default_db_lock = threading.Lock()
+
+
+def get_default_db() -> ModelDatabase:
+    """
+    获取默认数据库实例
+
+    首次调用时按环境变量（见 DBConfig.from_env）创建，之后返回同一实例；可以用 set_default_db 替换。
+
+    Returns:
+        ModelDatabase: 默认数据库实例
+    """
+    global _default_db
+    db = _default_db
+    if db is None:
+        with _default_db_lock:
+            if _default_db is None:
+                _default_db = ModelDatabase.from_env()
+            db = _default_db
+    return db
+
+
+def set_default_db(db: ModelDatabase | None) -> None:
+    """
+    设置默认数据库实例，如已预加载模型表的实例，或使用其他配置的实例
+
+    Args:
+        db: 数据库实例，None 表示下次使用时重新按环境变量创建
+    """
+    global _default_db
+    with _default_db_lock:
+        _default_db = db
+
 
-# 默认数据库实例
-default_db = ModelDatabase.from_env()
+def __getattr__(name: str) -> Any:
+    # 兼容原模块级变量 default_db
+    if name == "default_db":
+        return get_default_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ..server import MoziServer
@@ -9,6 +9,152 @@ from ...utils.log import mprint_with_name
 
 mprint = mprint_with_name("Base")
 
+# 属性此前不存在时记录的旧值
+MISSING = object()
+
+
+def _is_descriptor(cls: type, attr: str) -> bool:
+    """属性在类中是否定义为 property 等数据描述符"""
+    for klass in cls.__mro__:
+        if attr in klass.__dict__:
+            return hasattr(klass.__dict__[attr], "__set__")
+    return False
+
+
+class VarMapParser:
+    """
+    由 var_map 编译得到的解析器
+
+    解析时只遍历 JSON 数据中实际出现的键，增量更新只修改了 5 个字段时只做 5 次赋值，
+    而不是对 var_map 中的上百个键逐一判断。普通属性直接写入实例 __dict__，
+    定义为 property 等描述符的属性仍通过 setattr 赋值。
+    """
+
+    def __init__(self, cls: type, var_map: dict[str, str]):
+        self.var_map = var_map
+        # JSON 键 -> 可以直接写入 __dict__ 的属性名
+        self.plain_fields: dict[str, str] = {}
+        # JSON 键 -> 需要通过 setattr 赋值的属性名
+        self.setattr_fields: dict[str, str] = {}
+        # 多个键映射到同一属性时，按 var_map 顺序最后处理，保证后出现的键优先
+        self.ordered_fields: list[tuple[str, str]] = []
+
+        attr_count: dict[str, int] = {}
+        for attr in var_map.values():
+            attr_count[attr] = attr_count.get(attr, 0) + 1
+        for key, attr in var_map.items():
+            if attr_count[attr] > 1:
+                self.ordered_fields.append((key, attr))
+            elif _is_descriptor(cls, attr):
+                self.setattr_fields[key] = attr
+            else:
+                self.plain_fields[key] = attr
+        # 所有属性都可以直接写入 __dict__
+        self.all_plain = not self.setattr_fields and not self.ordered_fields
+
+    def parse(self, obj: "BaseObject", json_data: dict, changes: dict[str, tuple[Any, Any]] | None = None):
+        """
+        将 JSON 数据中出现的字段赋给对象属性
+
+        Args:
+            obj: 目标对象
+            json_data: JSON 数据
+            changes: 传入时记录取值发生变化的属性，{属性名: (旧值, 新值)}
+        """
+        if changes is not None:
+            self._parse_tracked(obj, json_data, changes)
+            return
+
+        plain_fields = self.plain_fields
+        setattr_fields = self.setattr_fields
+        obj_dict = obj.__dict__
+        for key, value in json_data.items():
+            attr = plain_fields.get(key)
+            if attr is not None:
+                obj_dict[attr] = value
+            elif key in setattr_fields:
+                self._setattr(obj, key, setattr_fields[key], value)
+
+        for key, attr in self.ordered_fields:
+            if key in json_data:
+                self._setattr(obj, key, attr, json_data[key])
+
+    def _parse_tracked(self, obj: "BaseObject", json_data: dict, changes: dict[str, tuple[Any, Any]]):
+        plain_fields = self.plain_fields
+        setattr_fields = self.setattr_fields
+        obj_dict = obj.__dict__
+        for key, value in json_data.items():
+            attr = plain_fields.get(key)
+            if attr is not None:
+                old = obj_dict.get(attr, MISSING)
+                obj_dict[attr] = value
+            elif key in setattr_fields:
+                attr = setattr_fields[key]
+                old = getattr(obj, attr, MISSING)
+                if not self._setattr(obj, key, attr, value):
+                    continue
+            else:
+                continue
+            if old is not value and old != value:
+                record_change(changes, attr, old, value)
+
+        for key, attr in self.ordered_fields:
+            if key in json_data:
+                value = json_data[key]
+                old = getattr(obj, attr, MISSING)
+                if self._setattr(obj, key, attr, value) and old is not value and old != value:
+                    record_change(changes, attr, old, value)
+
+    @staticmethod
+    def _setattr(obj: "BaseObject", key: str, attr: str, value) -> bool:
+        try:
+            setattr(obj, attr, value)
+            return True
+        except Exception as e:
+            mprint.error(f"parse {obj.class_name} {key} error: {e}")
+            return False
+
+
+def record_change(changes: dict[str, tuple[Any, Any]], attr: str, old: Any, new: Any):
+    """
+    记录一次属性变化，同一属性多次变化时保留最早的旧值，恢复原值时移除记录
+
+    Args:
+        changes: 变化记录，{属性名: (旧值, 新值)}
+        attr: 属性名
+        old: 旧值
+        new: 新值
+    """
+    if attr in changes:
+        old = changes[attr][0]
+        if old is new or old == new:
+            del changes[attr]
+            return
+    changes[attr] = (old, new)
+
+
+# (类, id(var_map)) -> 编译后的解析器
+_parsers: dict[tuple[type, int], VarMapParser] = {}
+
+
+def get_var_map_parser(cls: type, var_map: dict[str, str]) -> VarMapParser:
+    """
+    获取类与 var_map 对应的解析器，首次调用时编译
+
+    Args:
+        cls: 对象类型
+        var_map: JSON 键到属性名的映射
+
+    Returns:
+        VarMapParser: 解析器
+    """
+    parser = _parsers.get((cls, id(var_map)))
+    # 解析器持有 var_map 的引用，id 不会被复用；这里再确认一次是同一个对象
+    if parser is None or parser.var_map is not var_map:
+        parser = VarMapParser(cls, var_map)
+        _parsers[(cls, id(var_map))] = parser
+    return parser
+
 
 class BaseObject:
     def __init__(self):
@@ -18,21 +164,17 @@ class BaseObject:
     def class_name(self) -> str:
         return self.__class__.__name__
 
-    def parse(self, json_data: dict):
+    def parse(self, json_data: dict, changes: dict[str, tuple[Any, Any]] | None = None):
         """解析 JSON 数据并设置为实例属性。
 
         Args:
             json_data (dict): 需要解析的 JSON 数据。
+            changes (dict | None): 传入时记录取值发生变化的属性，{属性名: (旧值, 新值)}。
 
         Returns:
             None
         """
-        for k, v in self.var_map.items():
-            if k in json_data:
-                try:
-                    setattr(self, v, json_data[k])
-                except Exception as e:
-                    mprint.error(f"parse {self.class_name} {k} error: {e}")
+        get_var_map_parser(self.__class__, self.var_map).parse(self, json_data, changes)
 
 
 class Base(BaseObject):
@@ -0,0 +1,230 @@
+"""
+态势对象的列式快照
+
+按对象类型（对象字典）把位置、航向、速度、燃油等数值属性保存在 NumPy 数组中，每个对象占一行。
+构建观测时直接对列切片，无需逐个对象读取属性。
+"""
+
+import heapq
+import math
+from functools import lru_cache
+from operator import itemgetter
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+# 数值列 {列名: 对象属性名}
+COLUMNS = {
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "altitude": "current_altitude_asl",
+    "heading": "current_heading",
+    "speed": "current_speed",
+    "fuel": "fuel_percentage",
+    "damage": "damage_state",
+}
+
+
+def _to_float(value: Any) -> float:
+    """属性值转换为浮点数，无法转换时为 NaN（如对象没有该属性，或毁伤状态为非数值字符串）"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+@lru_cache(maxsize=1024)
+def _text_to_float(value: str) -> float:
+    """字符串属性转换为浮点数，毁伤状态等字符串的取值很少，缓存转换结果"""
+    return _to_float(value)
+
+
+class UnitColumns:
+    """
+    一类对象的列式快照
+
+    - 每个对象占一行，对象存在期间行号不变；对象删除后该行被标记为无效，之后由新对象复用
+    - 列数组的长度为 rows（已使用的最大行号 + 1），无效行的数值为 NaN、推演方为 -1，用 alive 过滤
+    - 推演方列 side 为推演方序号（CSituation.side_dict 中的顺序），未知推演方为 -1
+
+    由 CSituation.get_columns 创建和维护，态势更新时只标记发生变化的对象，访问时再批量写入。
+
+    示例
+    ```python
+    aircraft = situation.get_columns("aircraft_dict")
+    mask = aircraft.alive & (aircraft["side"] == red_side_id)
+    obs = aircraft.as_array(["latitude", "longitude", "altitude", "heading", "speed"])[mask]
+    guids = [aircraft.guids[row] for row in np.flatnonzero(mask)]
+    ```
+    """
+
+    def __init__(self, side_attr: str | None = "side", dtype: DTypeLike = np.float64, capacity: int = 64):
+        """
+        Args:
+            side_attr: 写入推演方列的对象属性（目标为 original_detector_side），None 表示不记录推演方
+            dtype: 数值列的精度
+            capacity: 初始容量，行数超过容量时按倍数扩容
+        """
+        self.side_attr = side_attr
+        self.dtype = np.dtype(dtype)
+        self.rows = 0
+        self.guids: list[str | None] = []  # 行号 -> GUID，无效行为 None
+        self._objects: list[Any] = []  # 行号 -> 对象
+        self.row_of: dict[str, int] = {}  # GUID -> 行号
+        self._free_rows: list[int] = []  # 可复用的行号（最小堆，优先复用靠前的行）
+        self._dirty: dict[str, Any] = {}  # 待写入的对象 {guid: obj}
+        self._side_ids: Mapping[str, int] = {}
+        self._layout: tuple[list[str], Any, list[tuple[str, str]]] | None = None  # 见 _build_layout
+        self._data: dict[str, NDArray] = {name: np.full(capacity, np.nan, dtype=self.dtype) for name in COLUMNS}
+        self._data["side"] = np.full(capacity, -1, dtype=np.int32)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        """有效对象数量"""
+        self.flush()
+        return len(self.row_of)
+
+    def __contains__(self, guid: object) -> bool:
+        return guid in self.row_of or guid in self._dirty
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._data)
+
+    def __getitem__(self, name: str) -> NDArray:
+        """
+        获取列数组（长度为 rows 的视图），返回的数组由快照维护，调用方不应修改
+
+        Raises:
+            KeyError: 列名不存在
+        """
+        self.flush()
+        return self._data[name][: self.rows]
+
+    @property
+    def alive(self) -> NDArray[np.bool_]:
+        """有效行掩码"""
+        self.flush()
+        return self._alive[: self.rows]
+
+    def as_array(self, names: Iterable[str] | None = None) -> NDArray:
+        """
+        将多列拼接为二维数组
+
+        Args:
+            names: 列名，默认为全部数值列
+
+        Returns:
+            NDArray: 形状 (rows, 列数) 的新数组
+        """
+        self.flush()
+        names = list(COLUMNS) if names is None else list(names)
+        return np.stack([self._data[name][: self.rows] for name in names], axis=1).astype(self.dtype, copy=False)
+
+    def mark(self, guid: str, obj: Any) -> None:
+        """标记对象的属性已变化，下次访问时写入"""
+        self._dirty[guid] = obj
+
+    def remove(self, guid: str) -> None:
+        """删除对象，其所在行变为无效行"""
+        self._dirty.pop(guid, None)
+        row = self.row_of.pop(guid, None)
+        if row is None:
+            return
+        self.guids[row] = None
+        self._objects[row] = None
+        self._alive[row] = False
+        for name, array in self._data.items():
+            array[row] = -1 if name == "side" else np.nan
+        heapq.heappush(self._free_rows, row)
+
+    def set_side_ids(self, side_ids: Mapping[str, int]) -> None:
+        """设置推演方 GUID 到序号的映射，推演方变化时全部对象重新写入推演方列"""
+        if side_ids == self._side_ids:
+            return
+        self._side_ids = dict(side_ids)
+        if self.side_attr is not None:
+            objects = self._objects
+            for guid, row in self.row_of.items():
+                self._dirty.setdefault(guid, objects[row])
+
+    def flush(self) -> None:
+        """将标记为变化的对象批量写入列数组"""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, {}
+        try:
+            # 通常都是已有对象
+            rows = np.fromiter(map(self.row_of.__getitem__, dirty), dtype=np.intp, count=len(dirty))
+        except KeyError:
+            rows = np.fromiter((self._row_for(guid, obj) for guid, obj in dirty.items()), dtype=np.intp, count=len(dirty))
+        obj_attrs = [obj.__dict__ for obj in dirty.values()]
+        if self._layout is None:
+            self._layout = self._build_layout(obj_attrs[0])
+        numeric_names, numeric_getter, text_columns = self._layout
+        if numeric_names:
+            values = list(map(numeric_getter, obj_attrs))
+            try:
+                # None 由 NumPy 转换为 NaN
+                block = np.array(values, dtype=self.dtype).reshape(len(values), len(numeric_names))
+            except (TypeError, ValueError):
+                block = np.array([[_to_float(value) for value in row] for row in values], dtype=self.dtype)
+                block = block.reshape(len(values), len(numeric_names))
+            for i, name in enumerate(numeric_names):
+                self._data[name][rows] = block[:, i]
+        for name, attr in text_columns:
+            self._data[name][rows] = [
+                _text_to_float(value) if isinstance(value := attrs[attr], str) else _to_float(value) for attrs in obj_attrs
+            ]
+        if self.side_attr is not None:
+            side_ids = self._side_ids
+            side_attr = self.side_attr
+            self._data["side"][rows] = [side_ids.get(attrs.get(side_attr), -1) for attrs in obj_attrs]
+        self._alive[rows] = True
+
+    @staticmethod
+    def _build_layout(obj_attrs: dict[str, Any]) -> tuple[list[str], Any, list[tuple[str, str]]]:
+        """
+        按对象已有的属性划分列：数值属性一次批量读取；字符串属性（如毁伤状态）逐个解析；
+        对象没有的属性（如目标的燃油）保持为 NaN。同一类对象的属性相同，只需在首次写入时确定。
+        """
+        numeric = [(name, attr) for name, attr in COLUMNS.items() if attr in obj_attrs and not isinstance(obj_attrs[attr], str)]
+        text = [(name, attr) for name, attr in COLUMNS.items() if attr in obj_attrs and isinstance(obj_attrs[attr], str)]
+        numeric_names = [name for name, _ in numeric]
+        # itemgetter 只有一个键时返回单个值，统一包装为元组
+        numeric_attrs = [attr for _, attr in numeric]
+        if len(numeric_attrs) == 1:
+            getter = lambda attrs, attr=numeric_attrs[0]: (attrs[attr],)  # noqa: E731
+        else:
+            getter = itemgetter(*numeric_attrs) if numeric_attrs else None
+        return numeric_names, getter, text
+
+    def _row_for(self, guid: str, obj: Any) -> int:
+        row = self.row_of.get(guid)
+        if row is not None:
+            return row
+        if self._free_rows:
+            row = heapq.heappop(self._free_rows)
+            self.guids[row] = guid
+            self._objects[row] = obj
+        else:
+            row = self.rows
+            self.rows += 1
+            self.guids.append(guid)
+            self._objects.append(obj)
+            if row >= len(self._alive):
+                self._grow()
+        self.row_of[guid] = row
+        return row
+
+    def _grow(self) -> None:
+        capacity = len(self._alive) * 2
+        for name, array in self._data.items():
+            grown = np.full(capacity, -1 if name == "side" else np.nan, dtype=array.dtype)
+            grown[: len(array)] = array
+            self._data[name] = grown
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: len(self._alive)] = self._alive
+        self._alive = alive
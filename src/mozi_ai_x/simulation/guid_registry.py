@@ -0,0 +1,83 @@
+from collections.abc import Iterable, Iterator
+
+
+class GuidRegistry:
+    """
+    按插入顺序保存的 GUID 集合
+
+    以字典的键作为存储，添加、删除、查询均为 O(1)，遍历顺序与添加顺序一致。
+    同时保留原 list 的常用接口（append、remove、下标访问、与列表相加等），
+    原来把 all_guid 当作列表使用的代码无需修改；下标访问需要 O(n)，仅为兼容保留。
+    """
+
+    __slots__ = ("_guids",)
+
+    def __init__(self, guids: Iterable[str] = ()):
+        self._guids: dict[str, None] = dict.fromkeys(guids)
+
+    def add(self, guid: str) -> None:
+        """添加 GUID，已存在时保持原位置"""
+        self._guids[guid] = None
+
+    def append(self, guid: str) -> None:
+        """兼容 list.append，同 add"""
+        self._guids[guid] = None
+
+    def extend(self, guids: Iterable[str]) -> None:
+        """兼容 list.extend"""
+        self._guids.update(dict.fromkeys(guids))
+
+    def remove(self, guid: str) -> None:
+        """
+        删除 GUID
+
+        Raises:
+            ValueError: GUID 不存在（与 list.remove 一致）
+        """
+        try:
+            del self._guids[guid]
+        except KeyError:
+            raise ValueError(f"GUID 不存在: {guid}") from None
+
+    def discard(self, guid: str) -> None:
+        """删除 GUID，不存在时忽略"""
+        self._guids.pop(guid, None)
+
+    def clear(self) -> None:
+        self._guids.clear()
+
+    def copy(self) -> "GuidRegistry":
+        return GuidRegistry(self._guids)
+
+    def __contains__(self, guid: object) -> bool:
+        return guid in self._guids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._guids)
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self._guids)
+
+    def __len__(self) -> int:
+        return len(self._guids)
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        return list(self._guids)[index]
+
+    def __add__(self, other: Iterable[str]) -> list[str]:
+        return [*self._guids, *other]
+
+    def __radd__(self, other: Iterable[str]) -> list[str]:
+        return [*other, *self._guids]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GuidRegistry):
+            return list(self._guids) == list(other._guids)
+        if isinstance(other, list | tuple):
+            return list(self._guids) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"GuidRegistry({list(self._guids)!r})"
@@ -227,22 +227,7 @@ class CScenario(BaseObject):
         Returns:
             活动单元字典 格式 {active_unit_guid:active_unit_obj,active_unit_guid_2:active_unit_obj_2...}
         """
-        units = {}
-        submarines = {k: v for k, v in self.situation.submarine_dict.items() if v.name == name}
-        ships = {k: v for k, v in self.situation.ship_dict.items() if v.name == name}
-        facilities = {k: v for k, v in self.situation.facility_dict.items() if v.name == name}
-        aircrafts = {k: v for k, v in self.situation.aircraft_dict.items() if v.name == name}
-        satellites = {k: v for k, v in self.situation.satellite_dict.items() if v.name == name}
-        weapons = {k: v for k, v in self.situation.weapon_dict.items() if v.name == name}
-        unguided_weapons = {k: v for k, v in self.situation.unguided_weapon_dict.items() if v.name == name}
-        units.update(submarines)
-        units.update(ships)
-        units.update(facilities)
-        units.update(aircrafts)
-        units.update(satellites)
-        units.update(weapons)
-        units.update(unguided_weapons)
-        return units
+        return self.situation.find_objects("units", "name", name)
 
     @validate_uuid4_args(["guid"])
     def unit_is_alive(self, guid: str) -> bool:
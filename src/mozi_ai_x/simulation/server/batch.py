@@ -0,0 +1,214 @@
+"""
+命令批处理模块
+
+将多条 lua 命令合并为一个脚本，通过一次 gRPC 往返发送到墨子服务端，
+并借助 lua 包装脚本返回 JSON 数组，使每条命令都能拿到各自的执行结果。
+"""
+
+import json
+import asyncio
+import contextvars
+from typing import TYPE_CHECKING
+
+from ...utils.log import mprint_with_name
+from .response import ServerResponse
+
+if TYPE_CHECKING:
+    from .server import MoziServer
+
+mprint = mprint_with_name("Batch")
+
+# 当前上下文中生效的批处理对象，asyncio.gather 等创建的子任务会继承该上下文
+current_batch: contextvars.ContextVar["CommandBatch | None"] = contextvars.ContextVar("current_batch", default=None)
+
+# 墨子服务端执行 lua 成功/失败时的返回值
+LUA_SUCCESS = "lua执行成功"
+LUA_ERROR = "脚本执行出错"
+
+_HARNESS_HEAD = """local __batch_print = print
+local __batch_results = {}
+local __batch_out = nil
+local function __batch_escape(s)
+    return (string.gsub(s, '[%c"\\\\]', function(c) return string.format('\\\\u%04x', string.byte(c)) end))
+end
+local print = function(...)
+    local parts = {}
+    for i = 1, select('#', ...) do parts[#parts + 1] = tostring(select(i, ...)) end
+    local line = table.concat(parts, '\\t')
+    if __batch_out then __batch_out = __batch_out .. '\\n' .. line else __batch_out = line end
+end
+local function __batch_run(f)
+    __batch_out = nil
+    local ok, err = pcall(f)
+    if ok then
+        __batch_results[#__batch_results + 1] = '[1,"' .. __batch_escape(__batch_out or '') .. '"]'
+    else
+        __batch_results[#__batch_results + 1] = '[0,"' .. __batch_escape(tostring(err)) .. '"]'
+    end
+end
+"""
+
+_HARNESS_TAIL = """__batch_print('[' .. table.concat(__batch_results, ',') .. ']')"""
+
+
+def build_batch_script(cmds: list[str]) -> str:
+    """
+    将多条 lua 命令包装为一个批处理脚本
+
+    每条命令在独立的 pcall 中执行，互不影响；命令内的 print 输出会被捕获为该命令的结果。
+    脚本最终输出 JSON 数组，每个元素为 [是否成功, 输出或错误信息]。
+
+    Args:
+        cmds: lua命令列表
+
+    Returns:
+        str: 批处理脚本
+    """
+    body = "".join(f"__batch_run(function()\n{cmd}\nend)\n" for cmd in cmds)
+    return _HARNESS_HEAD + body + _HARNESS_TAIL
+
+
+def parse_batch_results(raw_data: str, count: int) -> list[ServerResponse] | None:
+    """
+    解析批处理脚本的返回结果
+
+    Args:
+        raw_data: 服务端返回的原始字符串
+        count: 批处理中的命令数量
+
+    Returns:
+        list[ServerResponse] | None: 与命令一一对应的响应列表，无法解析时返回 None
+    """
+    try:
+        results = json.loads(raw_data)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(results, list) or len(results) != count:
+        return None
+
+    responses = []
+    for ok, output in results:
+        if ok:
+            raw = output or LUA_SUCCESS
+            responses.append(ServerResponse.create_success(raw_data=raw, data=raw))
+        else:
+            mprint.warning(f"批处理命令执行出错: {output}")
+            responses.append(ServerResponse.create_error(1002, raw_data=LUA_ERROR, error=RuntimeError(output)))
+    return responses
+
+
+def is_batchable(cmd: str) -> bool:
+    """
+    判断命令能否放入批处理
+
+    GetAllState/UpdateState 等非 lua 命令，以及返回值由服务端 ReturnObj 序列化的命令，
+    都需要单独发送才能拿到原始的返回格式。
+    """
+    return "(" in cmd and "ReturnObj(" not in cmd
+
+
+class CommandBatch:
+    """
+    命令批处理
+
+    在批处理上下文中调用 send_and_recv 的 lua 命令不会立即发送，而是进入待发送队列，
+    满足以下任一条件时合并为一个脚本发送：
+    - 队列长度达到 max_size
+    - 第一条命令入队后经过 flush_interval 秒（默认 0，即当前事件循环中已就绪的任务都入队之后）
+    - 退出批处理上下文
+    """
+
+    def __init__(self, mozi_server: "MoziServer", max_size: int = 100, flush_interval: float = 0.0):
+        self.mozi_server = mozi_server
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.closed = False
+        # 统计信息
+        self.flush_count = 0
+        self.command_count = 0
+
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, cmd: str, raise_error: bool = True) -> ServerResponse:
+        """
+        提交一条命令，并等待其所在批次执行完成
+
+        Args:
+            cmd: lua命令
+            raise_error: 是否在连接失败时抛出异常
+
+        Returns:
+            ServerResponse: 该命令自身的执行结果
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((cmd, future))
+        self.command_count += 1
+
+        if len(self._pending) >= self.max_size:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_interval, self._schedule_flush)
+
+        response = await future
+        if raise_error and not response.success and response.status_code != 1002:
+            raise RuntimeError(f"批处理命令发送失败: {response.message}")
+        return response
+
+    def _schedule_flush(self):
+        task = asyncio.ensure_future(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> None:
+        """立即发送当前队列中的所有命令"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        cmds = [cmd for cmd, _ in pending]
+        self.flush_count += 1
+        try:
+            responses = await self._execute(cmds)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), response in zip(pending, responses, strict=True):
+            if not future.done():
+                future.set_result(response)
+
+    async def _execute(self, cmds: list[str]) -> list[ServerResponse]:
+        if len(cmds) == 1:
+            return [await self.mozi_server._send_and_recv(cmds[0], False, None)]
+
+        response = await self.mozi_server._send_and_recv(build_batch_script(cmds), False, None)
+        if not response.success:
+            return [response] * len(cmds)
+
+        responses = parse_batch_results(response.raw_data, len(cmds))
+        if responses is None:
+            if response.raw_data == LUA_ERROR:
+                # 批处理脚本无法编译（如某条命令存在语法错误），其中的命令都未执行，逐条按顺序重发以定位各自的结果
+                mprint.warning("批处理脚本执行失败，改为逐条发送")
+                return await self.mozi_server.send_and_recv_many(cmds, ordered=True)
+            # 其他无法解析的输出：部分命令可能已经执行，重发非幂等的 lua 命令是不安全的
+            mprint.warning(f"无法解析批处理结果: {response.raw_data[:200]}")
+            error = RuntimeError(f"无法解析批处理结果，批次中的命令可能已部分执行: {response.raw_data[:200]}")
+            return [ServerResponse.create_error(1002, raw_data=response.raw_data, error=error)] * len(cmds)
+        return responses
+
+    async def close(self) -> None:
+        """发送剩余命令并关闭批处理"""
+        while self._pending or self._flush_tasks:
+            await self.flush()
+            if self._flush_tasks:
+                await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        self.closed = True
@@ -4,18 +4,56 @@
 提供 Master-Client 架构，Master 作为 Mozi gRPC 的透明代理
 """
 
-from typing import TYPE_CHECKING
+import time
+import asyncio
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 import grpclib.server
+from grpclib import GRPCError
 from grpclib.client import Channel
+from grpclib.const import Status
 
+from ...utils import json_codec
 from ...utils.log import mprint_with_name
+from ..situ_schema import decode_situation
 
 if TYPE_CHECKING:
     from .server import MoziServer
 
 mprint = mprint_with_name("Distributed")
 
+# 只读取态势、不改变推演状态的命令，同一推演时刻内各 Client 的请求共用一次墨子调用
+CACHEABLE_COMMANDS = frozenset({"GetAllState", "UpdateState"})
+
+# 可按推演方过滤的态势命令，Client 订阅推演方时在命令后附加分隔符和推演方，如 "UpdateState?side=红方"
+SIDE_FILTER_COMMANDS = frozenset({"GetAllState", "UpdateState"})
+SIDE_FILTER_SEPARATOR = "?side="
+
+# 直接给出所属推演方的字段，按顺序查找（目标以探测方为准）
+_SIDE_FIELDS = ("m_OriginalDetectorSide", "m_Side", "m_strSideID")
+# 指向所属对象的字段：传感器、挂架、弹药库属于平台，挂载方案属于飞机，航路点属于单元，条令属于单元、任务或推演方
+_OWNER_FIELDS = ("m_ParentPlatform", "m_AircraftGuid", "m_ActiveUnit", "m_DoctrineOwner")
+
+
+class _SideFilter:
+    """一个态势回复按推演方划分的结果，各推演方的过滤结果在首次请求时序列化并缓存"""
+
+    def __init__(self, response: Any, items: list[tuple[str, Any]], sides: list[str | None]):
+        self.response = response
+        self.items = items
+        self.sides = sides  # 与 items 一一对应的推演方 GUID，None 表示所有推演方共享
+        self.messages: dict[str, str] = {}
+
+    def get_message(self, side: str) -> str:
+        message = self.messages.get(side)
+        if message is None:
+            selected = {
+                key: item for (key, item), item_side in zip(self.items, self.sides, strict=True) if item_side in (None, side)
+            }
+            message = self.messages[side] = json_codec.dumps(selected)
+        return message
+
 
 class MoziProxyServer:
     """
@@ -23,13 +61,55 @@ class MoziProxyServer:
     在 Master 节点上运行，代理所有 Mozi gRPC 调用
     """
 
-    def __init__(self, mozi_server: "MoziServer", proxy_port: int):
+    def __init__(
+        self,
+        mozi_server: "MoziServer",
+        proxy_port: int,
+        cacheable_commands: Iterable[str] = CACHEABLE_COMMANDS,
+        cache_ttl: float | None = 1.0,
+        apply_queue_size: int = 16,
+    ):
+        """
+        Args:
+            mozi_server: Master 节点的 MoziServer
+            proxy_port: 代理端口
+            cacheable_commands: 可合并、缓存回复的只读命令
+            cache_ttl: 缓存回复的有效期（秒），用于推演自行运行（非同步步进）时推演时刻随时间推进的情况；
+                None 表示只在收到其他命令时失效
+            apply_queue_size: 等待同步到 Master 本地态势的回复数量上限，队列满时代理等待队列有空位后再返回回复
+        """
         self.mozi_server = mozi_server
         self.proxy_port = proxy_port
         self.server: grpclib.server.Server | None = None
         self._mozi_channel: Channel | None = None
         self._mozi_stub = None
 
+        # 只读命令的合并与缓存：任何其他命令都可能改变推演状态（如推进推演、下达指令），
+        # 转发前（以及 Master 自身发出这类命令前）调用 invalidate，使之前的缓存和正在进行的调用不再被新请求复用
+        self.cacheable_commands = frozenset(cacheable_commands)
+        self.cache_ttl = cache_ttl
+        self._epoch = 0
+        self._reply_cache: dict[str, tuple[int, float, Any]] = {}  # {命令: (epoch, 时间, 回复)}
+        self._inflight: dict[tuple[str, int], asyncio.Future] = {}  # {(命令, epoch): 正在进行的调用}
+        self.cache_stats = {"upstream": 0, "hits": 0, "coalesced": 0}
+
+        # Master 本地态势的异步同步：代理收到态势回复后立即返回给 Client，回复放入队列，
+        # 由 _apply_loop 按顺序在工作线程中解码，再在事件循环中更新态势（与 Master 自身的态势更新在同一线程，互不交错）
+        self._apply_queue: asyncio.Queue[tuple[str, str, float]] = asyncio.Queue(maxsize=apply_queue_size)
+        self._apply_task: asyncio.Task | None = None
+        self._pending_full_states = 0  # 队列中的全量态势数量
+        # applied: 已同步的回复数；superseded: 因全量态势到达而跳过的回复数；
+        # last_lag/max_lag: 从收到回复到同步完成的耗时（秒）
+        self.apply_stats = {"applied": 0, "superseded": 0, "failed": 0, "last_lag": 0.0, "max_lag": 0.0}
+
+        # 按推演方过滤的态势：每个回复只解码、划分一次，各推演方的过滤结果序列化后供该推演方的所有 Client 复用
+        self._side_filters: dict[str, _SideFilter] = {}  # {命令: 最近一个回复的划分结果}
+        self._side_lock = asyncio.Lock()
+        self._guid_side: dict[str, str] = {}  # 对象 GUID -> 推演方 GUID，由划分过的回复维护
+        self._side_names: dict[str, str] = {}  # 推演方名称 -> 推演方 GUID
+        # served: 返回的过滤回复数；full_size/sent_size: 过滤前后的回复长度（字符数）
+        self.side_stats = {"served": 0, "full_size": 0, "sent_size": 0}
+
     async def start(self):
         """启动代理服务器"""
         try:
@@ -50,14 +130,9 @@ class MoziProxyServer:
 
                 async def grpc_connect(self, request):
                     """代理 grpc_connect 调用"""
-                    # 直接转发到真实 Mozi 服务器
-                    response = await self.proxy._mozi_stub.grpc_connect(request)
-
-                    # 拦截特定命令，更新 Master 本地态势
-                    if hasattr(self.proxy.mozi_server, "scenario") and self.proxy.mozi_server.scenario:
-                        await self.proxy._intercept_response(request.name, response)
+                    return await self.proxy._forward(request)
 
-                    return response
+            self._apply_task = asyncio.create_task(self._apply_loop())
 
             # 启动代理服务器
             self.server = grpclib.server.Server([MoziProxyImplementation(self)])
@@ -76,35 +151,261 @@ class MoziProxyServer:
             self.server.close()
             await self.server.wait_closed()
 
+        if self._apply_task:
+            self._apply_task.cancel()
+            try:
+                await self._apply_task
+            except asyncio.CancelledError:
+                pass
+            self._apply_task = None
+
         if self._mozi_channel:
             self._mozi_channel.close()
 
         mprint.info("Mozi 代理服务器已停止")
 
-    async def _intercept_response(self, command: str, response):
-        """拦截响应，更新 Master 本地态势"""
+    def invalidate(self):
+        """使缓存的只读命令回复失效，之后的请求重新调用墨子；正在进行的调用不再被新请求复用"""
+        self._epoch += 1
+        self._reply_cache.clear()
+
+    async def _forward(self, request):
+        """
+        转发请求到真实 Mozi 服务器
+
+        只读命令在同一 epoch 内：已有缓存且未过期时直接返回缓存的回复；已有相同命令正在调用时等待其结果；
+        否则调用墨子并缓存回复。其他命令使缓存失效后直接转发。
+        """
+        command = request.name
+        base_command, separator, side = command.partition(SIDE_FILTER_SEPARATOR)
+        if separator and base_command in SIDE_FILTER_COMMANDS:
+            return await self._forward_side(base_command, side)
+
+        if command not in self.cacheable_commands:
+            self.invalidate()
+            return await self._call_upstream(request)
+
+        epoch = self._epoch
+        cached = self._reply_cache.get(command)
+        if (
+            cached is not None
+            and cached[0] == epoch
+            and (self.cache_ttl is None or time.monotonic() - cached[1] <= self.cache_ttl)
+        ):
+            self.cache_stats["hits"] += 1
+            return cached[2]
+
+        key = (command, epoch)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.cache_stats["coalesced"] += 1
+            # shield: 某个等待方被取消时不影响其他等待方
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            # 拦截态势相关的命令
-            if command in ["GetAllState", "UpdateState"]:
-                # GrpcReply 有 message 字段，检查是否有内容
-                if response.message and response.message != "脚本执行出错":
-                    # 解析并更新本地态势
-                    import json
-
-                    situation_data = json.loads(response.message)
-
-                    # 更新 scenario 对象
-                    if command == "GetAllState":
-                        # 全量更新
-                        self.mozi_server.scenario.situation._parse_full_situation(situation_data, self.mozi_server.scenario)
-                        mprint.debug("Master 本地态势已全量同步")
-                    elif command == "UpdateState":
-                        # 增量更新
-                        self.mozi_server.scenario.situation._process_update_data(situation_data, self.mozi_server.scenario)
-                        mprint.debug("Master 本地态势已增量同步")
+            response = await self._call_upstream(request)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 没有其他等待方时避免 "exception was never retrieved" 警告
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            if self._epoch == epoch:
+                self._reply_cache[command] = (epoch, time.monotonic(), response)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _forward_side(self, command: str, side: str):
+        """
+        返回按推演方过滤的态势回复
+
+        原始回复按 _forward 获取（与其他 Client 共用缓存），只保留属于该推演方的对象，
+        以及无法确定推演方的对象（推演方、天气、想定信息等）。
+
+        Args:
+            command: 态势命令
+            side: 推演方名称或 GUID
+
+        Raises:
+            GRPCError: 无法识别推演方时状态为 NOT_FOUND，回复无法解析或过滤时状态为 INTERNAL，
+                不会向订阅推演方的 Client 返回未过滤的态势
+        """
+        from ..proto.grpc import GrpcReply, GrpcRequest
+
+        response = await self._forward(GrpcRequest(name=command))
+        if not response.message or response.message == "脚本执行出错":
+            return response
 
+        try:
+            async with self._side_lock:
+                entry = self._side_filters.get(command)
+                if entry is None or entry.response is not response:
+                    entry, pending = await asyncio.to_thread(self._partition_reply, command, response)
+                    self._resolve_pending(entry, pending)
+                    self._side_filters[command] = entry
+                side_guid = side if side in self._side_names.values() else self._side_names.get(side)
+                if side_guid is None:
+                    raise GRPCError(Status.NOT_FOUND, f"未知的推演方 {side}")
+                message = entry.messages.get(side_guid)
+                if message is None:
+                    message = await asyncio.to_thread(entry.get_message, side_guid)
+        except GRPCError as e:
+            mprint.warning(f"按推演方过滤态势失败: {e.message}")
+            raise
         except Exception as e:
-            mprint.warning(f"态势同步失败: {e}")
+            mprint.warning(f"按推演方过滤态势失败: {e}")
+            raise GRPCError(Status.INTERNAL, f"按推演方过滤态势失败: {e}") from e
+
+        self.side_stats["served"] += 1
+        self.side_stats["full_size"] += len(response.message)
+        self.side_stats["sent_size"] += len(message)
+        return GrpcReply(message=message, length=len(message))
+
+    def _partition_reply(self, command: str, response) -> tuple[_SideFilter, list[tuple[int, str, str, bool]]]:
+        """
+        解码态势回复并确定每个对象的推演方（在工作线程中执行，不访问 Master 本地态势）
+
+        Returns:
+            tuple: (划分结果, 需要在事件循环中按 Master 本地态势确定推演方的对象 [(序号, GUID, 查找的 GUID, 是否记录)])
+        """
+        items = list(json_codec.loads(response.message).items())
+        guid_side = self._guid_side
+        if command == "GetAllState":
+            guid_side.clear()
+
+        sides: list[str | None] = [None] * len(items)
+        pending: list[tuple[int, str, str, bool]] = []
+        owned: list[tuple[int, str, str]] = []
+        for i, (key, item) in enumerate(items):
+            guid = item.get("strGuid", key)
+            class_name = item.get("ClassName")
+            if class_name == "CSide":
+                # 推演方本身由各推演方共享，作为条令等对象的所属对象时对应其自身
+                guid_side[guid] = guid
+                if item.get("strName"):
+                    self._side_names[item["strName"]] = guid
+                continue
+            if class_name == "Delete":
+                sides[i] = guid_side.pop(guid, None)
+                if sides[i] is None:
+                    pending.append((i, guid, guid, False))
+                continue
+            side = next((item[field] for field in _SIDE_FIELDS if item.get(field)), None)
+            if side is not None:
+                sides[i] = guid_side[guid] = side
+                continue
+            owner = next((item[field] for field in _OWNER_FIELDS if item.get(field)), None)
+            if owner is not None:
+                owned.append((i, guid, owner))
+            else:
+                # 增量数据中已有对象通常只有变化的字段，先查已划分过的回复，再查 Master 本地态势
+                sides[i] = guid_side.get(guid)
+                if sides[i] is None:
+                    pending.append((i, guid, guid, False))
+        # 所属对象可能排在后面，在全部对象划分完后再查找
+        for i, guid, owner in owned:
+            side = guid_side.get(owner)
+            if side is not None:
+                sides[i] = guid_side[guid] = side
+            else:
+                pending.append((i, guid, owner, True))
+        return _SideFilter(response, items, sides), pending
+
+    def _resolve_pending(self, entry: _SideFilter, pending: list[tuple[int, str, str, bool]]) -> None:
+        """按 Master 本地态势确定剩余对象的推演方（在事件循环中执行，与态势更新互不交错）"""
+        scenario = getattr(self.mozi_server, "scenario", None)
+        if scenario is None or not pending:
+            return
+        get_object_side = scenario.situation.get_object_side
+        for i, guid, lookup, remember in pending:
+            side = get_object_side(lookup)
+            if side is not None:
+                entry.sides[i] = side
+                if remember:
+                    self._guid_side[guid] = side
+
+    async def _call_upstream(self, request):
+        """调用真实 Mozi 服务器，并拦截态势命令的回复更新 Master 本地态势"""
+        self.cache_stats["upstream"] += 1
+        response = await self._mozi_stub.grpc_connect(request)
+        if hasattr(self.mozi_server, "scenario") and self.mozi_server.scenario:
+            await self._intercept_response(request.name, response)
+        return response
+
+    @property
+    def apply_pending(self) -> int:
+        """等待同步到 Master 本地态势的回复数量"""
+        return self._apply_queue.qsize()
+
+    async def wait_applied(self):
+        """等待已收到的态势回复全部同步到 Master 本地态势，用于 Master 上需要读取最新态势的代码"""
+        await self._apply_queue.join()
+
+    async def _intercept_response(self, command: str, response):
+        """拦截态势命令的回复，放入队列异步更新 Master 本地态势"""
+        # 拦截态势相关的命令
+        if command in ["GetAllState", "UpdateState"]:
+            # GrpcReply 有 message 字段，检查是否有内容
+            if response.message and response.message != "脚本执行出错":
+                if self._apply_queue.full():
+                    mprint.warning(f"态势同步队列已满（{self._apply_queue.maxsize}），等待同步完成")
+                await self._apply_queue.put((command, response.message, time.monotonic()))
+                if command == "GetAllState":
+                    self._pending_full_states += 1
+
+    async def _apply_loop(self):
+        """按收到的顺序逐个同步态势回复，同一时间只有一个回复在解析"""
+        queue = self._apply_queue
+        while True:
+            command, message, received_at = self._dequeued(await queue.get())
+            try:
+                # 队列中还有全量态势时，之前尚未同步的回复已无意义
+                while self._pending_full_states:
+                    self.apply_stats["superseded"] += 1
+                    queue.task_done()
+                    command, message, received_at = self._dequeued(queue.get_nowait())
+                records = await asyncio.to_thread(self._decode_situation, command, message)
+                self._apply_situation(command, records)
+                self.apply_stats["applied"] += 1
+            except Exception as e:
+                self.apply_stats["failed"] += 1
+                mprint.warning(f"态势同步失败: {e}")
+            finally:
+                queue.task_done()
+            lag = time.monotonic() - received_at
+            self.apply_stats["last_lag"] = lag
+            self.apply_stats["max_lag"] = max(self.apply_stats["max_lag"], lag)
+
+    def _dequeued(self, item: tuple[str, str, float]) -> tuple[str, str, float]:
+        if item[0] == "GetAllState":
+            self._pending_full_states -= 1
+        return item
+
+    @staticmethod
+    def _decode_situation(command: str, message: str) -> list:
+        """解码态势回复（在工作线程中执行），不访问 Master 本地态势"""
+        return list(decode_situation(message, typed=command == "GetAllState"))
+
+    def _apply_situation(self, command: str, situation_data: list):
+        """用解码后的态势回复更新 Master 本地态势（在事件循环中执行）"""
+        scenario = self.mozi_server.scenario
+
+        # 更新 scenario 对象
+        if command == "GetAllState":
+            # 全量更新
+            scenario.situation._parse_full_situation(situation_data, scenario)
+            mprint.debug("Master 本地态势已全量同步")
+        elif command == "UpdateState":
+            # 增量更新
+            scenario.situation._process_update_data(situation_data, scenario)
+            mprint.debug("Master 本地态势已增量同步")
 
 
 class MoziProxyClient:
@@ -113,9 +414,17 @@ class MoziProxyClient:
     直接连接到 Master 的代理端口
     """
 
-    def __init__(self, master_ip: str, master_port: int):
+    def __init__(self, master_ip: str, master_port: int, side: str | None = None):
+        """
+        Args:
+            master_ip: Master 代理地址
+            master_port: Master 代理端口
+            side: 订阅的推演方名称或 GUID，设置后 GetAllState/UpdateState 只返回该推演方的对象
+                （以及推演方、天气等共享对象），None 表示返回完整态势
+        """
         self.master_ip = master_ip
         self.master_port = master_port
+        self.side = side
         self.channel: Channel | None = None
         self.stub = None
         self._connected = False
@@ -160,16 +469,23 @@ class MoziProxyClient:
         """是否已连接"""
         return self._connected
 
-    async def send_and_recv(self, command: str):
-        """发送命令到 Master 代理"""
+    async def send_and_recv(self, command: str, timeout: float | None = None):
+        """发送命令到 Master 代理
+
+        Args:
+            command: lua命令
+            timeout: 超时时间（秒），None 表示不限制
+        """
         if not self._connected:
             raise RuntimeError("未连接到 Master 代理")
 
         try:
             from ..proto.grpc import GrpcRequest
 
+            if self.side and command in SIDE_FILTER_COMMANDS:
+                command = f"{command}{SIDE_FILTER_SEPARATOR}{self.side}"
             request = GrpcRequest(name=command)
-            response = await self.stub.grpc_connect(request)
+            response = await self.stub.grpc_connect(request, timeout=timeout)
 
             # 转换为 ServerResponse 格式
             from .response import ServerResponse
@@ -21,6 +21,7 @@ class ServerResponse:
         Status.OK.value: "OK",
         Status.UNIMPLEMENTED.value: "Not Implemented",
         Status.UNAVAILABLE.value: "Service Unavailable",
+        Status.DEADLINE_EXCEEDED.value: "Deadline Exceeded",
         1000: "Connection Error",
         1001: "Empty Response",
         1002: "Lua execution error",
@@ -1,7 +1,10 @@
 import os
 import asyncio
+import weakref
 from pathlib import Path
 from typing import Literal
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator
 
 import psutil
 from grpclib import GRPCError
@@ -9,11 +12,13 @@ from grpclib.const import Status
 from grpclib.client import Channel
 
 from ..scenario import CScenario
+from ..situ_schema import decode_situation
 from ...utils.log import mprint_with_name
 from ..proto import GrpcRequest, GRpcStub as GrpcStub
 from mozi_ai_x.utils.validator import validate_literal_args
 
 from .response import ServerResponse
+from .batch import CommandBatch, current_batch, is_batchable
 
 
 mprint = mprint_with_name("Mozi Server")
@@ -42,6 +47,9 @@ class MoziServer:
         retry_times: int = 3,
         mode: Literal["standalone", "master", "client"] = "standalone",
         api_port: int = 6061,
+        max_concurrency: int = 64,
+        call_timeout: float | None = None,
+        subscribe_side: str | None = None,
     ):
         # 服务器IP
         self.server_ip = server_ip
@@ -81,9 +89,21 @@ class MoziServer:
         # 重试次数
         self.retry_times = retry_times
 
+        # 流水线执行：同一 Channel 上允许同时在途的 unary 调用数量上限
+        self.max_concurrency = max_concurrency
+        # 单次调用的默认超时时间（秒），None 表示不限制
+        self.call_timeout = call_timeout
+        self._call_semaphore = asyncio.Semaphore(max_concurrency)
+        # 重连锁，避免并发失败的调用各自重建 Channel
+        self._reconnect_lock = asyncio.Lock()
+        # 按 order_key 串行化的顺序通道
+        self._order_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
         # 分布式模式相关
         self.mode = mode
         self.api_port = api_port
+        # Client 模式下订阅的推演方名称或 GUID，Master 只返回该推演方的态势，None 表示完整态势
+        self.subscribe_side = subscribe_side
         # 保留用于向后兼容
         self.api_server = None
         self.api_client = None
@@ -98,7 +118,7 @@ class MoziServer:
         elif mode == "client":
             from .distributed import MoziProxyClient
 
-            self.proxy_client = MoziProxyClient(server_ip, server_port)
+            self.proxy_client = MoziProxyClient(server_ip, server_port, side=subscribe_side)
             mprint.info(f"初始化为 Client 模式，连接到 Master 代理: {server_ip}:{server_port}")
         else:
             mprint.info("初始化为 Standalone 模式")
@@ -137,20 +157,158 @@ class MoziServer:
         except Exception as e:
             mprint(f"关闭连接时出错: {e}")
 
-    async def send_and_recv(self, cmd: str, raise_error: bool = True) -> ServerResponse:
+    async def send_and_recv(
+        self,
+        cmd: str,
+        raise_error: bool = True,
+        timeout: float | None = None,
+        order_key: str | None = None,
+    ) -> ServerResponse:
         """
         gRPC发送和接收服务端消息方法
 
+        多个协程可同时调用本方法，调用会在同一 Channel 上并发在途（上限为 max_concurrency）。
+        默认不保证服务端执行顺序；需要保序的命令可指定相同的 order_key，它们将按调用顺序逐条执行。
+
         args:
             cmd: lua命令
             raise_error: 是否在连接失败时抛出异常
+            timeout: 本次调用的超时时间（秒），None 时使用 call_timeout
+            order_key: 顺序通道标识，相同 order_key 的命令按调用顺序串行执行
         returns:
             ServerResponse: 包含响应状态和数据的对象
         """
+        # 批处理上下文中的 lua 命令进入批处理队列，批次内按提交顺序执行
+        batch = current_batch.get()
+        if batch is not None and not batch.closed and is_batchable(cmd):
+            return await batch.submit(cmd, raise_error)
+
+        if order_key is None:
+            return await self._send_and_recv(cmd, raise_error, timeout)
+
+        lock = self._order_locks.get(order_key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._order_locks[order_key] = lock
+        async with lock:
+            return await self._send_and_recv(cmd, raise_error, timeout)
+
+    async def send_and_recv_many(
+        self,
+        cmds: list[str],
+        raise_error: bool = False,
+        timeout: float | None = None,
+        ordered: bool = False,
+    ) -> list[ServerResponse]:
+        """
+        流水线方式发送多条命令
+
+        ordered=False 时所有命令同时在途，总耗时约为一次往返；
+        ordered=True 时按列表顺序逐条执行，保证服务端执行顺序。
+
+        Args:
+            cmds: lua命令列表
+            raise_error: 是否在失败时抛出异常，默认 False，失败以错误响应的形式返回
+            timeout: 每条命令的超时时间（秒），None 时使用 call_timeout
+            ordered: 是否保证执行顺序
+
+        Returns:
+            list[ServerResponse]: 与 cmds 一一对应的响应列表
+        """
+        if ordered:
+            return [await self._send_and_recv(cmd, raise_error, timeout) for cmd in cmds]
+        return list(await asyncio.gather(*(self._send_and_recv(cmd, raise_error, timeout) for cmd in cmds)))
+
+    async def send_and_recv_stream(self, cmd: str, timeout: float | None = None) -> AsyncIterator[str]:
+        """
+        通过 grpc_connect_stream 发送命令，逐块返回服务端消息
+
+        Args:
+            cmd: 命令
+            timeout: 整个流的超时时间（秒），None 时使用 call_timeout
+
+        Yields:
+            str: 服务端返回的数据块
+
+        Raises:
+            GRPCError: 服务端未实现流式接口时状态为 UNIMPLEMENTED
+        """
+        if self.mode == "client":
+            # Master 代理只转发 unary 调用
+            raise GRPCError(Status.UNIMPLEMENTED, "Client 模式不支持流式调用")
+
+        if not self.is_connected and not await self._reconnect(self.channel):
+            raise RuntimeError("连接墨子服务器失败")
+        if self.grpc_client is None:
+            raise RuntimeError("grpc_client is not initialized")
+
+        if timeout is None:
+            timeout = self.call_timeout
+        self._invalidate_proxy_cache(cmd)
+        async with self._call_semaphore:
+            async for reply in self.grpc_client.grpc_connect_stream(grpc_request=GrpcRequest(name=cmd), timeout=timeout):
+                if reply.message:
+                    yield reply.message
+
+    @asynccontextmanager
+    async def batch(self, max_size: int = 100, flush_interval: float = 0.0) -> AsyncIterator[CommandBatch]:
+        """
+        命令批处理上下文
+
+        上下文内（包括其中通过 asyncio.gather 等创建的子任务）发出的 lua 命令会被合并为一个脚本发送，
+        每个调用仍会拿到自己那条命令的执行结果。
+
+        Args:
+            max_size: 单个批次的最大命令数，达到后立即发送
+            flush_interval: 第一条命令入队后等待合并的时间（秒），默认 0 即合并当前已就绪的所有调用
+
+        Examples:
+            >>> async with server.batch():
+            ...     results = await asyncio.gather(*(unit.set_desired_speed(500) for unit in units))
+        """
+        batch = CommandBatch(self, max_size, flush_interval)
+        token = current_batch.set(batch)
+        try:
+            yield batch
+        finally:
+            current_batch.reset(token)
+            await batch.close()
+
+    async def _grpc_call(self, cmd: str, timeout: float | None):
+        """在并发上限内发起一次 unary 调用"""
+        if self.grpc_client is None:
+            raise RuntimeError("grpc_client is not initialized")
+        async with self._call_semaphore:
+            return await self.grpc_client.grpc_connect(grpc_request=GrpcRequest(name=cmd), timeout=timeout)
+
+    def _invalidate_proxy_cache(self, cmd: str) -> None:
+        """Master 模式下自身发出的命令同样可能改变推演状态，使代理缓存的只读命令回复失效"""
+        if self.mode == "master" and cmd not in self.proxy_server.cacheable_commands:
+            self.proxy_server.invalidate()
+
+    async def _reconnect(self, failed_channel: Channel | None) -> bool:
+        """
+        重建连接。并发失败的调用只会触发一次重建，
+        若 Channel 已被其他调用重建，则直接复用。
+
+        失败的调用不在锁外修改 is_connected：晚于重建返回的失败只说明旧 Channel 不可用，
+        是否需要重建只按 Channel 是否仍是失败时使用的那个判断。
+        """
+        async with self._reconnect_lock:
+            if self.channel is not None and self.channel is not failed_channel:
+                return True
+            self.is_connected = await self.connect_grpc_server()
+            return self.is_connected
+
+    async def _send_and_recv(self, cmd: str, raise_error: bool, timeout: float | None) -> ServerResponse:
+        if timeout is None:
+            timeout = self.call_timeout
+
         # Client 模式：通过 Master 代理
         if self.mode == "client":
             if hasattr(self, "proxy_client") and self.proxy_client and self.proxy_client.is_connected:
-                return await self.proxy_client.send_and_recv(cmd)
+                async with self._call_semaphore:
+                    return await self.proxy_client.send_and_recv(cmd, timeout=timeout)
             else:
                 mprint.warning("未连接到 Master 代理")
                 if raise_error:
@@ -159,7 +317,7 @@ class MoziServer:
 
         # Master 或 Standalone 模式：直连墨子
         if not self.is_connected:
-            if not await self.connect_grpc_server():
+            if not await self._reconnect(self.channel):
                 mprint.warning("连接墨子服务器失败")
                 if raise_error:
                     raise RuntimeError("连接墨子服务器失败")
@@ -175,9 +333,11 @@ class MoziServer:
             self.throw_into_pool(cmd)
             return ServerResponse.create_success()
 
+        self._invalidate_proxy_cache(cmd)
+        channel = self.channel
         try:
             mprint.debug(f"发送消息: {cmd}")
-            response = await self.grpc_client.grpc_connect(grpc_request=GrpcRequest(name=cmd))
+            response = await self._grpc_call(cmd, timeout)
             mprint.debug(f"返回结果: {response.to_dict()}")
 
             if not response.message:
@@ -192,19 +352,26 @@ class MoziServer:
                 mprint.warning(f"服务端未实现该RPC方法: {e}")
                 return ServerResponse.from_grpc_error(e)
 
+            # 超时不重试：命令可能已在服务端执行，重发非幂等的 lua 命令是不安全的
+            if isinstance(e, asyncio.TimeoutError) or (isinstance(e, GRPCError) and e.status == Status.DEADLINE_EXCEEDED):
+                mprint.warning(f"命令执行超时: {cmd}")
+                if raise_error:
+                    raise RuntimeError(f"命令执行超时（{timeout} 秒）") from e
+                return ServerResponse.create_error(status_code=Status.DEADLINE_EXCEEDED.value, error=e)
+
             mprint.warning(f"发送接收消息失败: {e}")
-            self.is_connected = False
 
             # 带重试次数的连接恢复逻辑
             for attempt in range(1, self.retry_times + 1):
                 mprint.debug(f"正在尝试第 {attempt}/{self.retry_times} 次重试...")
 
-                if not await self.connect_grpc_server():
+                if not await self._reconnect(channel):
                     mprint.warning(f"第 {attempt} 次重连失败")
                     continue
+                channel = self.channel
 
                 try:
-                    response = await self.grpc_client.grpc_connect(grpc_request=GrpcRequest(name=cmd))
+                    response = await self._grpc_call(cmd, timeout)
                     if response.message:
                         return ServerResponse.create_success(raw_data=response.message, data=response.message)
 
@@ -214,7 +381,6 @@ class MoziServer:
 
                 except Exception as retry_e:
                     mprint.warning(f"第 {attempt} 次请求失败: {retry_e}")
-                    self.is_connected = False
 
             # 所有重试失败后的处理
             error_msg = f"操作失败，共尝试 {self.retry_times + 1} 次（含重试 {self.retry_times} 次）"
@@ -237,10 +403,8 @@ class MoziServer:
                     self.scenario = scenario
                     # 解析态势数据
                     if response.raw_data and response.raw_data != "脚本执行出错":
-                        import json
-
                         try:
-                            situation_data = json.loads(response.raw_data)
+                            situation_data = decode_situation(response.raw_data)
                             scenario.situation._parse_full_situation(situation_data, scenario)
                             print("✓ 态势数据解析完成")
                         except Exception as e:
@@ -598,22 +762,24 @@ class MoziServer:
         """
         return await scenario.situation.init_situation(scenario, app_mode)
 
-    async def update_situation(self, scenario: "CScenario") -> dict:
+    async def update_situation(self, scenario: "CScenario", stream: bool = False) -> dict:
         """
         更新态势
 
         Args:
             scenario: 想定类对象
+            stream: 是否使用流式更新（grpc_connect_stream），边接收边解析
 
         Returns:
             dict: 返回变更信息
                 {
                     "added": <>,
                     "deleted": <>,
+                    "changed": <{guid: {属性名: (旧值, 新值)}}>,
                     "pseudo_guids": <>,
                 }
         """
-        return await scenario.situation.update_situation(scenario)
+        return await scenario.situation.update_situation(scenario, stream)
 
     async def emulate_no_console(self) -> bool:
         """
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from .server import MoziServer
@@ -41,37 +41,69 @@ from .base import Base
 from mozi_ai_x.utils.validator import validate_literal_args, validate_uuid4_args
 
 
+class _SideObjects:
+    """
+    推演方的对象集合
+
+    返回 CSituation 在解析态势时按推演方增量维护的索引，O(1) 获取且始终与态势同步。
+    返回的字典由态势维护，调用方不应修改；需要快照时使用 CSide.get_xxx() 方法。
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def __get__(self, side: "CSide | None", owner: type | None = None) -> dict[str, Any]:
+        if side is None:
+            return self
+        return side.situation.get_side_objects(side.guid, self.key)
+
+
 class CSide(Base):
     """方"""
 
+    # 编组
+    groups = _SideObjects("group_dict")
+    # 实体
+    submarines = _SideObjects("submarine_dict")
+    ships = _SideObjects("ship_dict")
+    facilities = _SideObjects("facility_dict")
+    aircrafts = _SideObjects("aircraft_dict")
+    satellites = _SideObjects("satellite_dict")
+    weapons = _SideObjects("weapon_dict")
+    unguided_weapons = _SideObjects("unguided_weapon_dict")
+    # 预定义航路
+    sideways = _SideObjects("sideway_dict")
+    # 目标
+    contacts = _SideObjects("contact_dict")
+    # 消息
+    logged_messages = _SideObjects("logged_messages_dict")
+    # 任务，missions 包含全部类型
+    missions = _SideObjects("missions")
+    patrol_missions = _SideObjects("mission_patrol_dict")
+    strike_missions = _SideObjects("mission_strike_dict")
+    support_missions = _SideObjects("mission_support_dict")
+    cargo_missions = _SideObjects("mission_cargo_dict")
+    ferry_missions = _SideObjects("mission_ferry_dict")
+    mining_missions = _SideObjects("mission_mining_dict")
+    mine_clearing_missions = _SideObjects("mission_mine_clearing_mission_dict")
+    # 参考点与区域
+    reference_points = _SideObjects("reference_point_dict")
+    no_nav_zones = _SideObjects("zone_no_nav_dict")
+    exclusion_zones = _SideObjects("zone_exclusion_dict")
+
     def __init__(self, guid: str, mozi_server: "MoziServer", situation: "CSituation"):
         super().__init__(guid, mozi_server, situation)
         # 名称
         self.name = ""
         self.__zone_index_increment = 1  # 创建封锁区或禁航区的自增命名序号
         self.__reference_point_index_increment = 1  # 创建参考点的自增命名序号
-        self.missions: dict[str, CMission] = {}  # key:key:mission name, value: Mission instance
-        # 实体
-        self.aircrafts: dict[str, CAircraft] = {}  # key:unit guid, value: Unit instance
-        self.facilities: dict[str, CFacility] = {}  # key:unit guid, value: Unit instance
-        self.ships: dict[str, CShip] = {}
-        self.submarines: dict[str, CSubmarine] = {}
-        self.weapons: dict[str, CWeapon] = {}
-        self.satellites: dict[str, CSatellite] = {}
-        # 目标
-        self.contacts: dict[str, CContact] = {}  # key:contact guid, value, contact instance
-        # 编组
-        self.groups: dict[str, CGroup] = {}
+        # 任务、实体、目标、编组、参考点、消息等集合见类属性，由态势按推演方实时维护
         # 点
         self.action_points = {}
-        # 参考点
-        self.reference_points = {}
         # 条令
         self.doctrine = None
         # 天气
         self.weather = None
-        # 消息
-        self.logged_messages = self.get_logged_messages()
         self.current_point = 0  # 当前得分
         self.point_record = []  # 得分记录
         self.simulate_time = ""  # 当前推演时间
@@ -114,37 +146,10 @@ class CSide(Base):
         """
         将推演方准静态化
         by aie
+
+        各类对象集合已由态势按推演方实时维护（见类属性），这里只需获取条令
         """
         self.doctrine = self.get_doctrine()
-        self.groups = self.get_groups()
-        self.submarines = self.get_submarines()
-        self.ships = self.get_ships()
-        self.facilities = self.get_facilities()
-        self.aircrafts = self.get_aircrafts()
-        self.satellites = self.get_satellites()
-        self.weapons = self.get_weapons()
-        self.unguided_weapons = self.get_unguided_weapons()
-        self.sideways = self.get_sideways()
-        self.contacts = self.get_contacts()
-        self.logged_messages = self.get_logged_messages()
-        self.patrol_missions = self.get_patrol_missions()
-        self.strike_missions = self.get_strike_missions()
-        self.support_missions = self.get_support_missions()
-        self.cargo_missions = self.get_cargo_missions()
-        self.ferry_missions = self.get_ferry_missions()
-        self.mining_missions = self.get_mining_missions()
-        self.mine_clearing_missions = self.get_mine_clearing_missions()
-        self.reference_points = self.get_reference_points()
-        self.no_nav_zones = self.get_no_nav_zones()
-        self.exclusion_zones = self.get_exclusion_zones()
-
-        self.missions.update(self.patrol_missions)
-        self.missions.update(self.strike_missions)
-        self.missions.update(self.support_missions)
-        self.missions.update(self.cargo_missions)
-        self.missions.update(self.ferry_missions)
-        self.missions.update(self.mining_missions)
-        self.missions.update(self.mine_clearing_missions)
 
     def static_update(self):
         """静态更新推演方类下的关联类实例"""
@@ -152,152 +157,13 @@ class CSide(Base):
         self.static_delete()
 
     def static_delete(self):
-        """将推演方删除的准静态化对象进行更新"""
-        popped = []
-        for k, v in self.situation.all_guid_delete_info.items():
-            if v["side"] == self.guid:
-                popped.append(k)
-                if v["strType"] == 1005 and k in self.groups.keys():
-                    self.groups.pop(k)
-                    continue
-                if v["strType"] == 2001 and k in self.submarines.keys():
-                    self.submarines.pop(k)
-                    continue
-                if v["strType"] == 2002 and k in self.ships.keys():
-                    self.ships.pop(k)
-                    continue
-                if v["strType"] == 2003 and k in self.facilities.keys():
-                    self.facilities.pop(k)
-                    continue
-                if v["strType"] == 2004 and k in self.aircrafts.keys():
-                    self.aircrafts.pop(k)
-                    continue
-                if v["strType"] == 2005 and k in self.satellites.keys():
-                    self.satellites.pop(k)
-                    continue
-                if v["strType"] == 3005 and k in self.weapons.keys():
-                    self.weapons.pop(k)
-                    continue
-                if v["strType"] == 3006 and k in self.unguided_weapons.keys():
-                    self.unguided_weapons.pop(k)
-                    continue
-                if v["strType"] == 3008 and k in self.sideways.keys():
-                    self.sideways.pop(k)
-                    continue
-                if v["strType"] == 4001 and k in self.contacts.keys():
-                    self.contacts.pop(k)
-                    continue
-                if v["strType"] == 5001 and k in self.logged_messages.keys():
-                    self.logged_messages.pop(k)
-                    continue
-                if v["strType"] == 10001 and k in self.missions.keys():
-                    self.missions.pop(k)
-                    continue
-                if v["strType"] == 10001 and k in self.patrol_missions.keys():
-                    self.patrol_missions.pop(k)
-                    continue
-                if v["strType"] == 10002 and k in self.strike_missions.keys():
-                    self.strike_missions.pop(k)
-                    continue
-                if v["strType"] == 10003 and k in self.support_missions.keys():
-                    self.support_missions.pop(k)
-                    continue
-                if v["strType"] == 10004 and k in self.cargo_missions.keys():
-                    self.cargo_missions.pop(k)
-                    continue
-                if v["strType"] == 10005 and k in self.ferry_missions.keys():
-                    self.ferry_missions.pop(k)
-                    continue
-                if v["strType"] == 10006 and k in self.mining_missions.keys():
-                    self.mining_missions.pop(k)
-                    continue
-                if v["strType"] == 10007 and k in self.mine_clearing_missions.keys():
-                    self.mine_clearing_missions.pop(k)
-                    continue
-                if v["strType"] == 11001 and k in self.reference_points.keys():
-                    self.reference_points.pop(k)
-                    continue
-                if v["strType"] == 11002 and k in self.no_nav_zones.keys():
-                    self.no_nav_zones.pop(k)
-                    continue
-                if v["strType"] == 11003 and k in self.exclusion_zones.keys():
-                    self.exclusion_zones.pop(k)
+        """清除本方已处理的删除记录，对象集合已由态势在删除时同步更新"""
+        popped = [k for k, v in self.situation.all_guid_delete_info.items() if v["side"] == self.guid]
         for k in popped:
             self.situation.all_guid_delete_info.pop(k)
 
     def static_add(self):
-        """将推演方增加的准静态化对象进行更新"""
-        for k, v in self.situation.all_guid_add_info.items():
-            if v["side"] == self.guid:
-                if v["strType"] == 1005:
-                    self.groups.update({k: self.situation.group_dict[k]})
-                    continue
-                if v["strType"] == 2001:
-                    self.submarines.update({k: self.situation.submarine_dict[k]})
-                    continue
-                if v["strType"] == 2002:
-                    self.ships.update({k: self.situation.ship_dict[k]})
-                    continue
-                if v["strType"] == 2003:
-                    self.facilities.update({k: self.situation.facility_dict[k]})
-                    continue
-                if v["strType"] == 2004:
-                    self.aircrafts.update({k: self.situation.aircraft_dict[k]})
-                    continue
-                if v["strType"] == 2005:
-                    self.satellites.update({k: self.situation.satellite_dict[k]})
-                    continue
-                if v["strType"] == 3005:
-                    self.weapons.update({k: self.situation.weapon_dict[k]})
-                    continue
-                if v["strType"] == 3006:
-                    self.unguided_weapons.update({k: self.situation.unguided_weapon_dict[k]})
-                    continue
-                if v["strType"] == 3008:
-                    self.sideways.update({k: self.situation.sideway_dict[k]})
-                    continue
-                if v["strType"] == 4001:
-                    self.contacts.update({k: self.situation.contact_dict[k]})
-                    continue
-                if v["strType"] == 5001:
-                    self.logged_messages.update({k: self.situation.logged_messages_dict[k]})
-                    continue
-                if v["strType"] == 10001:
-                    self.patrol_missions.update({k: self.situation.mission_patrol_dict[k]})
-                    self.missions.update({k: self.situation.mission_patrol_dict[k]})
-                    continue
-                if v["strType"] == 10002:
-                    self.strike_missions.update({k: self.situation.mission_strike_dict[k]})
-                    self.missions.update({k: self.situation.mission_strike_dict[k]})
-                    continue
-                if v["strType"] == 10003:
-                    self.support_missions.update({k: self.situation.mission_support_dict[k]})
-                    self.missions.update({k: self.situation.mission_support_dict[k]})
-                    continue
-                if v["strType"] == 10004:
-                    self.cargo_missions.update({k: self.situation.mission_cargo_dict[k]})
-                    self.missions.update({k: self.situation.mission_cargo_dict[k]})
-                    continue
-                if v["strType"] == 10005:
-                    self.ferry_missions.update({k: self.situation.mission_ferry_dict[k]})
-                    self.missions.update({k: self.situation.mission_ferry_dict[k]})
-                    continue
-                if v["strType"] == 10006:
-                    self.mining_missions.update({k: self.situation.mission_mining_dict[k]})
-                    self.missions.update({k: self.situation.mission_mining_dict[k]})
-                    continue
-                if v["strType"] == 10007:
-                    self.mine_clearing_missions.update({k: self.situation.mission_mine_clearing_mission_dict[k]})
-                    self.missions.update({k: self.situation.mission_mine_clearing_mission_dict[k]})
-                    continue
-                if v["strType"] == 11001:
-                    self.reference_points.update({k: self.situation.reference_point_dict[k]})
-                    continue
-                if v["strType"] == 11002:
-                    self.no_nav_zones.update({k: self.situation.zone_no_nav_dict[k]})
-                    continue
-                if v["strType"] == 11003:
-                    self.exclusion_zones.update({k: self.situation.zone_exclusion_dict[k]})
+        """对象集合已由态势在新增时同步更新，保留该方法以兼容旧代码"""
 
     def get_doctrine(self) -> "CDoctrine | None":
         """获取推演方条令"""
@@ -363,11 +229,7 @@ class CSide(Base):
         Returns:
             dict 格式 {unit_guid_1: unit_obj_1, unit_guid_2: unit_obj_2, ...}  CGroup
         """
-        group_dic = {}
-        for k, v in self.situation.group_dict.items():
-            if v.side == self.guid:
-                group_dic[k] = v
-        return group_dic
+        return dict(self.groups)
 
     def get_submarines(self) -> dict[str, "CSubmarine"]:
         """
@@ -376,11 +238,7 @@ class CSide(Base):
         Returns:
             dict 格式 {unit_guid_1: unit_obj_1, unit_guid_2: unit_obj_2, ...}  CSubmarine
         """
-        submarine_dic = {}
-        for k, v in self.situation.submarine_dict.items():
-            if v.side == self.guid:
-                submarine_dic[k] = v
-        return submarine_dic
+        return dict(self.submarines)
 
     def get_ships(self) -> dict[str, "CShip"]:
         """
@@ -389,11 +247,7 @@ class CSide(Base):
         Returns:
             dict 格式 {unit_guid_1: unit_obj_1, unit_guid_2: unit_obj_2, ...}  CShip
         """
-        ship_dic = {}
-        for k, v in self.situation.ship_dict.items():
-            if v.side == self.guid:
-                ship_dic[k] = v
-        return ship_dic
+        return dict(self.ships)
 
     def get_facilities(self) -> dict[str, "CFacility"]:
         """
@@ -402,11 +256,7 @@ class CSide(Base):
         Returns:
             dict 格式 {unit_guid_1: unit_obj_1, unit_guid_2: unit_obj_2, ...}  CFacility
         """
-        facility_dic = {}
-        for k, v in self.situation.facility_dict.items():
-            if v.side == self.guid:
-                facility_dic[k] = v
-        return facility_dic
+        return dict(self.facilities)
 
     def get_aircrafts(self) -> dict[str, "CAircraft"]:
         """
@@ -415,11 +265,7 @@ class CSide(Base):
         Returns:
             dict 格式 {unit_guid_1: unit_obj_1, unit_guid_2: unit_obj_2, ...}  CAircraft
         """
-        aircrafts_dict = {}
-        for k, v in self.situation.aircraft_dict.items():
-            if v.side == self.guid:
-                aircrafts_dict[k] = v
-        return aircrafts_dict
+        return dict(self.aircrafts)
 
     def get_satellites(self) -> dict[str, "CSatellite"]:
         """
@@ -428,11 +274,7 @@ class CSide(Base):
         Returns:
             dict 格式 {unit_guid_1: unit_obj_1, unit_guid_2: unit_obj_2, ...}  CSatellite
         """
-        satellite_dic = {}
-        for k, v in self.situation.satellite_dict.items():
-            if v.side == self.guid:
-                satellite_dic[k] = v
-        return satellite_dic
+        return dict(self.satellites)
 
     def get_weapons(self) -> dict[str, "CWeapon"]:
         """
@@ -441,11 +283,7 @@ class CSide(Base):
         Returns:
             dict 格式 {unit_guid_1: unit_obj_1, unit_guid_2: unit_obj_2, ...}  CWeapon
         """
-        weapon_dic = {}
-        for k, v in self.situation.weapon_dict.items():
-            if v.side == self.guid:
-                weapon_dic[k] = v
-        return weapon_dic
+        return dict(self.weapons)
 
     def get_unguided_weapons(self) -> dict[str, "CWeapon"]:
         """
@@ -454,11 +292,7 @@ class CSide(Base):
         Returns:
             dict 格式 {unit_guid_1: unit_obj_1, unit_guid_2: unit_obj_2, ...}
         """
-        unguidedwpn_dic = {}
-        for k, v in self.situation.unguided_weapon_dict.items():
-            if v.side == self.guid:
-                unguidedwpn_dic[k] = v
-        return unguidedwpn_dic
+        return dict(self.unguided_weapons)
 
     def get_sideways(self) -> dict[str, "CSideWay"]:
         """
@@ -467,7 +301,7 @@ class CSide(Base):
         Returns:
             dict 格式 {unit_guid_1: unit_obj_1, unit_guid_2: unit_obj_2, ...}  CSideWay
         """
-        return {k: v for k, v in self.situation.sideway_dict.items() if v.side == self.guid}
+        return dict(self.sideways)
 
     def get_contacts(self) -> dict[str, "CContact"]:
         """
@@ -476,11 +310,7 @@ class CSide(Base):
         Returns:
             dict 格式 {contact_guid_1: contact_obj_1, contact_guid_2: contact_obj_2, ...}  CContact
         """
-        contact_dic = {}
-        for k, v in self.situation.contact_dict.items():
-            if v.original_detector_side == self.guid:  # changed by aie
-                contact_dic[k] = v
-        return contact_dic
+        return dict(self.contacts)
 
     def get_logged_messages(self) -> dict[str, "CLoggedMessage"]:
         """
@@ -489,11 +319,7 @@ class CSide(Base):
         Returns:
             dict 格式 {guid_1: _obj_1, guid_2: obj_2, ...}
         """
-        logged_messages = {}
-        for k, v in self.situation.logged_messages_dict.items():
-            if v.side == self.guid:
-                logged_messages[k] = v
-        return logged_messages
+        return dict(self.logged_messages)
 
     def get_patrol_missions(self) -> dict[str, "CPatrolMission"]:
         """
@@ -502,7 +328,7 @@ class CSide(Base):
         Returns:
             dict 格式 {mission_guid_1: mission_obj_1, mission_guid_2: mission_obj_2, ...}  CPatrolMission
         """
-        return {k: v for k, v in self.situation.mission_patrol_dict.items() if v.side == self.guid}
+        return dict(self.patrol_missions)
 
     def get_strike_missions(self) -> dict[str, "CStrikeMission"]:
         """
@@ -511,7 +337,7 @@ class CSide(Base):
         Returns:
             dict 格式 {mission_guid_1: mission_obj_1, mission_guid_2: mission_obj_2, ...}  CStrikeMission
         """
-        return {k: v for k, v in self.situation.mission_strike_dict.items() if v.side == self.guid}
+        return dict(self.strike_missions)
 
     def get_support_missions(self) -> dict[str, "CSupportMission"]:
         """
@@ -520,7 +346,7 @@ class CSide(Base):
         Returns:
             dict 格式 {mission_guid_1: mission_obj_1, mission_guid_2: mission_obj_2, ...}  CSupportMission
         """
-        return {k: v for k, v in self.situation.mission_support_dict.items() if v.side == self.guid}
+        return dict(self.support_missions)
 
     def get_cargo_missions(self) -> dict[str, "CCargoMission"]:
         """
@@ -529,7 +355,7 @@ class CSide(Base):
         Returns:
             dict 格式 {mission_guid_1: mission_obj_1, mission_guid_2: mission_obj_2, ...}  CCargoMission
         """
-        return {k: v for k, v in self.situation.mission_cargo_dict.items() if v.side == self.guid}
+        return dict(self.cargo_missions)
 
     def get_ferry_missions(self) -> dict[str, "CFerryMission"]:
         """
@@ -538,7 +364,7 @@ class CSide(Base):
         Returns:
             dict 格式 {mission_guid_1: mission_obj_1, mission_guid_2: mission_obj_2, ...}  CFerryMission
         """
-        return {k: v for k, v in self.situation.mission_ferry_dict.items() if v.side == self.guid}
+        return dict(self.ferry_missions)
 
     def get_mining_missions(self) -> dict[str, "CMiningMission"]:
         """
@@ -547,7 +373,7 @@ class CSide(Base):
         Returns:
             dict 格式 {mission_guid_1: mission_obj_1, mission_guid_2: mission_obj_2, ...}  CMiningMission
         """
-        return {k: v for k, v in self.situation.mission_mining_dict.items() if v.side == self.guid}
+        return dict(self.mining_missions)
 
     def get_missions_by_name(self, name: str) -> dict[str, "CMission"]:
         """
@@ -556,7 +382,7 @@ class CSide(Base):
         Returns:
             dict 格式 {mission_guid_1: mission_obj_1, mission_guid_2: mission_obj_2, ...}  CMission
         """
-        return {k: v for k, v in self.missions.items() if v.name == name}
+        return self.situation.find_objects("missions", "name", name, side=self.guid)
         # # 临时需改，by 赵俊义
         # for k, v in self.missions.items():
         #     if v.name == name:
@@ -569,7 +395,7 @@ class CSide(Base):
         Returns:
             dict 格式 {mission_guid_1: mission_obj_1, mission_guid_2: mission_obj_2, ...}  CMineClearingMission
         """
-        return {k: v for k, v in self.situation.mission_mine_clearing_mission_dict.items() if v.side == self.guid}
+        return dict(self.mine_clearing_missions)
 
     def get_reference_points(self) -> dict[str, "CReferencePoint"]:
         """
@@ -578,11 +404,7 @@ class CSide(Base):
         Returns:
             dict 格式 {item_guid_1: item_obj_1, item_guid_2: item_obj_2, ...}  CReferencePoint
         """
-        referencept_dic = {}
-        for k, v in self.situation.reference_point_dict.items():
-            if v.side == self.guid:
-                referencept_dic[k] = v
-        return referencept_dic
+        return dict(self.reference_points)
 
     def get_no_nav_zones(self) -> dict[str, "CNoNavZone"]:
         """
@@ -591,11 +413,7 @@ class CSide(Base):
         Returns:
             dict 格式 {item_guid_1: item_obj_1, item_guid_2: item_obj_2, ...}  CNoNavZone
         """
-        zonenonav_dic = {}
-        for k, v in self.situation.zone_no_nav_dict.items():
-            if v.side == self.guid:
-                zonenonav_dic[k] = v
-        return zonenonav_dic
+        return dict(self.no_nav_zones)
 
     async def set_reference_point(self, name: str, latitude: float | int, longitude: float | int) -> bool:
         """
@@ -625,11 +443,7 @@ class CSide(Base):
         Returns:
             dict 格式 {item_guid_1: item_obj_1, item_guid_2: item_obj_2, ...}  CExclusionZone
         """
-        zonexclsn_dic = {}
-        for k, v in self.situation.zone_exclusion_dict.items():
-            if v.side == self.guid:
-                zonexclsn_dic[k] = v
-        return zonexclsn_dic
+        return dict(self.exclusion_zones)
 
     def get_score(self) -> float:
         """
@@ -692,7 +506,91 @@ class CSide(Base):
             dict 格式 {item_guid_1: item_obj_1, item_guid_2: item_obj_2, ...}  CContact
         """
         # 需求来源：20200330-1.3/3:lzy
-        return {k: v for k, v in self.contacts.items() if v.name == name}
+        return self.situation.find_objects("contact_dict", "name", name, side=self.guid)
+
+    def get_contacts_within(self, latitude: float, longitude: float, radius_km: float) -> dict[str, "CContact"]:
+        """
+        获取与某点距离不超过 radius_km 的目标，使用态势维护的空间索引，不访问服务端
+
+        Args:
+            latitude (float): 纬度
+            longitude (float): 经度
+            radius_km (float): 半径，单位千米
+
+        Returns:
+            dict 格式 {item_guid_1: item_obj_1, ...}  CContact，按距离由近到远排列
+        """
+        index = self.situation.get_spatial_index(self.guid, "contact_dict")
+        return {guid: obj for _, guid, obj in index.within_radius(latitude, longitude, radius_km)}
+
+    def get_nearest_contacts(self, latitude: float, longitude: float, k: int = 1) -> dict[str, "CContact"]:
+        """
+        获取距离某点最近的 k 个目标
+
+        Args:
+            latitude (float): 纬度
+            longitude (float): 经度
+            k (int): 数量
+
+        Returns:
+            dict 格式 {item_guid_1: item_obj_1, ...}  CContact，按距离由近到远排列
+        """
+        index = self.situation.get_spatial_index(self.guid, "contact_dict")
+        return {guid: obj for _, guid, obj in index.nearest(latitude, longitude, k)}
+
+    def get_contacts_in_area(self, points: list[tuple[float, float]]) -> dict[str, "CContact"]:
+        """
+        获取多边形区域内的目标
+
+        Args:
+            points (list[tuple[float, float]]): 多边形顶点 [(lat, lon), ...]
+
+        Returns:
+            dict 格式 {item_guid_1: item_obj_1, ...}  CContact
+        """
+        return self.situation.get_spatial_index(self.guid, "contact_dict").within_polygon(points)
+
+    def get_units_within(self, latitude: float, longitude: float, radius_km: float) -> dict[str, "CActiveUnit"]:
+        """
+        获取本方与某点距离不超过 radius_km 的活动单元（不含编组）
+
+        Args:
+            latitude (float): 纬度
+            longitude (float): 经度
+            radius_km (float): 半径，单位千米
+
+        Returns:
+            dict 格式 {unit_guid_1: unit_obj_1, ...}，按距离由近到远排列
+        """
+        index = self.situation.get_spatial_index(self.guid, "units")
+        return {guid: obj for _, guid, obj in index.within_radius(latitude, longitude, radius_km)}
+
+    def get_nearest_units(self, latitude: float, longitude: float, k: int = 1) -> dict[str, "CActiveUnit"]:
+        """
+        获取本方距离某点最近的 k 个活动单元（不含编组）
+
+        Args:
+            latitude (float): 纬度
+            longitude (float): 经度
+            k (int): 数量
+
+        Returns:
+            dict 格式 {unit_guid_1: unit_obj_1, ...}，按距离由近到远排列
+        """
+        index = self.situation.get_spatial_index(self.guid, "units")
+        return {guid: obj for _, guid, obj in index.nearest(latitude, longitude, k)}
+
+    def get_units_in_area(self, points: list[tuple[float, float]]) -> dict[str, "CActiveUnit"]:
+        """
+        获取本方在多边形区域内的活动单元（不含编组）
+
+        Args:
+            points (list[tuple[float, float]]): 多边形顶点 [(lat, lon), ...]
+
+        Returns:
+            dict 格式 {unit_guid_1: unit_obj_1, ...}
+        """
+        return self.situation.get_spatial_index(self.guid, "units").within_polygon(points)
 
     async def get_elevation(self, coordinate: tuple[float, float]) -> float:
         """
@@ -1160,11 +1058,8 @@ class CSide(Base):
         Returns:
             None 或 参考点对象
         """
-        ref_points = self.get_reference_points()
-        for v in ref_points.values():
-            if v.name == name:
-                return v
-        return None
+        ref_points = self.situation.find_objects("reference_point_dict", "name", name, side=self.guid)
+        return next(iter(ref_points.values()), None)
 
     @validate_uuid4_args(["contact_guid"])
     async def assign_target_to_mission(self, contact_guid: str, mission_name_or_guid: str) -> bool:
@@ -1492,6 +1387,9 @@ class CSide(Base):
         Returns:
             bool
         """
+        # 先按名称精确查找索引，未命中时再按包含关系遍历目标
+        if self.situation.find_objects("contact_dict", "name", target_name, side=self.guid):
+            return True
         ret = self.get_guid_from_name(target_name, self.contacts)
         if ret:
             return True
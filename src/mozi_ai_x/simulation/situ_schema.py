@@ -0,0 +1,143 @@
+"""
+态势数据的结构化解码
+
+CAircraft、CShip、CContact、CWeapon 是态势数据中数量最多的对象。JSON 解码后端为 msgspec 时，
+这几类对象按 var_map 生成结构体，直接从 JSON 字节解码为字段值并赋给对象属性，不构建中间字典；
+其余类型仍解码为字典，交给通用流程处理。其他解码后端下本模块只是对 json_codec.loads 的封装。
+
+结构体需要为 var_map 中的每个字段分配位置，只适合字段齐全的全量数据（GetAllState）；
+增量数据（UpdateState）每个对象只有少量字段，解码为字典后由 VarMapParser 处理更快。
+"""
+
+from collections.abc import Iterable, Iterator
+from itertools import compress, repeat
+from operator import is_not
+from typing import Any, ClassVar, Protocol
+
+from ..utils import json_codec
+from ..utils.log import mprint_with_name
+from .base.base import get_var_map_parser
+from .situ_interpret import CAircraftDict, CShipDict, CContactDict, CWeaponDict
+
+mprint = mprint_with_name("SituSchema")
+
+# 使用结构化解码的类型
+TYPED_CLASSES = {
+    "CAircraft": CAircraftDict.var_map,
+    "CShip": CShipDict.var_map,
+    "CContact": CContactDict.var_map,
+    "CWeapon": CWeaponDict.var_map,
+}
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class SituationRecord(Protocol):
+    """
+    结构化解码得到的对象数据，仅包含本次返回中出现的字段
+
+    由 msgspec 结构体实现（见 _build_struct），结构体不能继承 Protocol，运行时不能用 isinstance 判断：
+    decode_situation 的结果中不是 dict 的对象即为 SituationRecord。
+    """
+
+    class_name: str
+    strGuid: Any
+
+    def apply_to(self, obj, changes: dict[str, tuple[Any, Any]] | None = None) -> None:
+        """
+        将字段值赋给对象属性，与 BaseObject.parse 的效果一致
+
+        Args:
+            obj: 态势对象
+            changes: 传入时记录取值发生变化的属性，{属性名: (旧值, 新值)}
+        """
+        ...
+
+
+if msgspec is not None:
+    UNSET = msgspec.UNSET
+
+    class _Head(msgspec.Struct):
+        """只解码类名和 GUID，其余字段被跳过"""
+
+        ClassName: str = ""
+        strGuid: str = ""
+
+    class _RecordStruct(msgspec.Struct):
+        """SituationRecord 的实现，各类型的结构体由 _build_struct 生成"""
+
+        class_name: ClassVar[str] = ""
+        _var_map: ClassVar[dict[str, str]] = {}
+        # 与结构体字段一一对应的 JSON 键和对象属性名
+        _keys: ClassVar[tuple[str, ...]] = ()
+        _attrs: ClassVar[tuple[str, ...]] = ()
+
+        def apply_to(self, obj, changes=None, _astuple=msgspec.structs.astuple, _unset=UNSET) -> None:
+            values = _astuple(self)
+            present = map(is_not, values, repeat(_unset))
+            parser = get_var_map_parser(obj.__class__, self._var_map)
+            if changes is not None:
+                parser.parse(obj, dict(compress(zip(self._keys, values, strict=True), present)), changes)
+            elif parser.all_plain:
+                obj.__dict__.update(compress(zip(self._attrs, values, strict=True), present))
+            else:
+                parser.parse(obj, dict(compress(zip(self._keys, values, strict=True), present)))
+
+    def _build_struct(class_name: str, var_map: dict[str, str]) -> type:
+        return msgspec.defstruct(
+            f"{class_name}Record",
+            [(key, Any, UNSET) for key in var_map],
+            bases=(_RecordStruct,),
+            namespace={
+                "class_name": class_name,
+                "_var_map": var_map,
+                "_keys": tuple(var_map),
+                "_attrs": tuple(var_map.values()),
+            },
+        )
+
+    _raw_decoder = msgspec.json.Decoder(dict[str, msgspec.Raw])
+    _head_decoder = msgspec.json.Decoder(_Head)
+    _dict_decoder = msgspec.json.Decoder()
+    _record_decoders = {
+        class_name: msgspec.json.Decoder(_build_struct(class_name, var_map)) for class_name, var_map in TYPED_CLASSES.items()
+    }
+
+
+def _iter_typed(raw_items: Iterable) -> Iterator[dict | SituationRecord]:
+    for raw in raw_items:
+        record_decoder = _record_decoders.get(_head_decoder.decode(raw).ClassName)
+        if record_decoder is None:
+            yield _dict_decoder.decode(raw)
+        else:
+            yield record_decoder.decode(raw)
+
+
+def decode_situation(data: str | bytes, backend: str | None = None, typed: bool = True) -> Iterable[dict | SituationRecord]:
+    """
+    解码 GetAllState/UpdateState 返回的态势数据
+
+    Args:
+        data: 服务端返回的 JSON 数据
+        backend: 解码后端，默认使用 json_codec 启动时选定的后端
+        typed: 是否对热点类型使用结构化解码，增量数据应传入 False
+
+    Returns:
+        Iterable[dict | SituationRecord]: 态势对象数据，热点类型在 msgspec 后端下为 SituationRecord，
+            其余为字典
+    """
+    backend = backend or json_codec.json_backend
+    if typed and backend == "msgspec" and msgspec is not None:
+        try:
+            # 顶层先完整校验一遍，出错时在应用任何对象之前退回字典解码
+            raw_items = _raw_decoder.decode(data).values()
+        except msgspec.DecodeError:
+            return json_codec.loads(data).values()
+        return _iter_typed(raw_items)
+
+    if backend == json_codec.json_backend:
+        return json_codec.loads(data).values()
+    return json_codec.get_decoder(backend)(data).values()
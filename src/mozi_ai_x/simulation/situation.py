@@ -1,8 +1,11 @@
-import json
 import uuid
 import asyncio
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+from numpy.typing import DTypeLike
+
 from .doctrine import CDoctrine
 from .weather import CWeather
 from .side import CSide
@@ -65,8 +68,14 @@ from .zone import (
 )
 from .reference_point import CReferencePoint
 from .response import CResponse
+from .situ_schema import SituationRecord, decode_situation
+from .guid_registry import GuidRegistry
+from .base.base import MISSING
 
 from ..utils.log import mprint_with_name
+from ..utils.json_stream import JsonObjectStreamDecoder
+from ..utils.spatial import SpatialIndex
+from .columns import UnitColumns
 from mozi_ai_x.utils.validator import validate_uuid4_args
 
 if TYPE_CHECKING:
@@ -75,6 +84,10 @@ if TYPE_CHECKING:
 
 mprint = mprint_with_name("Situation")
 
+# 建立索引的对象属性：名称、数据库ID、单元类型
+INDEXED_ATTRS = ("name", "db_id", "unit_class")
+_UNINDEXED = (MISSING,) * len(INDEXED_ATTRS)
+
 
 class ObjectType:
     """
@@ -168,6 +181,7 @@ class HandlerRegistry:
     def __init__(self):
         self._handlers = {}
         self._type_mapping = {}
+        self._groups: dict[str, list[str]] = {}  # 分组包含的对象字典名称
 
     def register(
         self,
@@ -177,16 +191,34 @@ class HandlerRegistry:
         obj_type: int,
         has_side: bool = False,
         is_active: bool = False,
+        side_attr: str | None = "side",
+        groups: tuple[str, ...] = (),
+        indexed: bool = False,
+        spatial_key: str | None = None,
     ):
-        """完整注册方法"""
+        """
+        完整注册方法
+
+        Args:
+            side_attr: 按推演方建立索引时使用的属性，None 表示不建立索引
+            groups: 建立索引时额外归入的分组（如各类任务统一归入 missions，活动单元归入 units）
+            indexed: 是否按名称、数据库ID、单元类型建立索引
+            spatial_key: 按经纬度建立空间索引时使用的名称，None 表示不建立空间索引；需同时按推演方建立索引
+        """
         self._handlers[class_name] = {
             "class": cls,
             "dict": dict_name,
             "type": obj_type,
             "has_side": has_side,
             "is_active": is_active,
+            "side_attr": side_attr if has_side else None,
+            "index_keys": (dict_name, *groups),
+            "indexed": indexed,
+            "spatial_key": spatial_key,
         }
-        self._type_mapping[obj_type] = {"dict": dict_name, "has_side": has_side}
+        self._type_mapping[obj_type] = self._handlers[class_name]
+        for group in groups:
+            self._groups.setdefault(group, []).append(dict_name)
 
     def get_type_handler(self, obj_type: int) -> dict | None:
         """
@@ -197,38 +229,114 @@ class HandlerRegistry:
             包含以下信息的字典：
             - dict: 对应的对象字典名称（如'ship_dict'）
             - has_side: 是否关联阵营
-            - is_active: 是否活动单元（可选）
+            - is_active: 是否活动单元
+            - side_attr: 按推演方建立索引时使用的属性
+            - index_keys: 建立索引时使用的名称（对象字典名称及所属分组）
+            - indexed: 是否按名称、数据库ID、单元类型建立索引
+            - spatial_key: 空间索引名称
         """
         return self._type_mapping.get(obj_type)
 
     def get_handler(self, class_name: str):
         return self._handlers.get(class_name)
 
+    def get_dict_handler(self, dict_name: str) -> dict | None:
+        """根据对象字典名称获取处理信息"""
+        for handler in self._handlers.values():
+            if handler["dict"] == dict_name:
+                return handler
+        return None
+
+    def get_dict_names(self, key: str) -> list[str]:
+        """获取分组包含的对象字典名称，key 不是分组时返回 [key]"""
+        return self._groups.get(key, [key])
+
 
 # 初始化注册表（完整版）
 registry = HandlerRegistry()
 
 registry.register("CDoctrine", CDoctrine, "doctrine_dict", ObjectType.DOCTRINE)
-registry.register("CSide", CSide, "side_dict", ObjectType.SIDE, has_side=True, is_active=True)
+registry.register("CSide", CSide, "side_dict", ObjectType.SIDE, has_side=True, is_active=True, side_attr=None)
 
 # 环境系统
 registry.register("CWeather", CWeather, "weather_dict", ObjectType.WEATHER)
 
 # 军事单元
-registry.register("CGroup", CGroup, "group_dict", ObjectType.GROUP, has_side=True, is_active=True)
-registry.register("CSubmarine", CSubmarine, "submarine_dict", ObjectType.SUBMARINE, has_side=True, is_active=True)
-registry.register("CShip", CShip, "ship_dict", ObjectType.SHIP, has_side=True, is_active=True)
-registry.register("CFacility", CFacility, "facility_dict", ObjectType.FACILITY, has_side=True, is_active=True)
-registry.register("CAircraft", CAircraft, "aircraft_dict", ObjectType.AIRCRAFT, has_side=True, is_active=True)
-registry.register("CSatellite", CSatellite, "satellite_dict", ObjectType.SATELLITE, has_side=True, is_active=True)
+registry.register("CGroup", CGroup, "group_dict", ObjectType.GROUP, has_side=True, is_active=True, indexed=True)
+registry.register(
+    "CSubmarine",
+    CSubmarine,
+    "submarine_dict",
+    ObjectType.SUBMARINE,
+    has_side=True,
+    is_active=True,
+    groups=("units",),
+    spatial_key="units",
+    indexed=True,
+)
+registry.register(
+    "CShip",
+    CShip,
+    "ship_dict",
+    ObjectType.SHIP,
+    has_side=True,
+    is_active=True,
+    groups=("units",),
+    spatial_key="units",
+    indexed=True,
+)
+registry.register(
+    "CFacility",
+    CFacility,
+    "facility_dict",
+    ObjectType.FACILITY,
+    has_side=True,
+    is_active=True,
+    groups=("units",),
+    spatial_key="units",
+    indexed=True,
+)
+registry.register(
+    "CAircraft",
+    CAircraft,
+    "aircraft_dict",
+    ObjectType.AIRCRAFT,
+    has_side=True,
+    is_active=True,
+    groups=("units",),
+    spatial_key="units",
+    indexed=True,
+)
+registry.register(
+    "CSatellite",
+    CSatellite,
+    "satellite_dict",
+    ObjectType.SATELLITE,
+    has_side=True,
+    is_active=True,
+    groups=("units",),
+    spatial_key="units",
+    indexed=True,
+)
 
 # 传感器与武器系统
 registry.register("CSensor", CSensor, "sensor_dict", ObjectType.SENSOR)
 registry.register("CLoadout", CLoadout, "loadout_dict", ObjectType.LOADOUT)
 registry.register("CMount", CMount, "mount_dict", ObjectType.MOUNT)
 registry.register("CMagazine", CMagazine, "magazine_dict", ObjectType.MAGAZINE)
-registry.register("CWeapon", CWeapon, "weapon_dict", ObjectType.WEAPON, has_side=True)
-registry.register("CUnguidedWeapon", CUnguidedWeapon, "unguided_weapon_dict", ObjectType.UNGUIDED_WEAPON, has_side=True)
+registry.register(
+    "CWeapon", CWeapon, "weapon_dict", ObjectType.WEAPON, has_side=True, groups=("units",), spatial_key="units", indexed=True
+)
+registry.register(
+    "CUnguidedWeapon",
+    CUnguidedWeapon,
+    "unguided_weapon_dict",
+    ObjectType.UNGUIDED_WEAPON,
+    has_side=True,
+    groups=("units",),
+    spatial_key="units",
+    indexed=True,
+)
 registry.register("CWeaponImpact", CWeaponImpact, "weapon_impact_dict", ObjectType.WEAPON_IMPACT)
 
 # 路径与导航
@@ -236,7 +344,16 @@ registry.register("CSideWay", CSideWay, "sideway_dict", ObjectType.SIDEWAY, has_
 registry.register("CWayPoint", CWayPoint, "waypoint_dict", ObjectType.WAYPOINT)
 
 # 战场感知
-registry.register("CContact", CContact, "contact_dict", ObjectType.CONTACT, has_side=True)
+registry.register(
+    "CContact",
+    CContact,
+    "contact_dict",
+    ObjectType.CONTACT,
+    has_side=True,
+    side_attr="original_detector_side",
+    indexed=True,
+    spatial_key="contact_dict",
+)
 
 # 日志系统
 registry.register("CLoggedMessage", CLoggedMessage, "logged_messages_dict", ObjectType.LOGGED_MESSAGE, has_side=True)
@@ -290,22 +407,74 @@ registry.register("CActionEndScenario", CActionEndScenario, "action_end_scenario
 registry.register("CActionLuaScript", CActionLuaScript, "action_lua_script_dict", ObjectType.ACTION_LUA_SCRIPT)
 
 # 任务系统
-registry.register("CPatrolMission", CPatrolMission, "mission_patrol_dict", ObjectType.PATROL_MISSION, has_side=True)
-registry.register("CStrikeMission", CStrikeMission, "mission_strike_dict", ObjectType.STRIKE_MISSION, has_side=True)
-registry.register("CSupportMission", CSupportMission, "mission_support_dict", ObjectType.SUPPORT_MISSION, has_side=True)
-registry.register("CCargoMission", CCargoMission, "mission_cargo_dict", ObjectType.CARGO_MISSION, has_side=True)
-registry.register("CFerryMission", CFerryMission, "mission_ferry_dict", ObjectType.FERRY_MISSION, has_side=True)
-registry.register("CMiningMission", CMiningMission, "mission_mining_dict", ObjectType.MINING_MISSION, has_side=True)
+registry.register(
+    "CPatrolMission",
+    CPatrolMission,
+    "mission_patrol_dict",
+    ObjectType.PATROL_MISSION,
+    has_side=True,
+    groups=("missions",),
+    indexed=True,
+)
+registry.register(
+    "CStrikeMission",
+    CStrikeMission,
+    "mission_strike_dict",
+    ObjectType.STRIKE_MISSION,
+    has_side=True,
+    groups=("missions",),
+    indexed=True,
+)
+registry.register(
+    "CSupportMission",
+    CSupportMission,
+    "mission_support_dict",
+    ObjectType.SUPPORT_MISSION,
+    has_side=True,
+    groups=("missions",),
+    indexed=True,
+)
+registry.register(
+    "CCargoMission",
+    CCargoMission,
+    "mission_cargo_dict",
+    ObjectType.CARGO_MISSION,
+    has_side=True,
+    groups=("missions",),
+    indexed=True,
+)
+registry.register(
+    "CFerryMission",
+    CFerryMission,
+    "mission_ferry_dict",
+    ObjectType.FERRY_MISSION,
+    has_side=True,
+    groups=("missions",),
+    indexed=True,
+)
+registry.register(
+    "CMiningMission",
+    CMiningMission,
+    "mission_mining_dict",
+    ObjectType.MINING_MISSION,
+    has_side=True,
+    groups=("missions",),
+    indexed=True,
+)
 registry.register(
     "CMineClearingMission",
     CMineClearingMission,
     "mission_mine_clearing_mission_dict",
     ObjectType.MINE_CLEARING_MISSION,
     has_side=True,
+    groups=("missions",),
+    indexed=True,
 )
 
 # 地理要素
-registry.register("CReferencePoint", CReferencePoint, "reference_point_dict", ObjectType.REFERENCE_POINT, has_side=True)
+registry.register(
+    "CReferencePoint", CReferencePoint, "reference_point_dict", ObjectType.REFERENCE_POINT, has_side=True, indexed=True
+)
 registry.register("CNoNavZone", CNoNavZone, "zone_no_nav_dict", ObjectType.NO_NAV_ZONE, has_side=True)
 registry.register("CExclusionZone", CExclusionZone, "zone_exclusion_dict", ObjectType.EXCLUSION_ZONE, has_side=True)
 
@@ -322,9 +491,24 @@ class CSituation:
         # 基础服务
         self.mozi_server = mozi_server
         self.all_guid_info: dict[str, dict] = {}  # 所有GUID的元信息
-        self.all_guid: list[str] = []  # 全局GUID集合
+        self.all_guid: GuidRegistry = GuidRegistry()  # 全局GUID集合，兼容原 list 接口
         self.all_guid_delete_info: dict[str, dict] = {}  # 最近删除的GUID信息
         self.all_guid_add_info: dict[str, dict] = {}  # 新增GUID信息记录
+        # 本次更新中已有对象的属性变化 {guid: {属性名: (旧值, 新值)}}
+        self.changed_fields: dict[str, dict[str, tuple[Any, Any]]] = {}
+        self.track_changes: bool = True  # 是否在更新态势时记录属性变化
+        # 按推演方划分的对象索引 {推演方guid: {对象字典名称: {guid: obj}}}，在解析时增量维护
+        self.side_index: dict[str | None, dict[str, dict[str, Any]]] = {}
+        self._object_side: dict[str, str | None] = {}  # 对象当前所在索引的推演方
+        # 按属性值划分的对象索引 {(索引名称, 属性名): {属性值: {guid: obj}}}，属性见 INDEXED_ATTRS
+        self.attr_index: dict[tuple[str, str], dict[Any, dict[str, Any]]] = {}
+        self._object_attrs: dict[str, tuple] = {}  # 对象当前被索引的属性值
+        # 按推演方划分的空间索引 {side_guid: {索引名称: SpatialIndex}}，索引名称为 units 或 contact_dict
+        self.spatial_index: dict[str | None, dict[str, SpatialIndex]] = {}
+        self.spatial_cell_size = 1.0  # 空间索引的网格大小（度），需在解析态势前设置
+        self._object_spatial: dict[str, SpatialIndex] = {}  # 对象当前所在的空间索引
+        # 列式快照 {对象字典名称: UnitColumns}，首次调用 get_columns 时创建
+        self.columns: dict[str, UnitColumns] = {}
 
         # 对象存储初始化（与注册表严格对应）
         self.doctrine_dict: dict[str, CDoctrine] = {}
@@ -384,6 +568,8 @@ class CSituation:
         self.pseudo_situ_all_guid: list[str] = []
         self.pseudo_situ_all_name: list[str] = []
         self.update_start: bool = False
+        # 服务端是否支持流式态势更新，收到 UNIMPLEMENTED 后置为 False
+        self.stream_supported: bool = True
 
         # 注册表实例（全功能版）
         self.registry = registry
@@ -472,12 +658,22 @@ class CSituation:
                 raise TimeoutError("想定加载超时")
 
         response = await self.mozi_server.send_and_recv("GetAllState")
-        self._parse_full_situation(json.loads(response.raw_data), scenario)
+        self._parse_full_situation(decode_situation(response.raw_data), scenario)
+
+    def _parse_full_situation(self, situation_data: "dict | Iterable[dict | SituationRecord]", scenario: "CScenario"):
+        """
+        解析完整态势
 
-    def _parse_full_situation(self, situation_data: dict, scenario: "CScenario"):
-        """解析完整态势"""
-        for data in situation_data.values():
-            if data["ClassName"] == "CCurrentScenario":
+        Args:
+            situation_data: 态势字典，或 decode_situation 的解码结果
+            scenario: 想定类对象
+        """
+        if isinstance(situation_data, dict):
+            situation_data = situation_data.values()
+        for data in situation_data:
+            if not isinstance(data, dict):
+                self._parse_generic(data)
+            elif data["ClassName"] == "CCurrentScenario":
                 scenario.parse(data)
             elif data["ClassName"] == "CResponse":
                 self.parse_response(data)
@@ -486,21 +682,24 @@ class CSituation:
             else:
                 self._parse_generic(data)
 
-    def _parse_generic(self, data: dict):
+    def _parse_generic(self, data: "dict | SituationRecord"):
         """通用对象解析逻辑"""
-        handler = self.registry.get_handler(data["ClassName"])
+        if isinstance(data, dict):
+            class_name, guid = data["ClassName"], data["strGuid"]
+        else:
+            class_name, guid = data.class_name, data.strGuid
+        handler = self.registry.get_handler(class_name)
         if not handler:
-            mprint.warning(f"未注册的对象类型: {data['ClassName']}")
+            mprint.warning(f"未注册的对象类型: {class_name}")
             return
 
         # 获取存储字典
         obj_dict = self.object_dict_map[handler["dict"]]
-        guid = data["strGuid"]
 
         # 处理新增对象
         if guid not in self.all_guid_info:
             obj = handler["class"](guid, self.mozi_server, self)
-            obj.parse(data)
+            self._apply_data(obj, data)
 
             # 记录元信息
             meta = {"strType": handler["type"]}
@@ -518,8 +717,243 @@ class CSituation:
             # 存储对象
             obj_dict[guid] = obj
         else:
-            # 更新已有对象
-            obj_dict[guid].parse(data)
+            obj = obj_dict[guid]
+            if self.update_start and self.track_changes:
+                # 更新已有对象，并记录属性变化
+                changes = self.changed_fields.setdefault(guid, {})
+                self._apply_data(obj, data, changes)
+                if not changes:
+                    del self.changed_fields[guid]
+            else:
+                # 更新已有对象
+                self._apply_data(obj, data)
+
+        # 新增对象或推演方发生变化时更新推演方索引
+        if handler["side_attr"] is not None:
+            side = getattr(obj, handler["side_attr"], None)
+            if self._object_side.get(guid, MISSING) != side:
+                self._index_side(guid, obj, side, handler["index_keys"])
+                if handler["spatial_key"] is not None:
+                    self._move_spatial(guid, side, handler["spatial_key"])
+        if handler["indexed"]:
+            self._index_attrs(guid, obj, handler["dict"])
+        if handler["spatial_key"] is not None:
+            obj_attrs = obj.__dict__
+            self._object_spatial[guid].update(guid, obj, obj_attrs.get("latitude"), obj_attrs.get("longitude"))
+        columns = self.columns.get(handler["dict"])
+        if columns is not None:
+            columns.mark(guid, obj)
+
+    def _index_side(self, guid: str, obj: Any, side: str | None, index_keys: tuple[str, ...]):
+        """将对象移入新推演方的索引"""
+        self._unindex_side(guid, index_keys)
+        side_objects = self.side_index.setdefault(side, {})
+        for key in index_keys:
+            side_objects.setdefault(key, {})[guid] = obj
+        self._object_side[guid] = side
+
+    def _unindex_side(self, guid: str, index_keys: tuple[str, ...]):
+        """将对象从所属推演方的索引中移除"""
+        side = self._object_side.pop(guid, MISSING)
+        if side is MISSING:
+            return
+        side_objects = self.side_index.get(side, {})
+        for key in index_keys:
+            side_objects.get(key, {}).pop(guid, None)
+
+    def _index_attrs(self, guid: str, obj: Any, dict_name: str):
+        """对象新增或名称等属性变化时更新属性索引"""
+        obj_attrs = obj.__dict__
+        values = tuple(obj_attrs.get(attr, MISSING) for attr in INDEXED_ATTRS)
+        old_values = self._object_attrs.get(guid)
+        if old_values == values:
+            return
+        self._object_attrs[guid] = values
+
+        attr_index = self.attr_index
+        for attr, old_value, value in zip(INDEXED_ATTRS, old_values or _UNINDEXED, values, strict=True):
+            if old_value == value:
+                continue
+            index = attr_index.setdefault((dict_name, attr), {})
+            if old_value is not MISSING:
+                self._remove_from_attr_index(index, old_value, guid)
+            if value is not MISSING:
+                index.setdefault(value, {})[guid] = obj
+
+    def _unindex_attrs(self, guid: str, dict_name: str):
+        """将对象从属性索引中移除"""
+        values = self._object_attrs.pop(guid, None)
+        if values is None:
+            return
+        for attr, value in zip(INDEXED_ATTRS, values, strict=True):
+            if value is not MISSING:
+                self._remove_from_attr_index(self.attr_index.get((dict_name, attr), {}), value, guid)
+
+    @staticmethod
+    def _remove_from_attr_index(index: dict[Any, dict[str, Any]], value: Any, guid: str):
+        objects = index.get(value)
+        if objects is None:
+            return
+        objects.pop(guid, None)
+        if not objects:
+            del index[value]
+
+    def find_objects(self, key: str, attr: str, value: Any, side: str | None = None) -> dict[str, Any]:
+        """
+        按名称、数据库ID或单元类型查询对象，O(1) 查找，与态势更新保持同步
+
+        Args:
+            key: 对象字典名称，如 aircraft_dict、contact_dict；
+                也可使用分组 units（全部活动单元，不含编组）或 missions（全部任务）
+            attr: 属性名，name、db_id 或 unit_class
+            value: 属性值
+            side: 推演方 GUID，指定时只返回该推演方的对象（目标按原始探测方判断）
+
+        Returns:
+            dict: {guid: obj}
+
+        Raises:
+            ValueError: 不支持按该属性查询
+        """
+        if attr not in INDEXED_ATTRS:
+            raise ValueError(f"不支持按 {attr} 查询，可选值为 {INDEXED_ATTRS}")
+        result = {}
+        for dict_name in self.registry.get_dict_names(key):
+            objects = self.attr_index.get((dict_name, attr), {}).get(value)
+            if objects:
+                result.update(objects)
+        if side is not None:
+            object_side = self._object_side
+            result = {guid: obj for guid, obj in result.items() if object_side.get(guid) == side}
+        return result
+
+    def _move_spatial(self, guid: str, side: str | None, key: str):
+        """对象新增或推演方变化时将其移入新推演方的空间索引，位置随后由 SpatialIndex.update 写入"""
+        old_index = self._object_spatial.get(guid)
+        if old_index is not None:
+            old_index.remove(guid)
+        self._object_spatial[guid] = self.get_spatial_index(side, key)
+
+    def get_spatial_index(self, side_guid: str | None, key: str) -> SpatialIndex:
+        """
+        获取推演方的空间索引
+
+        返回的索引由态势维护，随对象位置更新，调用方不应修改。
+
+        Args:
+            side_guid: 推演方 GUID（目标按原始探测方划分）
+            key: units（全部活动单元，不含编组）或 contact_dict（目标）
+
+        Returns:
+            SpatialIndex: 空间索引，支持 within_radius、nearest、within_polygon 查询
+        """
+        side_indexes = self.spatial_index.get(side_guid)
+        if side_indexes is None:
+            side_indexes = self.spatial_index[side_guid] = {}
+        index = side_indexes.get(key)
+        if index is None:
+            index = side_indexes[key] = SpatialIndex(self.spatial_cell_size)
+        return index
+
+    def get_columns(self, key: str, dtype: DTypeLike = np.float64) -> UnitColumns:
+        """
+        获取一类对象的列式快照（纬度、经度、高度、航向、速度、燃油、毁伤、推演方序号）
+
+        首次调用时由当前态势构建，之后随态势更新增量维护。
+
+        Args:
+            key: 对象字典名称，如 aircraft_dict、ship_dict、contact_dict
+            dtype: 数值列的精度，仅在首次调用时生效
+
+        Returns:
+            UnitColumns: 列式快照，推演方序号为推演方在 side_dict 中的顺序
+
+        Raises:
+            ValueError: 对象字典不存在
+        """
+        columns = self.columns.get(key)
+        if columns is None:
+            handler = self.registry.get_dict_handler(key)
+            if handler is None:
+                raise ValueError(f"对象字典不存在: {key}")
+            columns = self.columns[key] = UnitColumns(handler["side_attr"], dtype)
+            for guid, obj in self.object_dict_map[key].items():
+                columns.mark(guid, obj)
+        columns.set_side_ids({side_guid: i for i, side_guid in enumerate(self.side_dict)})
+        return columns
+
+    def get_extent(self, key: str = "units", side_guid: str | None = None) -> tuple[float, float, float, float] | None:
+        """
+        获取对象位置的经纬度范围，可用于按想定创建网格（Grid.from_situation）
+
+        Args:
+            key: 对象字典名称或分组，默认为全部活动单元
+            side_guid: 推演方 GUID，None 表示全部推演方
+
+        Returns:
+            (最小纬度, 最大纬度, 最小经度, 最大经度)，没有位置有效的对象时返回 None
+        """
+        latitudes: list[float] = []
+        longitudes: list[float] = []
+        for dict_name in self.registry.get_dict_names(key):
+            if side_guid is None:
+                objects = self.object_dict_map.get(dict_name, {})
+            else:
+                objects = self.get_side_objects(side_guid, dict_name)
+            for obj in objects.values():
+                latitude = getattr(obj, "latitude", None)
+                longitude = getattr(obj, "longitude", None)
+                if latitude is not None and longitude is not None:
+                    latitudes.append(latitude)
+                    longitudes.append(longitude)
+        if not latitudes:
+            return None
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        valid = ~(np.isnan(lats) | np.isnan(lons))
+        if not valid.any():
+            return None
+        lats, lons = lats[valid], lons[valid]
+        return float(lats.min()), float(lats.max()), float(lons.min()), float(lons.max())
+
+    def get_side_objects(self, side_guid: str, key: str) -> dict[str, Any]:
+        """
+        获取推演方的某类对象
+
+        Args:
+            side_guid: 推演方 GUID
+            key: 对象字典名称，如 ship_dict、contact_dict；各类任务可使用 missions 统一获取
+
+        Returns:
+            dict: {guid: obj}，由态势在更新时实时维护的视图，调用方不应修改
+        """
+        side_objects = self.side_index.get(side_guid)
+        if side_objects is None:
+            side_objects = self.side_index[side_guid] = {}
+        objects = side_objects.get(key)
+        if objects is None:
+            objects = side_objects[key] = {}
+        return objects
+
+    def get_object_side(self, guid: str) -> str | None:
+        """
+        获取对象所属推演方
+
+        Args:
+            guid: 对象 GUID
+
+        Returns:
+            str | None: 推演方 GUID，对象不存在或无法确定推演方时为 None
+        """
+        return self._object_side.get(guid)
+
+    @staticmethod
+    def _apply_data(obj, data: "dict | SituationRecord", changes: dict[str, tuple[Any, Any]] | None = None):
+        """将解码后的数据赋给对象属性"""
+        if isinstance(data, dict):
+            obj.parse(data, changes)
+        else:
+            data.apply_to(obj, changes)
 
     def parse_response(self, response_json: dict):
         response_id = response_json["ID"]
@@ -544,10 +978,22 @@ class CSituation:
             return
 
         meta = self.all_guid_info.pop(guid)
+        self.all_guid.discard(guid)
+        self.changed_fields.pop(guid, None)
         handler = self.registry.get_type_handler(meta["strType"])
 
         if not handler:
             return
+        if handler["side_attr"] is not None:
+            self._unindex_side(guid, handler["index_keys"])
+        if handler["indexed"]:
+            self._unindex_attrs(guid, handler["dict"])
+        spatial_index = self._object_spatial.pop(guid, None)
+        if spatial_index is not None:
+            spatial_index.remove(guid)
+        columns = self.columns.get(handler["dict"])
+        if columns is not None:
+            columns.remove(guid)
 
         # 从对应字典中删除
         obj_dict = self.object_dict_map[handler["dict"]]
@@ -557,15 +1003,11 @@ class CSituation:
                 self.all_guid_delete_info[guid] = {"strType": meta["strType"], "side": obj_dict[guid].side}
             del obj_dict[guid]
 
-        # 更新全局索引
-        if guid in self.all_guid:
-            self.all_guid.remove(guid)
-
     def generate_guid(self) -> str:
         """UUID 标准格式 GUID生成"""
         while True:
             new_guid = str(uuid.uuid4())
-            if new_guid not in self.all_guid + self.pseudo_situ_all_guid:
+            if new_guid not in self.all_guid and new_guid not in self.pseudo_situ_all_guid:
                 return new_guid
 
     @validate_uuid4_args(["guid"])
@@ -597,40 +1039,100 @@ class CSituation:
         """
         self.pseudo_situ_all_guid.append(guid)
 
-    async def update_situation(self, scenario: "CScenario"):
-        """更新态势"""
+    async def update_situation(self, scenario: "CScenario", stream: bool = False):
+        """
+        更新态势
+
+        Args:
+            scenario: 想定类对象
+            stream: 是否使用流式更新，边接收边解析，服务端不支持时自动退回一次性获取
+        """
         self._prepare_for_update()
+        if stream and self.stream_supported and await self._update_situation_stream(scenario):
+            return self._collect_changes()
+
         response = await self.mozi_server.send_and_recv("UpdateState")
-        self._process_update_data(json.loads(response.raw_data), scenario)
+        self._process_update_data(decode_situation(response.raw_data, typed=False), scenario)
         return self._collect_changes()
 
+    async def _update_situation_stream(self, scenario: "CScenario") -> bool:
+        """
+        通过 grpc_connect_stream 流式更新态势，每收到一块数据即解析并应用其中已完整的对象
+
+        Returns:
+            bool: 是否完成了流式更新，服务端未实现流式接口时返回 False
+        """
+        from grpclib import GRPCError
+        from grpclib.const import Status
+
+        decoder = JsonObjectStreamDecoder()
+        received = False
+        try:
+            async for chunk in self.mozi_server.send_and_recv_stream("UpdateState"):
+                received = True
+                for _, item_data in decoder.feed(chunk):
+                    self._process_update_item(item_data, scenario)
+        except GRPCError as e:
+            if e.status != Status.UNIMPLEMENTED or received:
+                raise
+            mprint.warning("服务端不支持流式态势更新，改用一次性获取")
+            self.stream_supported = False
+            return False
+
+        decoder.close()
+        return True
+
     def _prepare_for_update(self):
         """更新前准备"""
         self.update_start = True
         self.all_guid_add_info.clear()
+        self.changed_fields.clear()
         self.pseudo_situ_all_guid.clear()
         self.pseudo_situ_all_name.clear()
 
-    def _process_update_data(self, data: dict, scenario: "CScenario"):
-        """处理更新数据"""
-        for item_data in data.values():
-            if item_data.get("ClassName") == "CCurrentScenario":
-                scenario.parse(item_data)
-            elif item_data.get("ClassName") == "Delete":
-                self.parse_delete(item_data)
-            elif item_data.get("ClassName") == "CResponse":
-                self.parse_response(item_data)
-            elif item_data.get("ClassName") == "CWeather":
-                self.parse_weather(item_data)
-            elif item_data.get("ClassName"):
-                self._parse_generic(item_data)
-            else:
-                mprint.error(f"未知的对象类型: {item_data}")
+    def _process_update_data(self, data: "dict | Iterable[dict | SituationRecord]", scenario: "CScenario"):
+        """
+        处理更新数据
+
+        Args:
+            data: 态势字典，或 decode_situation 的解码结果
+            scenario: 想定类对象
+        """
+        if isinstance(data, dict):
+            data = data.values()
+        for item_data in data:
+            self._process_update_item(item_data, scenario)
+
+    def _process_update_item(self, item_data: "dict | SituationRecord", scenario: "CScenario"):
+        """处理单个更新对象"""
+        if not isinstance(item_data, dict):
+            self._parse_generic(item_data)
+            return
+        class_name = item_data.get("ClassName")
+        if class_name == "CCurrentScenario":
+            scenario.parse(item_data)
+        elif class_name == "Delete":
+            self.parse_delete(item_data)
+        elif class_name == "CResponse":
+            self.parse_response(item_data)
+        elif class_name == "CWeather":
+            self.parse_weather(item_data)
+        elif class_name:
+            self._parse_generic(item_data)
+        else:
+            mprint.error(f"未知的对象类型: {item_data}")
 
     def _collect_changes(self) -> dict:
-        """收集变更信息"""
+        """
+        收集变更信息
+
+        Returns:
+            dict: added/deleted 为新增/删除的对象，changed 为已有对象的属性变化
+                {guid: {属性名: (旧值, 新值)}}，pseudo_guids 为伪态势 GUID
+        """
         return {
             "added": self.all_guid_add_info,
             "deleted": self.all_guid_delete_info,
+            "changed": self.changed_fields,
             "pseudo_guids": self.pseudo_situ_all_guid,
         }
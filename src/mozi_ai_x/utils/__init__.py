@@ -1,6 +1,7 @@
 from .general import (
     np3_to_np1,
     np1_to_np3,
+    np3_to_memoryview,
     get_scenario_time,
     get_sides,
 )
@@ -20,7 +21,9 @@ from .geo import (
     motion_dirc,
     get_cell_middle,
 )
+from . import geo_vector
 from .grid import Grid
+from .raster import GridRaster
 from .log import MPrint, mprint, mprint_with_name
 from .parser import (
     guid_list_parser,
@@ -28,11 +31,14 @@ from .parser import (
     parse_weapons_record,
 )
 from .lua_script import LuaScriptLoader, lua_scripts
+from .json_stream import JsonObjectStreamDecoder
+from .spatial import SpatialIndex, point_in_polygon
 
 
 __all__ = [
     "np3_to_np1",
     "np1_to_np3",
+    "np3_to_memoryview",
     "get_scenario_time",
     "get_sides",
     "GeoPoint",
@@ -48,7 +54,9 @@ __all__ = [
     "plot_square",
     "motion_dirc",
     "get_cell_middle",
+    "geo_vector",
     "Grid",
+    "GridRaster",
     "MPrint",
     "mprint",
     "mprint_with_name",
@@ -57,4 +65,7 @@ __all__ = [
     "parse_weapons_record",
     "LuaScriptLoader",
     "lua_scripts",
+    "JsonObjectStreamDecoder",
+    "SpatialIndex",
+    "point_in_polygon",
 ]
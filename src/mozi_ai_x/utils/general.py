@@ -8,61 +8,65 @@ def np3_to_np1(np_3: np.ndarray | None) -> np.ndarray | None:
     """
     三维0/1数组转换成1维uint8的数组
 
+    按 C 顺序展开后每 8 个元素打包为 1 字节，第 n 个元素对应第 n // 8 字节的第 n % 8 位（低位在前），
+    大于 0 的元素记为 1。支持批量输入 (N, alt, lat, lon)，每个三维数组单独打包。
+
     Args:
-        np_3: 三维0/1数组
+        np_3: 三维0/1数组，或批量的四维数组
 
     Returns:
-        1维uint8的数组
+        1维uint8的数组；批量输入时为 (N, 字节数) 的二维数组
+
+    Raises:
+        ValueError: 输入维度不是 3 或 4
     """
     if np_3 is None:
         return None
-    num = np_3.size // 8
-    if np_3.size % 8 > 0:
-        num += 1
-    np_1 = np.zeros(num, dtype=np.uint8)
+    np_3 = np.asarray(np_3)
+    if np_3.ndim not in (3, 4):
+        raise ValueError(f"输入应为三维数组或批量的四维数组，实际形状为 {np_3.shape}")
+
+    flat = np_3.reshape(-1) if np_3.ndim == 3 else np_3.reshape(np_3.shape[0], -1)
+    bits = flat if flat.dtype == np.bool_ else flat > 0
+    return np.packbits(bits, axis=-1, bitorder="little")
 
-    (alt_num, lat_num, lon_num) = np_3.shape
-    for x in range(alt_num):
-        for y in range(lat_num):
-            for z in range(lon_num):
-                if np_3[x][y][z] > 0:
-                    n_num = x * lat_num * lon_num + y * lon_num + z
-                    index = n_num // 8
-                    bit = n_num % 8
-                    np_1[index] = np_1[index] | (pow(2, bit))
 
-    return np_1
+def np3_to_memoryview(np_3: np.ndarray) -> memoryview:
+    """
+    三维0/1数组打包后导出为 memoryview，可直接用于网络发送（如 socket.send、gRPC bytes 字段），
+    不再复制一次字节
 
+    Args:
+        np_3: 三维0/1数组，或批量的四维数组
 
-def np1_to_np3(np_1: np.ndarray | None, shape: tuple[int, int, int] | None) -> np.ndarray | None:
+    Returns:
+        memoryview: 打包结果的只读视图，格式与 np3_to_np1 相同
     """
-    1维uint8的数组转换成三维0/1数组
+    packed = np3_to_np1(np_3)
+    return memoryview(packed).toreadonly()
+
+
+def np1_to_np3(np_1: np.ndarray | bytes | memoryview | None, shape: tuple[int, int, int] | None) -> np.ndarray | None:
+    """
+    1维uint8的数组转换成三维0/1数组，np3_to_np1 的逆操作
 
     Args:
-        np_1: 1维uint8的数组
+        np_1: 1维uint8的数组，或 bytes、memoryview（不复制）；批量时为 (N, 字节数) 的二维数组
         shape: tuple(num1, num2, num3)三维数组形状
 
     Returns:
-        三维0/1数组
+        三维0/1数组（uint8），批量输入时为 (N, *shape)；字节数不足时返回 None
     """
     if np_1 is None or shape is None:
         return None
+    if not isinstance(np_1, np.ndarray):
+        np_1 = np.frombuffer(np_1, dtype=np.uint8)
 
-    (alt_num, lat_num, lon_num) = shape
-
-    if np_1.size * 8 < alt_num * lat_num * lon_num:
+    count = shape[0] * shape[1] * shape[2]
+    if np_1.shape[-1] * 8 < count:
         return None
 
-    np_3 = np.zeros((alt_num, lat_num, lon_num), dtype=np.uint8)
-    for x in range(alt_num):
-        for y in range(lat_num):
-            for z in range(lon_num):
-                n_num = x * lat_num * lon_num + y * lon_num + z
-                index = n_num // 8
-                bit = n_num % 8
-                np_3[x][y][z] = (np_1[index] >> bit) & 1
-
-    return np_3
+    return np.unpackbits(np_1, axis=-1, count=count, bitorder="little").reshape(*np_1.shape[:-1], *shape)
 
 
 def get_scenario_time(time_stamp: int) -> str:
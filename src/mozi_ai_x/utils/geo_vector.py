@@ -0,0 +1,207 @@
+"""
+地理信息库（向量化版本）
+
+与 geo 模块中的标量函数一一对应，接受数组形式的经纬度、高度，按 NumPy 广播规则一次计算全部结果，
+适用于单元 × 目标的距离、方位矩阵等批量计算。计算公式、地球半径与单位均与标量版本一致。
+
+示例
+```python
+import numpy as np
+from mozi_ai_x.utils import geo_vector
+
+# 单元 × 目标距离矩阵，形状 (单元数, 目标数)，单位 km
+dist = geo_vector.distance_matrix(unit_lats, unit_lons, contact_lats, contact_lons)
+
+# 逐点计算，输入形状可广播
+bearing = geo_vector.azimuth(unit_lats, unit_lons, 40.0, 140.0)
+
+# 使用 float32 减少内存占用和计算时间（数千公里距离上误差约 0.1 km）
+dist32 = geo_vector.distance_matrix(unit_lats, unit_lons, contact_lats, contact_lons, dtype=np.float32)
+```
+"""
+
+from typing import TypeAlias
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+from .geo import EARTH_RADIUS, degree2radian
+
+FloatArray: TypeAlias = NDArray[np.floating]
+
+
+def _as_float(*values: ArrayLike, dtype: DTypeLike) -> list[FloatArray]:
+    """转换为指定精度的浮点数组"""
+    dtype = np.dtype(dtype)
+    if dtype.kind != "f":
+        raise ValueError(f"dtype 应为浮点类型: {dtype}")
+    return [np.asarray(value, dtype=dtype) for value in values]
+
+
+def horizontal_distance(
+    lat1: ArrayLike, lon1: ArrayLike, lat2: ArrayLike, lon2: ArrayLike, dtype: DTypeLike = np.float64
+) -> FloatArray:
+    """
+    求地面两点的水平距离（Haversine 公式），对应 geo.get_horizontal_distance
+
+    Args:
+        lat1: 点 1 纬度
+        lon1: 点 1 经度
+        lat2: 点 2 纬度
+        lon2: 点 2 经度
+        dtype: 计算精度，np.float32 或 np.float64
+
+    Returns:
+        FloatArray: 距离 KM，形状为各输入广播后的形状
+    """
+    lat1, lon1, lat2, lon2 = _as_float(lat1, lon1, lat2, lon2, dtype=dtype)
+    lat1 = lat1 * degree2radian
+    lat2 = lat2 * degree2radian
+    hav = np.sin((lat1 - lat2) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon1 - lon2) * degree2radian / 2) ** 2
+    # float32 舍入可能使 hav 略大于 1
+    return 2 * np.arcsin(np.sqrt(np.minimum(hav, 1))) * (EARTH_RADIUS / 1000)
+
+
+def slant_distance(
+    lat1: ArrayLike,
+    lon1: ArrayLike,
+    alt1: ArrayLike,
+    lat2: ArrayLike,
+    lon2: ArrayLike,
+    alt2: ArrayLike,
+    dtype: DTypeLike = np.float64,
+) -> FloatArray:
+    """
+    获取三维直线距离，对应 geo.get_slant_distance，点高需为海拔高度
+
+    Args:
+        lat1: 点 1 纬度
+        lon1: 点 1 经度
+        alt1: 点 1 高度 m
+        lat2: 点 2 纬度
+        lon2: 点 2 经度
+        alt2: 点 2 高度 m
+        dtype: 计算精度
+
+    Returns:
+        FloatArray: 距离 KM
+    """
+    horizontal = horizontal_distance(lat1, lon1, lat2, lon2, dtype=dtype)
+    alt1, alt2 = _as_float(alt1, alt2, dtype=dtype)
+    delta_km = (alt1 - alt2) / 1000
+    return np.sqrt(horizontal * horizontal + delta_km * delta_km)
+
+
+def azimuth(lat1: ArrayLike, lon1: ArrayLike, lat2: ArrayLike, lon2: ArrayLike, dtype: DTypeLike = np.float64) -> FloatArray:
+    """
+    获取点 1 指向点 2 的方位角，对应 geo.get_azimuth
+
+    Args:
+        lat1: 点 1 纬度
+        lon1: 点 1 经度
+        lat2: 点 2 纬度
+        lon2: 点 2 经度
+        dtype: 计算精度
+
+    Returns:
+        FloatArray: 角度 [0, 360)，正北: 0，正东: 90，顺时针旋转
+    """
+    lat1, lon1, lat2, lon2 = _as_float(lat1, lon1, lat2, lon2, dtype=dtype)
+    lat1 = lat1 * degree2radian
+    lat2 = lat2 * degree2radian
+    delta_lon = (lon2 - lon1) * degree2radian
+    result = np.degrees(np.arctan2(np.sin(delta_lon), np.tan(lat2) * np.cos(lat1) - np.sin(lat1) * np.cos(delta_lon)))
+    return result % 360
+
+
+def end_point(
+    lat: ArrayLike, lon: ArrayLike, distance: ArrayLike, bearing: ArrayLike, dtype: DTypeLike = np.float64
+) -> tuple[FloatArray, FloatArray]:
+    """
+    获取终点经纬度，对应 geo.get_end_point
+
+    Args:
+        lat: 起点纬度
+        lon: 起点经度
+        distance: 距离 KM
+        bearing: 起点到终点的方位角
+        dtype: 计算精度
+
+    Returns:
+        tuple[FloatArray, FloatArray]: 终点 (纬度, 经度)
+    """
+    return _destination(lat, lon, distance, bearing, EARTH_RADIUS / 1000, dtype)
+
+
+def point_with_bearing_distance(
+    lat: ArrayLike, lon: ArrayLike, bearing: ArrayLike, distance: ArrayLike, dtype: DTypeLike = np.float64
+) -> tuple[FloatArray, FloatArray]:
+    """
+    已知一点求沿某一方向一段距离的点，对应 geo.get_point_with_point_bearing_distance
+
+    Args:
+        lat: 起点纬度
+        lon: 起点经度
+        bearing: 朝向角
+        distance: 距离（海里）
+        dtype: 计算精度
+
+    Returns:
+        tuple[FloatArray, FloatArray]: 终点 (纬度, 经度)
+    """
+    # 与标量版本一致，地球半径取 3440 海里
+    return _destination(lat, lon, distance, bearing, 3440, dtype)
+
+
+def _destination(
+    lat: ArrayLike, lon: ArrayLike, distance: ArrayLike, bearing: ArrayLike, radius: float, dtype: DTypeLike
+) -> tuple[FloatArray, FloatArray]:
+    lat, lon, distance, bearing = _as_float(lat, lon, distance, bearing, dtype=dtype)
+    lat1 = lat * degree2radian
+    bearing = bearing * degree2radian
+    ratio = distance / radius
+    sin_lat1, cos_lat1 = np.sin(lat1), np.cos(lat1)
+    sin_ratio, cos_ratio = np.sin(ratio), np.cos(ratio)
+    lat2 = np.arcsin(np.clip(sin_lat1 * cos_ratio + cos_lat1 * sin_ratio * np.cos(bearing), -1, 1))
+    lon2 = lon * degree2radian + np.arctan2(np.sin(bearing) * sin_ratio * cos_lat1, cos_ratio - sin_lat1 * np.sin(lat2))
+    return np.degrees(lat2), np.degrees(lon2)
+
+
+def distance_matrix(
+    lats1: ArrayLike, lons1: ArrayLike, lats2: ArrayLike, lons2: ArrayLike, dtype: DTypeLike = np.float64
+) -> FloatArray:
+    """
+    计算两组点之间的水平距离矩阵
+
+    Args:
+        lats1: 第一组点的纬度，形状 (m,)
+        lons1: 第一组点的经度，形状 (m,)
+        lats2: 第二组点的纬度，形状 (n,)
+        lons2: 第二组点的经度，形状 (n,)
+        dtype: 计算精度
+
+    Returns:
+        FloatArray: 形状 (m, n)，第 i 行第 j 列为第一组第 i 个点到第二组第 j 个点的距离 KM
+    """
+    lats1, lons1, lats2, lons2 = _as_float(lats1, lons1, lats2, lons2, dtype=dtype)
+    return horizontal_distance(lats1[:, None], lons1[:, None], lats2[None, :], lons2[None, :], dtype=dtype)
+
+
+def azimuth_matrix(
+    lats1: ArrayLike, lons1: ArrayLike, lats2: ArrayLike, lons2: ArrayLike, dtype: DTypeLike = np.float64
+) -> FloatArray:
+    """
+    计算两组点之间的方位角矩阵
+
+    Args:
+        lats1: 第一组点的纬度，形状 (m,)
+        lons1: 第一组点的经度，形状 (m,)
+        lats2: 第二组点的纬度，形状 (n,)
+        lons2: 第二组点的经度，形状 (n,)
+        dtype: 计算精度
+
+    Returns:
+        FloatArray: 形状 (m, n)，第 i 行第 j 列为第一组第 i 个点指向第二组第 j 个点的方位角
+    """
+    lats1, lons1, lats2, lons2 = _as_float(lats1, lons1, lats2, lons2, dtype=dtype)
+    return azimuth(lats1[:, None], lons1[:, None], lats2[None, :], lons2[None, :], dtype=dtype)
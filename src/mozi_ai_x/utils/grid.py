@@ -1,21 +1,72 @@
 import math
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from functools import update_wrapper
+from types import MethodType
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
+from numpy.typing import ArrayLike
 
-from .geo import degree2radian, get_horizontal_distance
+from . import geo_vector
+from .geo import degree2radian
+
+if TYPE_CHECKING:
+    from ..simulation.situation import CSituation
+
+
+class _grid_method:
+    """
+    网格方法：通过实例调用时使用该实例的网格参数，通过类调用时使用默认网格 Grid.default()，兼容原类方法的调用方式
+
+    绑定后的方法缓存在实例的 __dict__ 中，之后的访问不再经过描述符
+    """
+
+    def __init__(self, func: Callable[..., Any]):
+        self.func = func
+        self.name = func.__name__
+        update_wrapper(self, func)
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, obj: "Grid | None", objtype: "type[Grid]") -> Callable[..., Any]:
+        if obj is None:
+            obj = objtype.default()
+        method = obj.__dict__.get(self.name)
+        if method is None:
+            method = obj.__dict__[self.name] = MethodType(self.func, obj)
+        return method
+
+
+def _axis_count(start: float, stop: float, unit: float) -> tuple[int, float]:
+    """计算 [start, stop) 按 unit 划分的单元数，范围不是 unit 的整数倍时将 stop 向外扩展到整数倍"""
+    count = round((stop - start) / unit)
+    if not math.isclose(start + count * unit, stop, abs_tol=1e-9):
+        count = math.ceil((stop - start) / unit)
+        stop = start + count * unit
+    return count, stop
+
+
+def _id_factor(count: int) -> int:
+    """网格ID中下一维度的乘数：10 的幂，且不小于 1000"""
+    return 10 ** max(3, len(str(max(count - 1, 0))))
 
 
 class Grid:
     """
     用于处理三维空间网格的工具类
 
-    网格系统将空间划分为经度、纬度和高度三个维度。其中:
+    网格系统将空间划分为经度、纬度和高度三个维度。默认网格（类常量）为:
     - 经度范围: 43.5° ~ 50.5°, 在48.5°处分为两个区域
         - 左侧区域: 间隔 1/120°
         - 右侧区域: 间隔 1/12° (稀疏区域)
     - 纬度范围: 38.5° ~ 42°, 间隔 1/120°
     - 高度分层: [0, 6, 450, 1000, 3000, 7000, 10000] 米
 
+    通过类调用方法（Grid.get_grid_id(...)）时使用默认网格；其他作战区域可创建实例，
+    各实例的网格参数、索引表和距离核缓存相互独立。
+
     示例
     ```python
     # 获取位置对应的网格ID
@@ -29,10 +80,22 @@ class Grid:
 
     # 获取网格尺寸
     dimensions = Grid.get_grid_dimensions(latitude_index=20, longitude_index=10)
+
+    # 批量查询，输入为数组，区域外的位置 ID 为 -1
+    grid_ids = Grid.get_grid_ids(longitudes, latitudes, altitudes)
+    lon_idx, lat_idx, alt_idx = Grid.get_indices(longitudes, latitudes, altitudes)
+    lons, lats, alts = Grid.get_positions(lon_idx, lat_idx, alt_idx)
+
+    # 自定义作战区域，不划分稀疏区域
+    grid = Grid(min_longitude=120, max_longitude=126, min_latitude=20, max_latitude=26, degree_unit=1 / 60, sparse_longitude=None)
+    grid_id = grid.get_grid_id(longitude=121.5, latitude=23.0, altitude=1500)
+
+    # 按想定中单元的分布范围创建网格
+    grid = Grid.from_situation(env.situation, margin=0.5)
     ```
     """
 
-    # 网格系统常量
+    # 默认网格常量，实例中的同名属性为该实例的网格参数
     DEGREE_UNIT = 1 / 120  # 基础经纬度划分单元
     DEGREE_UNIT_SPARSE = 1 / 12  # 稀疏区域经度划分单元
 
@@ -56,8 +119,141 @@ class Grid:
     CENTER_LAT_INDEX = LAT_UNIT_COUNT // 2
     CENTER_LON_INDEX = LEFT_LON_COUNT // 2
 
+    # 网格ID = 高度索引 * ID_ALT_FACTOR + 纬度索引 * ID_LAT_FACTOR + 经度索引
+    ID_LAT_FACTOR = 1000
+    ID_ALT_FACTOR = 1000000
+
+    def __init__(
+        self,
+        min_longitude: float = MIN_LONGITUDE,
+        max_longitude: float = MAX_LONGITUDE,
+        min_latitude: float = MIN_LATITUDE,
+        max_latitude: float = MAX_LATITUDE,
+        degree_unit: float = DEGREE_UNIT,
+        sparse_longitude: float | None = MID_LONGITUDE,
+        sparse_degree_unit: float = DEGREE_UNIT_SPARSE,
+        altitude_bands: Sequence[float] = tuple(ALTITUDE_BANDS),
+    ):
+        """
+        Args:
+            min_longitude: 最小经度
+            max_longitude: 最大经度，范围不是 degree_unit 的整数倍时向外扩展
+            min_latitude: 最小纬度
+            max_latitude: 最大纬度，范围不是 degree_unit 的整数倍时向外扩展
+            degree_unit: 经纬度划分单元(°)
+            sparse_longitude: 经度分区点，其东侧按 sparse_degree_unit 划分；None 表示不划分稀疏区域
+            sparse_degree_unit: 稀疏区域经度划分单元(°)
+            altitude_bands: 高度分层下界(米)，需严格递增
+
+        Raises:
+            ValueError: 参数无效
+        """
+        if not (min_longitude < max_longitude and min_latitude < max_latitude):
+            raise ValueError(f"网格范围无效: 经度 {min_longitude} ~ {max_longitude}，纬度 {min_latitude} ~ {max_latitude}")
+        if degree_unit <= 0 or sparse_degree_unit <= 0:
+            raise ValueError(f"划分单元应大于 0: {degree_unit}, {sparse_degree_unit}")
+        if sparse_longitude is None:
+            sparse_longitude = max_longitude
+        if not min_longitude < sparse_longitude <= max_longitude:
+            raise ValueError(f"经度分区点应位于 ({min_longitude}, {max_longitude}] 内: {sparse_longitude}")
+        bands = list(altitude_bands)
+        if not bands or any(low >= high for low, high in zip(bands, bands[1:], strict=False)):
+            raise ValueError(f"高度分层应非空且严格递增: {list(altitude_bands)}")
+
+        self.DEGREE_UNIT = degree_unit
+        self.DEGREE_UNIT_SPARSE = sparse_degree_unit
+        self.MIN_LONGITUDE = min_longitude
+        self.MIN_LATITUDE = min_latitude
+        self.LEFT_LON_COUNT, self.MID_LONGITUDE = _axis_count(min_longitude, sparse_longitude, degree_unit)
+        sparse_count = 0
+        if max_longitude > self.MID_LONGITUDE:
+            sparse_count, max_longitude = _axis_count(self.MID_LONGITUDE, max_longitude, sparse_degree_unit)
+        else:
+            # 不划分稀疏区域时，经度上界随分区点一起向外扩展
+            max_longitude = self.MID_LONGITUDE
+        self.MAX_LONGITUDE = max_longitude
+        self.LON_UNIT_COUNT = self.LEFT_LON_COUNT + sparse_count
+        self.LAT_UNIT_COUNT, self.MAX_LATITUDE = _axis_count(min_latitude, max_latitude, degree_unit)
+        self.ALTITUDE_BANDS = bands
+        self.CENTER_LAT_INDEX = self.LAT_UNIT_COUNT // 2
+        self.CENTER_LON_INDEX = self.LEFT_LON_COUNT // 2
+        self.ID_LAT_FACTOR = _id_factor(self.LON_UNIT_COUNT)
+        self.ID_ALT_FACTOR = self.ID_LAT_FACTOR * _id_factor(self.LAT_UNIT_COUNT)
+        self.KERNEL_LAT_BAND_ROWS = max(round(self.KERNEL_LAT_BAND_DEGREES / degree_unit), 1)
+
+        # 索引表：各经度、纬度单元的中心，与 _get_longitude/_get_latitude 的计算方式一致
+        lon_indices = np.arange(self.LON_UNIT_COUNT)
+        self.lon_centers = np.where(
+            lon_indices < self.LEFT_LON_COUNT,
+            self.MIN_LONGITUDE + lon_indices * self.DEGREE_UNIT + self.DEGREE_UNIT / 2,
+            self.MID_LONGITUDE + (lon_indices - self.LEFT_LON_COUNT) * self.DEGREE_UNIT_SPARSE + self.DEGREE_UNIT_SPARSE / 2,
+        )
+        self.lat_centers = self.MIN_LATITUDE + np.arange(self.LAT_UNIT_COUNT) * self.DEGREE_UNIT + self.DEGREE_UNIT / 2
+        self.altitude_table = np.asarray(bands, dtype=np.float64)
+        for table in (self.lon_centers, self.lat_centers, self.altitude_table):
+            table.flags.writeable = False
+
+        # 距离核缓存 {(距离, 纬度带): (核, (核起点相对中心的纬度偏移, 经度偏移))}，按最近使用顺序淘汰
+        self._kernel_cache: OrderedDict[tuple[float, int], tuple[np.ndarray, tuple[int, int]]] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(经度 {self.MIN_LONGITUDE} ~ {self.MAX_LONGITUDE}, 纬度 {self.MIN_LATITUDE} ~ {self.MAX_LATITUDE}, "
+            f"{self.LON_UNIT_COUNT} x {self.LAT_UNIT_COUNT} x {len(self.ALTITUDE_BANDS)})"
+        )
+
     @classmethod
-    def get_index(cls, longitude: float, latitude: float, altitude: float) -> tuple[int, int, int] | None:
+    def default(cls) -> "Grid":
+        """默认网格（由类常量定义），首次调用时创建"""
+        grid = cls.__dict__.get("_default_grid")
+        if grid is None:
+            grid = cls()
+            cls._default_grid = grid
+        return grid
+
+    @classmethod
+    def from_situation(
+        cls,
+        situation: "CSituation",
+        degree_unit: float = DEGREE_UNIT,
+        margin: float = 0.5,
+        key: str = "units",
+        side_guid: str | None = None,
+        altitude_bands: Sequence[float] = tuple(ALTITUDE_BANDS),
+    ) -> "Grid":
+        """
+        按态势中对象的分布范围创建网格，不划分稀疏区域
+
+        Args:
+            situation: 态势
+            degree_unit: 经纬度划分单元(°)
+            margin: 在对象分布范围四周扩展的距离(°)，网格范围不含最大经纬度，应大于 0
+            key: 对象字典名称或分组，默认为全部活动单元
+            side_guid: 推演方 GUID，None 表示全部推演方
+            altitude_bands: 高度分层下界(米)
+
+        Returns:
+            Grid: 网格
+
+        Raises:
+            ValueError: 态势中没有位置有效的对象
+        """
+        extent = situation.get_extent(key, side_guid)
+        if extent is None:
+            raise ValueError(f"态势中没有位置有效的对象: {key}")
+        min_lat, max_lat, min_lon, max_lon = extent
+        return cls(
+            min_longitude=max(min_lon - margin, -180.0),
+            max_longitude=min(max_lon + margin, 180.0),
+            min_latitude=max(min_lat - margin, -90.0),
+            max_latitude=min(max_lat + margin, 90.0),
+            degree_unit=degree_unit,
+            sparse_longitude=None,
+            altitude_bands=altitude_bands,
+        )
+
+    @_grid_method
+    def get_index(self, longitude: float, latitude: float, altitude: float) -> tuple[int, int, int] | None:
         """获取给定位置对应的网格索引
 
         Args:
@@ -68,20 +264,20 @@ class Grid:
         Returns:
             包含 (经度索引, 纬度索引, 高度索引) 的元组，如果位置在区域外则返回 None
         """
-        lon_idx = cls._get_longitude_index(longitude)
+        lon_idx = self._get_longitude_index(longitude)
         if lon_idx is None:
             return None
-        lat_idx = cls._get_latitude_index(latitude)
+        lat_idx = self._get_latitude_index(latitude)
         if lat_idx is None:
             return None
-        alt_idx = cls._get_altitude_index(altitude)
+        alt_idx = self._get_altitude_index(altitude)
         if alt_idx is None:
             return None
 
         return lon_idx, lat_idx, alt_idx
 
-    @classmethod
-    def get_position(cls, longitude_index: int, latitude_index: int, altitude_index: int) -> tuple[float, float, float] | None:
+    @_grid_method
+    def get_position(self, longitude_index: int, latitude_index: int, altitude_index: int) -> tuple[float, float, float] | None:
         """获取网格索引对应的中心位置
 
         Args:
@@ -92,20 +288,20 @@ class Grid:
         Returns:
             包含 (经度, 纬度, 高度) 的元组，如果索引无效则返回 None
         """
-        longitude = cls._get_longitude(longitude_index)
+        longitude = self._get_longitude(longitude_index)
         if longitude is None:
             return None
-        latitude = cls._get_latitude(latitude_index)
+        latitude = self._get_latitude(latitude_index)
         if latitude is None:
             return None
-        altitude = cls._get_altitude(altitude_index)
+        altitude = self._get_altitude(altitude_index)
         if altitude is None:
             return None
 
         return longitude, latitude, altitude
 
-    @classmethod
-    def get_grid_id(cls, longitude: float, latitude: float, altitude: float) -> int | None:
+    @_grid_method
+    def get_grid_id(self, longitude: float, latitude: float, altitude: float) -> int | None:
         """获取位置对应的唯一网格ID
 
         Args:
@@ -116,14 +312,14 @@ class Grid:
         Returns:
             网格ID，如果位置在区域外则返回 None
         """
-        indices = cls.get_index(longitude, latitude, altitude)
+        indices = self.get_index(longitude, latitude, altitude)
         if indices is None:
             return None
         lon_idx, lat_idx, alt_idx = indices
-        return alt_idx * 1000000 + lat_idx * 1000 + lon_idx
+        return alt_idx * self.ID_ALT_FACTOR + lat_idx * self.ID_LAT_FACTOR + lon_idx
 
-    @classmethod
-    def get_grid_dimensions(cls, latitude_index: int, longitude_index: int) -> tuple[float, float] | None:
+    @_grid_method
+    def get_grid_dimensions(self, latitude_index: int, longitude_index: int) -> tuple[float, float] | None:
         """获取指定网格的尺寸
 
         Args:
@@ -133,90 +329,198 @@ class Grid:
         Returns:
             包含 (纬度长度, 经度宽度) 的元组(单位:km)，如果索引无效则返回 None
         """
-        latitude = cls._get_latitude(latitude_index)
+        latitude = self._get_latitude(latitude_index)
         if latitude is None:
             return None
 
-        if longitude_index >= cls.LEFT_LON_COUNT:
-            width = cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT_SPARSE * math.cos(degree2radian * latitude)
+        if longitude_index >= self.LEFT_LON_COUNT:
+            width = self.LAT_DEGREE_DISTANCE * self.DEGREE_UNIT_SPARSE * math.cos(degree2radian * latitude)
         else:
-            width = cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT * math.cos(degree2radian * latitude)
-        return cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT, width
+            width = self.LAT_DEGREE_DISTANCE * self.DEGREE_UNIT * math.cos(degree2radian * latitude)
+        return self.LAT_DEGREE_DISTANCE * self.DEGREE_UNIT, width
+
+    @_grid_method
+    def get_indices(
+        self, longitudes: ArrayLike, latitudes: ArrayLike, altitudes: ArrayLike
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """批量获取位置对应的网格索引，get_index 的数组版本，输入形状可广播
+
+        Args:
+            longitudes: 经度数组
+            latitudes: 纬度数组
+            altitudes: 高度数组(米)
+
+        Returns:
+            (经度索引, 纬度索引, 高度索引) 三个 int64 数组，区域外的位置三个索引均为 -1
+        """
+        longitudes, latitudes, altitudes = np.broadcast_arrays(
+            np.asarray(longitudes, dtype=np.float64),
+            np.asarray(latitudes, dtype=np.float64),
+            np.asarray(altitudes, dtype=np.float64),
+        )
+        lon_idx = self._get_longitude_indices(longitudes)
+        lat_idx = self._get_latitude_indices(latitudes)
+        alt_idx = self._get_altitude_indices(altitudes)
+        outside = (lon_idx < 0) | (lat_idx < 0)
+        lon_idx[outside] = -1
+        lat_idx[outside] = -1
+        alt_idx[outside] = -1
+        return lon_idx, lat_idx, alt_idx
+
+    @_grid_method
+    def get_grid_ids(self, longitudes: ArrayLike, latitudes: ArrayLike, altitudes: ArrayLike) -> np.ndarray:
+        """批量获取位置对应的网格ID，get_grid_id 的数组版本
+
+        Args:
+            longitudes: 经度数组
+            latitudes: 纬度数组
+            altitudes: 高度数组(米)
+
+        Returns:
+            int64 网格ID数组，区域外的位置为 -1
+        """
+        lon_idx, lat_idx, alt_idx = self.get_indices(longitudes, latitudes, altitudes)
+        return np.where(lon_idx < 0, -1, alt_idx * self.ID_ALT_FACTOR + lat_idx * self.ID_LAT_FACTOR + lon_idx)
+
+    @_grid_method
+    def get_positions(
+        self, longitude_indices: ArrayLike, latitude_indices: ArrayLike, altitude_indices: ArrayLike
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """批量获取网格索引对应的中心位置，get_position 的数组版本
+
+        Args:
+            longitude_indices: 经度索引数组
+            latitude_indices: 纬度索引数组
+            altitude_indices: 高度索引数组
+
+        Returns:
+            (经度, 纬度, 高度) 三个 float64 数组，任一索引无效的位置均为 NaN
+        """
+        lon_idx, lat_idx, alt_idx = np.broadcast_arrays(
+            np.asarray(longitude_indices, dtype=np.int64),
+            np.asarray(latitude_indices, dtype=np.int64),
+            np.asarray(altitude_indices, dtype=np.int64),
+        )
+        valid = (
+            (lon_idx >= 0)
+            & (lon_idx < self.LON_UNIT_COUNT)
+            & (lat_idx >= 0)
+            & (lat_idx < self.LAT_UNIT_COUNT)
+            & (alt_idx >= 0)
+            & (alt_idx < len(self.altitude_table))
+        )
+        longitudes = self.lon_centers[np.clip(lon_idx, 0, self.LON_UNIT_COUNT - 1)]
+        latitudes = self.lat_centers[np.clip(lat_idx, 0, self.LAT_UNIT_COUNT - 1)]
+        altitudes = self.altitude_table[np.clip(alt_idx, 0, len(self.altitude_table) - 1)]
+        return (
+            np.where(valid, longitudes, np.nan),
+            np.where(valid, latitudes, np.nan),
+            np.where(valid, altitudes, np.nan),
+        )
 
     # 以下是内部辅助方法
-    @classmethod
-    def _get_longitude_index(cls, longitude: float) -> int | None:
+    @_grid_method
+    def _get_longitude_indices(self, longitudes: np.ndarray) -> np.ndarray:
+        """_get_longitude_index 的数组版本，区域外为 -1"""
+        with np.errstate(invalid="ignore"):
+            indices = np.where(
+                longitudes < self.MID_LONGITUDE,
+                np.floor((longitudes - self.MIN_LONGITUDE) / self.DEGREE_UNIT),
+                self.LEFT_LON_COUNT + np.floor((longitudes - self.MID_LONGITUDE) / self.DEGREE_UNIT_SPARSE),
+            )
+            valid = (self.MIN_LONGITUDE <= longitudes) & (longitudes < self.MAX_LONGITUDE)
+        return np.where(valid, indices, -1).astype(np.int64)
+
+    @_grid_method
+    def _get_latitude_indices(self, latitudes: np.ndarray) -> np.ndarray:
+        """_get_latitude_index 的数组版本，区域外为 -1"""
+        with np.errstate(invalid="ignore"):
+            indices = np.floor((latitudes - self.MIN_LATITUDE) / self.DEGREE_UNIT)
+            valid = (self.MIN_LATITUDE <= latitudes) & (latitudes < self.MAX_LATITUDE)
+        return np.where(valid, indices, -1).astype(np.int64)
+
+    @_grid_method
+    def _get_altitude_indices(self, altitudes: np.ndarray) -> np.ndarray:
+        """_get_altitude_index 的数组版本：落在某一高度层内时为该层索引，否则（含负高度）为最高层索引"""
+        indices = np.searchsorted(self.altitude_table, altitudes, side="right") - 1
+        top = len(self.ALTITUDE_BANDS) - 1
+        return np.where((indices < 0) | (indices > top), top, indices).astype(np.int64)
+
+    @_grid_method
+    def _get_longitude_index(self, longitude: float) -> int | None:
         """获取经度对应的索引"""
-        if not cls.MIN_LONGITUDE <= longitude < cls.MAX_LONGITUDE:
+        if not self.MIN_LONGITUDE <= longitude < self.MAX_LONGITUDE:
             return None
 
-        if longitude < cls.MID_LONGITUDE:
-            return math.floor((longitude - cls.MIN_LONGITUDE) / cls.DEGREE_UNIT)
-        return cls.LEFT_LON_COUNT + math.floor((longitude - cls.MID_LONGITUDE) / cls.DEGREE_UNIT_SPARSE)
+        if longitude < self.MID_LONGITUDE:
+            return math.floor((longitude - self.MIN_LONGITUDE) / self.DEGREE_UNIT)
+        return self.LEFT_LON_COUNT + math.floor((longitude - self.MID_LONGITUDE) / self.DEGREE_UNIT_SPARSE)
 
-    @classmethod
-    def _get_latitude_index(cls, latitude: float) -> int | None:
+    @_grid_method
+    def _get_latitude_index(self, latitude: float) -> int | None:
         """获取纬度对应的索引"""
-        if not cls.MIN_LATITUDE <= latitude < cls.MAX_LATITUDE:
+        if not self.MIN_LATITUDE <= latitude < self.MAX_LATITUDE:
             return None
-        return math.floor((latitude - cls.MIN_LATITUDE) / cls.DEGREE_UNIT)
+        return math.floor((latitude - self.MIN_LATITUDE) / self.DEGREE_UNIT)
 
-    @classmethod
-    def _get_altitude_index(cls, altitude: float) -> int:
+    @_grid_method
+    def _get_altitude_index(self, altitude: float) -> int:
         """获取高度对应的索引"""
-        for i in range(len(cls.ALTITUDE_BANDS) - 1):
-            if cls.ALTITUDE_BANDS[i] <= altitude < cls.ALTITUDE_BANDS[i + 1]:
+        for i in range(len(self.ALTITUDE_BANDS) - 1):
+            if self.ALTITUDE_BANDS[i] <= altitude < self.ALTITUDE_BANDS[i + 1]:
                 return i
-        return len(cls.ALTITUDE_BANDS) - 1
+        return len(self.ALTITUDE_BANDS) - 1
 
-    @classmethod
-    def _get_longitude(cls, longitude_index: int) -> float | None:
+    @_grid_method
+    def _get_longitude(self, longitude_index: int) -> float | None:
         """获取经度索引对应的经度值"""
-        if not 0 <= longitude_index < cls.LON_UNIT_COUNT:
+        if not 0 <= longitude_index < self.LON_UNIT_COUNT:
             return None
 
-        if longitude_index < cls.LEFT_LON_COUNT:
-            return cls.MIN_LONGITUDE + longitude_index * cls.DEGREE_UNIT + cls.DEGREE_UNIT / 2
-        return cls.MID_LONGITUDE + (longitude_index - cls.LEFT_LON_COUNT) * cls.DEGREE_UNIT_SPARSE + cls.DEGREE_UNIT_SPARSE / 2
+        if longitude_index < self.LEFT_LON_COUNT:
+            return self.MIN_LONGITUDE + longitude_index * self.DEGREE_UNIT + self.DEGREE_UNIT / 2
+        return (
+            self.MID_LONGITUDE + (longitude_index - self.LEFT_LON_COUNT) * self.DEGREE_UNIT_SPARSE + self.DEGREE_UNIT_SPARSE / 2
+        )
 
-    @classmethod
-    def _get_latitude(cls, latitude_index: int) -> float | None:
+    @_grid_method
+    def _get_latitude(self, latitude_index: int) -> float | None:
         """获取纬度索引对应的纬度值"""
-        if not 0 <= latitude_index < cls.LAT_UNIT_COUNT:
+        if not 0 <= latitude_index < self.LAT_UNIT_COUNT:
             return None
-        return cls.MIN_LATITUDE + latitude_index * cls.DEGREE_UNIT + cls.DEGREE_UNIT / 2
+        return self.MIN_LATITUDE + latitude_index * self.DEGREE_UNIT + self.DEGREE_UNIT / 2
 
-    @classmethod
-    def _get_altitude(cls, altitude_index: int) -> float | None:
+    @_grid_method
+    def _get_altitude(self, altitude_index: int) -> float | None:
         """获取高度索引对应的高度值"""
-        if not 0 <= altitude_index < len(cls.ALTITUDE_BANDS):
+        if not 0 <= altitude_index < len(self.ALTITUDE_BANDS):
             return None
-        return cls.ALTITUDE_BANDS[altitude_index]
+        return self.ALTITUDE_BANDS[altitude_index]
 
-    @classmethod
-    def _get_horizontal_position(cls, latitude_index: int, longitude_index: int) -> tuple[float, float] | None:
+    @_grid_method
+    def _get_horizontal_position(self, latitude_index: int, longitude_index: int) -> tuple[float, float] | None:
         """获取纬度索引和经度索引对应的水平位置"""
-        latitude = cls._get_latitude(latitude_index)
+        latitude = self._get_latitude(latitude_index)
         if latitude is None:
             return None
-        longitude = cls._get_longitude(longitude_index)
+        longitude = self._get_longitude(longitude_index)
         if longitude is None:
             return None
         return latitude, longitude
 
-    @classmethod
-    def get_center_position(cls) -> tuple[float, float] | None:
+    @_grid_method
+    def get_center_position(self) -> tuple[float, float] | None:
         """获取网格系统的中心位置"""
-        latitude = cls._get_latitude(cls.CENTER_LAT_INDEX)
+        latitude = self._get_latitude(self.CENTER_LAT_INDEX)
         if latitude is None:
             return None
-        longitude = cls._get_longitude(cls.CENTER_LON_INDEX)
+        longitude = self._get_longitude(self.CENTER_LON_INDEX)
         if longitude is None:
             return None
         return latitude, longitude
 
-    @classmethod
-    def get_grids_within_distance(cls, location: tuple[float, float], distance_km: float) -> list[int]:
+    @_grid_method
+    def get_grids_within_distance(self, location: tuple[float, float], distance_km: float) -> list[int]:
         """获取指定位置一定距离范围内的所有网格ID
 
         Args:
@@ -226,23 +530,16 @@ class Grid:
         Returns:
             网格ID列表
         """
-        grid_array, (min_lat_idx, min_lon_idx) = cls._get_area_within_distance(location, distance_km, True)
+        grid_array, (min_lat_idx, min_lon_idx) = self._get_area_within_distance(location, distance_km, True)
         if grid_array is None or min_lat_idx is None or min_lon_idx is None:
             return []
 
-        grid_ids = []
-        lat_count, lon_count = grid_array.shape
-        for i in range(lat_count):
-            grid_indices = np.where(grid_array[i])[0]
-            if grid_indices.size > 0:
-                for j in grid_indices:
-                    grid_id = 1000 * (i + min_lat_idx) + j + min_lon_idx
-                    grid_ids.append(grid_id)
-        return grid_ids
+        rows, cols = np.nonzero(grid_array)
+        return (self.ID_LAT_FACTOR * (rows + min_lat_idx) + cols + min_lon_idx).tolist()
 
-    @classmethod
+    @_grid_method
     def get_grids_in_rectangle(
-        cls, max_latitude: float, min_latitude: float, min_longitude: float, max_longitude: float, altitude: float
+        self, max_latitude: float, min_latitude: float, min_longitude: float, max_longitude: float, altitude: float
     ) -> list[int]:
         """获取给定矩形区域内的所有网格ID
 
@@ -256,43 +553,57 @@ class Grid:
         Returns:
             网格ID列表
         """
-        grid_ids = set()
-
-        lon = min_longitude
-        while lon < max_longitude:
-            lat = min_latitude
-            while lat < max_latitude:
-                grid_id = cls.get_grid_id(lon, lat, altitude)
-                if grid_id is not None:
-                    grid_ids.add(grid_id)
-                lat += cls.DEGREE_UNIT
-            lon += cls.DEGREE_UNIT
-
-        return list(grid_ids)
+        lons = self._sample_axis(min_longitude, max_longitude)
+        lats = self._sample_axis(min_latitude, max_latitude)
+        if lons.size == 0 or lats.size == 0:
+            return []
 
-    @classmethod
-    def get_all_grids(cls) -> list[int]:
+        lon_grid, lat_grid = np.meshgrid(lons, lats, indexing="ij")
+        grid_ids = self.get_grid_ids(lon_grid, lat_grid, altitude)
+        return np.unique(grid_ids[grid_ids >= 0]).tolist()
+
+    @_grid_method
+    def _sample_axis(self, start: float, stop: float) -> np.ndarray:
+        """从 start 开始以 DEGREE_UNIT 为步长逐次累加、小于 stop 的采样点，与逐次 += 的浮点结果一致"""
+        if not start < stop:
+            return np.empty(0)
+        count = math.ceil((stop - start) / self.DEGREE_UNIT) + 2
+        steps = np.full(count, self.DEGREE_UNIT)
+        steps[0] = start
+        samples = np.cumsum(steps)
+        return samples[: np.searchsorted(samples >= stop, True)]
+
+    @_grid_method
+    def get_all_grids(self) -> list[int]:
         """获取整个作战区域内的所有网格ID
 
         Returns:
             网格ID列表
         """
-        grid_ids = []
-        for altitude in cls.ALTITUDE_BANDS:
-            grid_ids.extend(
-                cls.get_grids_in_rectangle(cls.MAX_LATITUDE, cls.MIN_LATITUDE, cls.MIN_LONGITUDE, cls.MAX_LONGITUDE, altitude)
-            )
-        return grid_ids
-
-    # 内部缓存
-    _area_cache = {}
-
-    @classmethod
+        alt_idx, lat_idx, lon_idx = np.meshgrid(
+            np.arange(len(self.ALTITUDE_BANDS)), np.arange(self.LAT_UNIT_COUNT), np.arange(self.LON_UNIT_COUNT), indexing="ij"
+        )
+        return (alt_idx * self.ID_ALT_FACTOR + lat_idx * self.ID_LAT_FACTOR + lon_idx).ravel().tolist()
+
+    # 距离核缓存 {(距离, 纬度带): (核, (核起点相对中心的纬度偏移, 经度偏移))}，按最近使用顺序淘汰
+    KERNEL_CACHE_SIZE = 256
+    KERNEL_LAT_BAND_DEGREES = 0.25  # 共用一个距离核的纬度带宽度(°)
+    KERNEL_LAT_BAND_ROWS = round(KERNEL_LAT_BAND_DEGREES / DEGREE_UNIT)  # 每个纬度带包含的纬度单元数，实例中按其划分单元计算
+
+    @_grid_method
+    def clear_kernel_cache(self) -> None:
+        """清空距离核缓存"""
+        self._kernel_cache.clear()
+
+    @_grid_method
     def _get_area_within_distance(
-        cls, location: tuple[float, float], distance_km: float, return_subarray: bool = False
+        self, location: tuple[float, float], distance_km: float, return_subarray: bool = False
     ) -> tuple[np.ndarray | None, tuple[int, int]]:
         """计算指定位置一定距离范围内的网格数组
 
+        范围完全位于左侧区域时，取位置所在纬度带的距离核按索引偏移放置，距离按网格中心计算；
+        范围涉及稀疏区域时逐网格计算。
+
         Args:
             location: (纬度, 经度)的元组
             distance_km: 距离(公里)
@@ -305,92 +616,96 @@ class Grid:
         if distance <= 0:
             return None, (0, 0)
 
-        max_half_distance = cls._get_max_half_distance()
-        if distance >= max_half_distance:
-            return cls._calculate_area_from_distance(location, distance, return_subarray)
-
-        # 使用缓存
-        if distance in cls._area_cache:
-            area, (min_lat_idx, min_lon_idx) = cls._area_cache[distance]
-        else:
-            center_pos = cls.get_center_position()
-            if center_pos is None:
-                return None, (0, 0)
-            area, (min_lat_idx, min_lon_idx) = cls._calculate_area_from_distance(center_pos, distance, True)
-            cls._area_cache[distance] = (area, (min_lat_idx, min_lon_idx))
-
-        lat_idx = cls._get_latitude_index(location[0])
-        lon_idx = cls._get_longitude_index(location[1])
-        if area is None or lat_idx is None or lon_idx is None:
+        lat_idx = self._get_latitude_index(location[0])
+        lon_idx = self._get_longitude_index(location[1])
+        if lat_idx is None or lon_idx is None:
             return None, (0, 0)
 
-        # 计算偏移
-        lat_delta = lat_idx - cls.CENTER_LAT_INDEX
-        lon_delta = lon_idx - cls.CENTER_LON_INDEX
-        new_lat_idx = min_lat_idx + lat_delta
-        new_lon_idx = min_lon_idx + lon_delta
+        placed = self._place_distance_kernel(lat_idx, lon_idx, distance)
+        if placed is None:
+            return self._calculate_area_from_distance(location, distance, return_subarray)
+        kernel, (start_lat, start_lon) = placed
 
-        # 处理边界情况
-        if 0 <= new_lat_idx < cls.LAT_UNIT_COUNT - area.shape[0] and 0 <= new_lon_idx < cls.LEFT_LON_COUNT - area.shape[1]:
-            new_area = area
-        else:
-            new_area = cls._adjust_area_boundaries(area, new_lat_idx, new_lon_idx)
+        # 裁剪超出网格范围的部分
+        min_lat_idx = max(start_lat, 0)
+        min_lon_idx = max(start_lon, 0)
+        area = kernel[min_lat_idx - start_lat : self.LAT_UNIT_COUNT - start_lat, min_lon_idx - start_lon :]
 
         if return_subarray:
-            return new_area, (new_lat_idx, new_lon_idx)
+            return area, (min_lat_idx, min_lon_idx)
         else:
-            all_area = np.zeros((cls.LAT_UNIT_COUNT, cls.LON_UNIT_COUNT), dtype=np.int8)
-            all_area[new_lat_idx : new_lat_idx + new_area.shape[0], new_lon_idx : new_lon_idx + new_area.shape[1]] = new_area
-            return all_area, (new_lat_idx, new_lon_idx)
+            all_area = np.zeros((self.LAT_UNIT_COUNT, self.LON_UNIT_COUNT), dtype=np.int8)
+            all_area[min_lat_idx : min_lat_idx + area.shape[0], min_lon_idx : min_lon_idx + area.shape[1]] = area
+            return all_area, (min_lat_idx, min_lon_idx)
 
-    @classmethod
-    def _get_max_half_distance(cls) -> float:
-        """计算从中心点到边界的最大距离"""
-        center_pos = cls.get_center_position()
-        if center_pos is None:
-            return 0
-        latitude = cls._get_latitude(0)
-        if latitude is None:
-            return 0
-        longitude = cls._get_longitude(cls.CENTER_LON_INDEX)
-        if longitude is None:
-            return 0
-        edge_pos = (latitude, longitude)
+    @_grid_method
+    def _place_distance_kernel(self, lat_idx: int, lon_idx: int, distance_km: float) -> tuple[np.ndarray, tuple[int, int]] | None:
+        """以指定网格为中心放置距离核
 
-        return get_horizontal_distance(center_pos, edge_pos)
+        结果只取决于网格索引和距离，与位置在网格内的具体经纬度无关。
 
-    @classmethod
-    def _adjust_area_boundaries(cls, area: np.ndarray, new_lat_idx: int, new_lon_idx: int) -> np.ndarray:
-        """调整区域边界以适应网格范围"""
-        if new_lat_idx < 0:
-            left_lat_idx = 0 - new_lat_idx
-            end_lat_idx = area.shape[0]
-            new_lat_idx = 0
-        elif new_lat_idx + area.shape[0] >= cls.LAT_UNIT_COUNT:
-            left_lat_idx = 0
-            end_lat_idx = area.shape[0] - (new_lat_idx + area.shape[0] - cls.LAT_UNIT_COUNT)
-        else:
-            left_lat_idx = 0
-            end_lat_idx = area.shape[0]
-
-        if new_lon_idx < 0:
-            left_lon_idx = 0 - new_lon_idx
-            end_lon_idx = area.shape[1]
-            new_lon_idx = 0
-        elif new_lon_idx + area.shape[1] >= cls.LEFT_LON_COUNT:
-            left_lon_idx = 0
-            end_lon_idx = area.shape[1] - (new_lon_idx + area.shape[1] - cls.LEFT_LON_COUNT)
-        else:
-            left_lon_idx = 0
-            end_lon_idx = area.shape[1]
+        Args:
+            lat_idx: 纬度索引
+            lon_idx: 经度索引
+            distance_km: 距离(公里)，已按 0.1 公里取整
+
+        Returns:
+            (核, (核起点的纬度索引, 经度索引))的元组，未裁剪；范围涉及稀疏区域、需要逐网格计算时返回 None
+        """
+        kernel, (lat_offset, lon_offset) = self._get_distance_kernel(distance_km, lat_idx // self.KERNEL_LAT_BAND_ROWS)
+        start_lon = lon_idx + lon_offset
+        if start_lon + kernel.shape[1] > self.LEFT_LON_COUNT:
+            return None
+        return kernel, (lat_idx + lat_offset, start_lon)
 
-        return area[left_lat_idx:end_lat_idx, left_lon_idx:end_lon_idx]
+    @_grid_method
+    def _get_distance_kernel(self, distance_km: float, lat_band: int) -> tuple[np.ndarray, tuple[int, int]]:
+        """获取距离核：以纬度带中间一行的网格为中心、左侧区域间隔下中心距离小于 distance_km 的网格掩码
 
-    @classmethod
+        Args:
+            distance_km: 距离(公里)
+            lat_band: 纬度带序号
+
+        Returns:
+            (核, (核起点相对中心网格的纬度偏移, 经度偏移))的元组，核为只读数组
+        """
+        key = (distance_km, lat_band)
+        cached = self._kernel_cache.get(key)
+        if cached is not None:
+            self._kernel_cache.move_to_end(key)
+            return cached
+
+        center_row = min(lat_band * self.KERNEL_LAT_BAND_ROWS + self.KERNEL_LAT_BAND_ROWS // 2, self.LAT_UNIT_COUNT - 1)
+        center_lat = self.MIN_LATITUDE + (center_row + 0.5) * self.DEGREE_UNIT
+        # 多取一个单元，保证覆盖全部距离内的网格，再裁掉空行、空列
+        lat_half = math.ceil(distance_km / (self.LAT_DEGREE_DISTANCE * self.DEGREE_UNIT)) + 1
+        lon_degree_dis = self.LAT_DEGREE_DISTANCE * math.cos(
+            min(abs(center_lat) + lat_half * self.DEGREE_UNIT, 89) * degree2radian
+        )
+        lon_half = math.ceil(distance_km / (lon_degree_dis * self.DEGREE_UNIT)) + 1
+        lat_offsets = np.arange(-lat_half, lat_half + 1)
+        lon_offsets = np.arange(-lon_half, lon_half + 1)
+        distances = geo_vector.horizontal_distance(
+            center_lat, 0.0, center_lat + lat_offsets[:, None] * self.DEGREE_UNIT, lon_offsets[None, :] * self.DEGREE_UNIT
+        )
+        kernel = (distances < distance_km).astype(np.int8)
+
+        rows = np.flatnonzero(kernel.any(axis=1))
+        cols = np.flatnonzero(kernel.any(axis=0))
+        kernel = kernel[rows[0] : rows[-1] + 1, cols[0] : cols[-1] + 1]
+        kernel.flags.writeable = False
+        cached = (kernel, (int(lat_offsets[rows[0]]), int(lon_offsets[cols[0]])))
+
+        self._kernel_cache[key] = cached
+        if len(self._kernel_cache) > self.KERNEL_CACHE_SIZE:
+            self._kernel_cache.popitem(last=False)
+        return cached
+
+    @_grid_method
     def _calculate_area_from_distance(
-        cls, location: tuple[float, float], distance_km: float, return_subarray: bool = False
+        self, location: tuple[float, float], distance_km: float, return_subarray: bool = False
     ) -> tuple[np.ndarray | None, tuple[int, int]]:
-        """计算指定位置和距离范围内的网格数组
+        """计算指定位置和距离范围内的网格数组，逐网格计算位置到网格中心的距离
 
         Args:
             location: (纬度, 经度)的元组
@@ -400,190 +715,33 @@ class Grid:
         Returns:
             (网格数组, (最小纬度索引, 最小经度索引))的元组
         """
-        air_lat_index = cls._get_latitude_index(location[0])
-        air_lon_index = cls._get_longitude_index(location[1])
-        if air_lat_index is None or air_lon_index is None:
+        if self._get_latitude_index(location[0]) is None or self._get_longitude_index(location[1]) is None:
             return None, (0, 0)
 
         # 计算经度方向上的距离
-        lon_degree_dis = cls.LAT_DEGREE_DISTANCE * math.cos(location[0] * degree2radian)
+        lon_degree_dis = self.LAT_DEGREE_DISTANCE * math.cos(location[0] * degree2radian)
 
         # 计算边界经纬度
-        min_lon = max(cls.MIN_LONGITUDE, location[1] - distance_km / lon_degree_dis)
-        max_lon = min(cls.MAX_LONGITUDE - 1e-4, location[1] + distance_km / lon_degree_dis)
-        min_lat = max(cls.MIN_LATITUDE, location[0] - distance_km / cls.LAT_DEGREE_DISTANCE)
-        max_lat = min(cls.MAX_LATITUDE - 1e-4, location[0] + distance_km / cls.LAT_DEGREE_DISTANCE)
+        min_lon = max(self.MIN_LONGITUDE, location[1] - distance_km / lon_degree_dis)
+        max_lon = min(self.MAX_LONGITUDE - 1e-4, location[1] + distance_km / lon_degree_dis)
+        min_lat = max(self.MIN_LATITUDE, location[0] - distance_km / self.LAT_DEGREE_DISTANCE)
+        max_lat = min(self.MAX_LATITUDE - 1e-4, location[0] + distance_km / self.LAT_DEGREE_DISTANCE)
 
         # 获取边界索引
-        min_lat_index = cls._get_latitude_index(min_lat)
-        max_lat_index = cls._get_latitude_index(max_lat)
-        min_lon_index = cls._get_longitude_index(min_lon)
-        max_lon_index = cls._get_longitude_index(max_lon)
+        min_lat_index = self._get_latitude_index(min_lat)
+        max_lat_index = self._get_latitude_index(max_lat)
+        min_lon_index = self._get_longitude_index(min_lon)
+        max_lon_index = self._get_longitude_index(max_lon)
         if min_lat_index is None or max_lat_index is None or min_lon_index is None or max_lon_index is None:
             return None, (0, 0)
 
-        lat_valid_count = max_lat_index - min_lat_index + 1
-        lon_valid_count = max_lon_index - min_lon_index + 1
-        in_area = np.zeros((lat_valid_count, lon_valid_count), dtype=np.int8)
-        max_axis_unit_count = max(lat_valid_count, lon_valid_count)
-
-        # 小范围处理
-        if max_axis_unit_count < 11:
-            lon_degree_unit_dis = lon_degree_dis * cls.DEGREE_UNIT
-            delta_lat = math.floor(distance_km / (cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT) / math.sqrt(2)) - 1
-            delta_lon = math.floor(distance_km / lon_degree_unit_dis / math.sqrt(2)) - 1
-
-            valid_min_lat = max(air_lat_index - delta_lat, min_lat_index) - min_lat_index
-            valid_min_lon = max(air_lon_index - delta_lon, min_lon_index) - min_lon_index
-            valid_max_lat = min(air_lat_index + delta_lat, max_lat_index) - min_lat_index + 1
-            valid_max_lon = min(air_lon_index + delta_lon, max_lon_index) - min_lon_index + 1
-
-            in_area[valid_min_lat:valid_max_lat, valid_min_lon:valid_max_lon] = 1
-
-            for lat_index in range(min_lat_index, max_lat_index + 1):
-                for lon_index in range(min_lon_index, max_lon_index + 1):
-                    if not (
-                        air_lat_index - delta_lat <= lat_index <= air_lat_index + delta_lat
-                        and air_lon_index - delta_lon <= lon_index <= air_lon_index + delta_lon
-                    ):
-                        horizontal_position = cls._get_horizontal_position(lat_index, lon_index)
-                        if horizontal_position is None:
-                            continue
-                        h_dis = get_horizontal_distance(location, horizontal_position)
-                        if h_dis < distance_km:
-                            in_area[lat_index - min_lat_index][lon_index - min_lon_index] = 1
-
-        # 中等范围处理
-        elif max_axis_unit_count < 56:
-            lon_grid_len_up = math.cos((location[0] + 1 / 60) * degree2radian) * (cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT)
-            lon_grid_len_down = math.cos((location[0] - 1 / 60) * degree2radian) * (cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT)
-            lon_grid_len_up *= lon_grid_len_up
-            lon_grid_len_down *= lon_grid_len_down
-
-            lon_all_count = math.floor(distance_km / lon_degree_dis / cls.DEGREE_UNIT)
-            air_lat_index_array = air_lat_index - min_lat_index
-            air_lon_index_array = air_lon_index - min_lon_index
-
-            for i in range(1, lon_all_count):
-                lon_delta = i - 1
-                lat_count_up = (
-                    math.floor(
-                        math.sqrt(distance_km * distance_km - i * i * lon_grid_len_up)
-                        / (cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT)
-                    )
-                    - 1
-                )
-                lat_count_down = (
-                    math.floor(
-                        math.sqrt(distance_km * distance_km - i * i * lon_grid_len_down)
-                        / (cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT)
-                    )
-                    - 1
-                )
-
-                r1 = max(0, air_lat_index_array - lat_count_down)
-                r2 = min(lat_valid_count, air_lat_index_array + lat_count_up + 1)
-                c1 = max(0, air_lon_index_array - lon_delta)
-                c2 = min(lon_valid_count, air_lon_index_array + lon_delta + 1)
-                in_area[r1:r2, c1:c2] = 1
-
-            # 检查剩余格子
-            for lat_index in range(min_lat_index, max_lat_index + 1):
-                have_in = False
-                for lon_index in range(min_lon_index, max_lon_index + 1):
-                    if in_area[lat_index - min_lat_index][lon_index - min_lon_index] != 1:
-                        horizontal_position = cls._get_horizontal_position(lat_index, lon_index)
-                        if horizontal_position is None:
-                            continue
-                        h_dis = get_horizontal_distance(location, horizontal_position)
-                        if h_dis < distance_km:
-                            have_in = True
-                            in_area[lat_index - min_lat_index][lon_index - min_lon_index] = 1
-                        elif have_in:
-                            break
-
-        # 大范围处理
-        else:
-            lon_grid_len_up = math.cos((location[0] + 1 / 60) * degree2radian) * (cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT)
-            lon_grid_len_down = math.cos((location[0] - 1 / 60) * degree2radian) * (cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT)
-            lon_grid_len_up *= lon_grid_len_up
-            lon_grid_len_down *= lon_grid_len_down
-
-            lon_all_count = math.floor(distance_km / lon_degree_dis / cls.DEGREE_UNIT)
-            air_lat_index_array = air_lat_index - min_lat_index
-            air_lon_index_array = air_lon_index - min_lon_index
-
-            for i in range(1, lon_all_count):
-                lon_delta = i - 1
-                lat_count_up = (
-                    math.floor(
-                        math.sqrt(distance_km * distance_km - i * i * lon_grid_len_up)
-                        / (cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT)
-                    )
-                    - 1
-                )
-                lat_count_down = (
-                    math.floor(
-                        math.sqrt(distance_km * distance_km - i * i * lon_grid_len_down)
-                        / (cls.LAT_DEGREE_DISTANCE * cls.DEGREE_UNIT)
-                    )
-                    - 1
-                )
-
-                r1 = max(0, air_lat_index_array - lat_count_down)
-                r2 = min(lat_valid_count, air_lat_index_array + lat_count_up + 1)
-                c1 = max(0, air_lon_index_array - lon_delta)
-                c2 = min(lon_valid_count, air_lon_index_array + lon_delta + 1)
-                in_area[r1:r2, c1:c2] = 1
-
-            # 检查边界行
-            for r in [0, 1, 3, lat_valid_count - 3, lat_valid_count - 2, lat_valid_count - 1]:
-                horizontal_position = cls._get_horizontal_position(r + min_lat_index, air_lon_index)
-                if horizontal_position is None:
-                    continue
-                h_dis = get_horizontal_distance(location, horizontal_position)
-                if h_dis < distance_km:
-                    in_area[r][air_lon_index_array] = 1
-
-            # 优化检查范围
-            for r in range(lat_valid_count):
-                one_array = np.where(in_area[r])[0]
-                if one_array.size > 0:
-                    if r == 0:
-                        check_more_count = 10
-                    elif r < 5:
-                        check_more_count = 20
-                    elif r < 13:
-                        check_more_count = 8
-                    elif r < 20 or lat_valid_count - r < 15:
-                        check_more_count = 5
-                    else:
-                        check_more_count = 3
-
-                    left_check = max(0, one_array[0] - check_more_count)
-                    right_check = min(lon_valid_count, one_array[-1] + check_more_count)
-
-                    # 检查左侧
-                    for i in range(left_check, one_array[0]):
-                        horizontal_position = cls._get_horizontal_position(r + min_lat_index, i + min_lon_index)
-                        if horizontal_position is None:
-                            continue
-                        h_dis = get_horizontal_distance(location, horizontal_position)
-                        if h_dis < distance_km:
-                            in_area[r][i] = 1
-
-                    # 检查右侧
-                    for i in range(one_array[-1] + 1, right_check):
-                        horizontal_position = cls._get_horizontal_position(r + min_lat_index, i + min_lon_index)
-                        if horizontal_position is None:
-                            continue
-                        h_dis = get_horizontal_distance(location, horizontal_position)
-                        if h_dis < distance_km:
-                            in_area[r][i] = 1
+        lats = self.lat_centers[min_lat_index : max_lat_index + 1, None]
+        lons = self.lon_centers[None, min_lon_index : max_lon_index + 1]
+        in_area = (geo_vector.horizontal_distance(location[0], location[1], lats, lons) < distance_km).astype(np.int8)
 
         if return_subarray:
             return in_area, (min_lat_index, min_lon_index)
         else:
-            all_area = np.zeros((cls.LAT_UNIT_COUNT, cls.LON_UNIT_COUNT), dtype=np.int8)
+            all_area = np.zeros((self.LAT_UNIT_COUNT, self.LON_UNIT_COUNT), dtype=np.int8)
             all_area[min_lat_index : max_lat_index + 1, min_lon_index : max_lon_index + 1] = in_area
             return all_area, (min_lat_index, min_lon_index)
@@ -0,0 +1,145 @@
+"""
+JSON 解码后端
+
+态势数据（GetAllState/UpdateState）通常有数 MB，解码耗时在每步推演中占比很高。
+本模块在导入时选择一次解码后端：
+
+- MOZI_JSON_BACKEND=auto（默认）：依次尝试 msgspec、orjson，都未安装时使用标准库 json
+- MOZI_JSON_BACKEND=msgspec/orjson/json：指定后端，未安装时退回自动选择
+
+编码（dumps）使用与解码相同的后端，输出紧凑、不转义非 ASCII 字符的 JSON，用于 Master 代理转发态势数据。
+"""
+
+import os
+import json
+from collections.abc import Callable
+from typing import Any
+
+from .log import mprint_with_name
+
+mprint = mprint_with_name("JsonCodec")
+
+# 按优先级排列的后端名称
+BACKENDS = ("msgspec", "orjson", "json")
+
+
+def _load_decoder(name: str) -> Callable[[str | bytes], Any] | None:
+    """加载指定后端的解码函数，未安装时返回 None"""
+    if name == "msgspec":
+        try:
+            import msgspec
+        except ImportError:
+            return None
+        return msgspec.json.Decoder().decode
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            return None
+        return orjson.loads
+    if name == "json":
+        return json.loads
+    raise ValueError(f"未知的 JSON 解码后端: {name}，可选值为 {BACKENDS}")
+
+
+def _load_encoder(name: str) -> Callable[[Any], str]:
+    """加载指定后端的编码函数，后端需已确认可用"""
+    if name == "msgspec":
+        import msgspec
+
+        encode = msgspec.json.Encoder().encode
+        return lambda obj: encode(obj).decode()
+    if name == "orjson":
+        import orjson
+
+        return lambda obj: orjson.dumps(obj).decode()
+    return lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def available_backends() -> list[str]:
+    """
+    获取当前环境中可用的解码后端
+
+    Returns:
+        list[str]: 按优先级排列的后端名称
+    """
+    return [name for name in BACKENDS if _load_decoder(name) is not None]
+
+
+def get_decoder(name: str) -> Callable[[str | bytes], Any]:
+    """
+    获取指定后端的解码函数
+
+    Args:
+        name: 后端名称，msgspec/orjson/json
+
+    Returns:
+        Callable: 解码函数
+
+    Raises:
+        ValueError: 未知的后端名称
+        RuntimeError: 后端未安装
+    """
+    decoder = _load_decoder(name)
+    if decoder is None:
+        raise RuntimeError(f"JSON 解码后端 {name} 未安装")
+    return decoder
+
+
+def _select_backend() -> tuple[str, Callable[[str | bytes], Any]]:
+    name = os.getenv("MOZI_JSON_BACKEND", "auto").lower()
+    if name != "auto":
+        try:
+            decoder = _load_decoder(name)
+        except ValueError as e:
+            mprint.warning(f"{e}，改为自动选择")
+            decoder = None
+        if decoder is not None:
+            return name, decoder
+        mprint.warning(f"JSON 解码后端 {name} 不可用，改为自动选择")
+
+    for candidate in BACKENDS:
+        decoder = _load_decoder(candidate)
+        if decoder is not None:
+            return candidate, decoder
+    raise RuntimeError("没有可用的 JSON 解码后端")
+
+
+json_backend, _decode = _select_backend()
+_encode = _load_encoder(json_backend)
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    使用启动时选定的后端解码 JSON
+
+    msgspec/orjson 不接受 NaN、Infinity 等非标准字面量，解码失败时退回标准库 json 重试，
+    保证结果与 json.loads 一致。
+
+    Args:
+        data: JSON 字符串或字节串
+
+    Returns:
+        Any: 解码结果
+    """
+    try:
+        return _decode(data)
+    except Exception:
+        if json_backend == "json":
+            raise
+        return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    使用启动时选定的后端编码 JSON
+
+    msgspec/orjson 将 NaN、Infinity 编码为 null，标准库 json 编码为非标准字面量。
+
+    Args:
+        obj: 待编码的对象
+
+    Returns:
+        str: 紧凑格式的 JSON 字符串
+    """
+    return _encode(obj)
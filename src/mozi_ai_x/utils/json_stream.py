@@ -0,0 +1,192 @@
+import re
+import json
+from typing import Any
+
+# 成员中需要关注的结构字符：不在字符串内时
+_MEMBER_TOKENS = re.compile(r'[{}\[\]",]')
+# 嵌套在对象、数组内时，逗号不会结束成员
+_NESTED_TOKENS = re.compile(r'[{}\[\]"]')
+# 字符串内需要关注的字符：结束引号和转义符
+_STRING_TOKENS = re.compile(r'["\\]')
+
+
+class JsonObjectStreamDecoder:
+    """
+    顶层 JSON 对象的增量解码器
+
+    态势数据的格式为 {"guid_1": {...}, "guid_2": {...}, ...}，本类按块接收字符串，
+    每当一个完整的成员解析完成即返回 (key, value)，已消费的数据会被丢弃，
+    因此内存占用只与单个成员的大小有关，而与完整返回数据的大小无关。
+
+    成员跨越多个数据块时，后续数据块只增量扫描括号和字符串的嵌套层次，找到成员的结束位置后才拼接并解码一次，
+    总耗时与数据量成线性关系。
+
+    示例
+    ```python
+    decoder = JsonObjectStreamDecoder()
+    async for chunk in stream:
+        for guid, item in decoder.feed(chunk):
+            apply(item)
+    decoder.close()
+    ```
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        # 不完整的成员之后收到的数据块，找到成员结束位置前不拼接；None 表示没有不完整的成员
+        self._chunks: list[str] | None = None
+        # 不完整成员的扫描状态：嵌套层次、是否在字符串内、上一块是否以转义符结尾
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def finished(self) -> bool:
+        """是否已读取到顶层对象的结束符"""
+        return self._finished
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """
+        输入一块数据，返回其中已完整的成员
+
+        Args:
+            chunk: 数据块
+
+        Returns:
+            list[tuple[str, Any]]: (键, 值) 列表
+
+        Raises:
+            ValueError: 数据不是合法的 JSON 对象
+        """
+        if self._finished:
+            if chunk.strip():
+                raise ValueError("JSON 对象结束后仍有数据")
+            return []
+        if self._chunks is not None:
+            if self._scan(chunk) is None:
+                self._chunks.append(chunk)
+                return []
+            self._buffer = "".join([self._buffer, *self._chunks, chunk])
+            self._chunks = None
+        else:
+            self._buffer += chunk
+        return self._drain()
+
+    def close(self) -> None:
+        """
+        结束输入，检查数据是否完整
+
+        Raises:
+            ValueError: 数据不完整
+        """
+        if not self._finished:
+            remaining = len(self._buffer) + sum(map(len, self._chunks or ()))
+            raise ValueError(f"JSON 数据不完整，剩余 {remaining} 个字符未解析")
+
+    def _skip_whitespace(self, pos: int) -> int:
+        buffer = self._buffer
+        length = len(buffer)
+        while pos < length and buffer[pos] in " \t\r\n":
+            pos += 1
+        return pos
+
+    def _scan(self, text: str, pos: int = 0) -> int | None:
+        """
+        从 pos 开始继续扫描不完整的成员
+
+        Returns:
+            int | None: 成员之后的 ',' 或 '}' 在 text 中的位置，未找到时返回 None（扫描状态保留到下一块）
+        """
+        depth = self._depth
+        in_string = self._in_string
+        if self._escape and pos < len(text):
+            # 上一块以转义符结尾，跳过被转义的字符
+            self._escape = False
+            pos += 1
+        while True:
+            if in_string:
+                match = _STRING_TOKENS.search(text, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                if match.group() == "\\":
+                    if pos >= len(text):
+                        self._escape = True
+                        break
+                    pos += 1
+                else:
+                    in_string = False
+                continue
+            match = (_NESTED_TOKENS if depth else _MEMBER_TOKENS).search(text, pos)
+            if match is None:
+                break
+            pos = match.end()
+            char = match.group()
+            if char == '"':
+                in_string = True
+            elif char in "{[":
+                depth += 1
+            elif depth:
+                depth -= 1
+            else:
+                # 嵌套层次为 0 时的 ',' 或 '}'（或多余的 ']'，由解码报错）
+                return match.start()
+        self._depth = depth
+        self._in_string = in_string
+        return None
+
+    def _decode_member(self, pos: int) -> tuple[str, Any, int]:
+        """解码从 pos 开始的成员，返回 (键, 值, 值的结束位置)；数据不完整时抛出 JSONDecodeError"""
+        buffer = self._buffer
+        key, value_start = self._decoder.raw_decode(buffer, pos)
+        value_start = self._skip_whitespace(value_start)
+        if value_start >= len(buffer):
+            raise json.JSONDecodeError("incomplete", buffer, value_start)
+        if buffer[value_start] != ":":
+            raise ValueError(f"JSON 对象格式错误，位置 {value_start}")
+        value, end = self._decoder.raw_decode(buffer, self._skip_whitespace(value_start + 1))
+        # 值之后必须还有数据（',' 或 '}'），保证数字等标量不会被截断
+        if end >= len(buffer):
+            raise json.JSONDecodeError("incomplete", buffer, end)
+        return key, value, end
+
+    def _drain(self) -> list[tuple[str, Any]]:
+        items = []
+        buffer = self._buffer
+        pos = self._skip_whitespace(0)
+
+        if not self._started:
+            if pos >= len(buffer):
+                return items
+            if buffer[pos] != "{":
+                raise ValueError(f"不是合法的 JSON 对象: {buffer[:50]!r}")
+            self._started = True
+            pos += 1
+
+        while True:
+            pos = self._skip_whitespace(pos)
+            if pos < len(buffer) and buffer[pos] == ",":
+                pos = self._skip_whitespace(pos + 1)
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "}":
+                self._finished = True
+                pos += 1
+                break
+
+            try:
+                key, value, pos = self._decode_member(pos)
+            except json.JSONDecodeError:
+                # 成员不完整，或者格式错误：扫描其结束位置，已完整的成员无法解码时数据有误
+                self._depth, self._in_string, self._escape = 0, False, False
+                if self._scan(buffer, pos) is not None:
+                    raise
+                self._chunks = []
+                break
+            items.append((key, value))
+
+        self._buffer = buffer[pos:]
+        return items
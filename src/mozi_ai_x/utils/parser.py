@@ -1,6 +1,6 @@
 import re
 
-from ..database import default_db
+from ..database import get_default_db
 
 
 guid_list_pattern = re.compile(r"\[\d\] = '([0-9a-z-^=]+)'")
@@ -52,7 +52,6 @@ def parse_weapons_record(weapon_ratio: str) -> list[dict]:
         武器的精简信息
     """
     info = []
-    weapon_name_type = {}
     w_set = set()
     if "@" in weapon_ratio:
         load_ratios = weapon_ratio.split("@")
@@ -82,8 +81,7 @@ def parse_weapons_record(weapon_ratio: str) -> list[dict]:
             )
             w_set.add(w_id)
     if info:
-        for wid in w_set:
-            weapon_name_type[wid] = default_db.get_weapon_name_type(wid)
+        weapon_name_type = get_default_db().get_weapon_name_types(w_set)
         for w_info in info:
             name_type = weapon_name_type[w_info["wpn_dbid"]]
             w_info["wpn_name"] = name_type[0]
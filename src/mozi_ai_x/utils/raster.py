@@ -0,0 +1,244 @@
+"""
+网格覆盖栅格
+
+在 Grid 上按推演方维护占据、探测覆盖、武器覆盖等图层，每个图层是形状 (纬度单元数, 经度单元数) 的计数数组，
+记录每个网格被多少个对象覆盖。对象移动时只对其所在网格或覆盖半径发生变化的对象，减去旧的覆盖范围、加上新的覆盖范围，
+无需每步按全部对象重建。
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .general import np3_to_np1
+from .grid import Grid
+
+# 半径不大于 0 时只覆盖所在网格
+_SINGLE_CELL = np.ones((1, 1), dtype=np.uint8)
+_SINGLE_CELL.flags.writeable = False
+
+
+class _Stamp(NamedTuple):
+    """对象在图层上的覆盖记录"""
+
+    lat_idx: int
+    lon_idx: int
+    radius: float
+    min_lat_idx: int
+    min_lon_idx: int
+    area: np.ndarray  # uint8 覆盖掩码，左上角位于 (min_lat_idx, min_lon_idx)
+    latitude: float
+    longitude: float
+    exact: bool  # 覆盖范围逐网格计算，取决于具体经纬度而不只是所在网格
+
+
+class GridRaster:
+    """
+    网格覆盖栅格
+
+    - 图层由 (推演方, 图层名) 确定，图层名由调用方约定，如 occupancy（占据）、sensor（探测覆盖）、weapon（武器覆盖）
+    - 覆盖范围为网格中心与对象所在位置的距离小于半径的网格（与 Grid.get_grids_within_distance 一致），
+      半径不大于 0 时只覆盖对象所在网格
+    - 以网格为单位判断位置变化：对象在同一网格内移动且半径不变时不重新计算；
+      覆盖范围涉及稀疏区域时 Grid 逐网格计算，结果取决于具体经纬度，此时位置变化即重新计算
+    - 计数为 uint16，同一网格最多被 65535 个对象覆盖
+
+    示例
+    ```python
+    raster = GridRaster(Grid.default())
+
+    # 每步同步推演方的单元，只重新计算移动到其他网格的单元
+    units = situation.get_side_objects(side_guid, "units")
+    raster.sync(side_guid, "occupancy", units)
+    raster.sync(side_guid, "sensor", units, radius_km=lambda unit: sensor_ranges.get(unit.db_id, 0.0))
+
+    covered = raster.get_mask(side_guid, "sensor")       # bool 数组 (纬度单元数, 经度单元数)
+    packed = raster.pack(side_guid, ["occupancy", "sensor"])  # 按 np3_to_np1 格式打包，每个图层为第一维的一层
+    ```
+    """
+
+    def __init__(self, grid: Grid | None = None):
+        """
+        Args:
+            grid: 网格，默认为 Grid.default()
+        """
+        self.grid = grid if grid is not None else Grid.default()
+        self._counts: dict[tuple[str, str], NDArray[np.uint16]] = {}
+        self._stamps: dict[tuple[str, str], dict[str, _Stamp]] = {}
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """图层形状 (纬度单元数, 经度单元数)"""
+        return self.grid.LAT_UNIT_COUNT, self.grid.LON_UNIT_COUNT
+
+    @property
+    def layers(self) -> list[tuple[str, str]]:
+        """已有图层 [(推演方, 图层名), ...]"""
+        return list(self._counts)
+
+    def update(self, side: str, layer: str, guid: str, latitude: float, longitude: float, radius_km: float = 0.0) -> bool:
+        """
+        更新对象在图层上的覆盖范围
+
+        Args:
+            side: 推演方 GUID
+            layer: 图层名
+            guid: 对象 GUID
+            latitude: 纬度
+            longitude: 经度
+            radius_km: 覆盖半径(公里)，不大于 0 时只覆盖所在网格
+
+        Returns:
+            bool: 是否重新计算了覆盖范围（对象位于网格外时移除其覆盖范围，也返回 True）
+        """
+        key = (side, layer)
+        stamps = self._stamps.get(key)
+        if stamps is None:
+            stamps = self._stamps[key] = {}
+            self._counts[key] = np.zeros(self.shape, dtype=np.uint16)
+        old = stamps.get(guid)
+
+        grid = self.grid
+        lat_idx = grid._get_latitude_index(latitude)
+        lon_idx = grid._get_longitude_index(longitude)
+        radius = max(round(radius_km, 1), 0.0)
+        if lat_idx is None or lon_idx is None:
+            if old is None:
+                return False
+            self._unstamp(key, stamps.pop(guid))
+            return True
+        if (
+            old is not None
+            and old.lat_idx == lat_idx
+            and old.lon_idx == lon_idx
+            and old.radius == radius
+            and (not old.exact or (old.latitude == latitude and old.longitude == longitude))
+        ):
+            return False
+
+        exact = False
+        if radius > 0:
+            exact = grid._place_distance_kernel(lat_idx, lon_idx, radius) is None
+            area, (min_lat_idx, min_lon_idx) = grid._get_area_within_distance((latitude, longitude), radius, True)
+            if area is None:
+                area, (min_lat_idx, min_lon_idx) = _SINGLE_CELL, (lat_idx, lon_idx)
+            else:
+                area = area.view(np.uint8)
+        else:
+            area, (min_lat_idx, min_lon_idx) = _SINGLE_CELL, (lat_idx, lon_idx)
+
+        if old is not None:
+            self._unstamp(key, old)
+        stamp = stamps[guid] = _Stamp(lat_idx, lon_idx, radius, min_lat_idx, min_lon_idx, area, latitude, longitude, exact)
+        view = self._counts[key][min_lat_idx : min_lat_idx + area.shape[0], min_lon_idx : min_lon_idx + area.shape[1]]
+        view += stamp.area
+        return True
+
+    def remove(self, side: str, layer: str, guid: str) -> bool:
+        """
+        移除对象在图层上的覆盖范围
+
+        Returns:
+            bool: 对象是否在图层上
+        """
+        key = (side, layer)
+        stamp = self._stamps.get(key, {}).pop(guid, None)
+        if stamp is None:
+            return False
+        self._unstamp(key, stamp)
+        return True
+
+    def remove_object(self, guid: str) -> None:
+        """移除对象在全部图层上的覆盖范围（如对象被删除时）"""
+        for key, stamps in self._stamps.items():
+            stamp = stamps.pop(guid, None)
+            if stamp is not None:
+                self._unstamp(key, stamp)
+
+    def sync(self, side: str, layer: str, objects: Mapping[str, Any], radius_km: float | Callable[[Any], float] = 0.0) -> int:
+        """
+        按对象集合同步图层：更新集合中对象的覆盖范围，移除不在集合中的对象
+
+        Args:
+            side: 推演方 GUID
+            layer: 图层名
+            objects: {guid: obj}，对象需有 latitude、longitude 属性，如 CSituation.get_side_objects 的返回值
+            radius_km: 覆盖半径(公里)，或根据对象计算半径的函数
+
+        Returns:
+            int: 重新计算覆盖范围的对象数量
+        """
+        radius_of = radius_km if callable(radius_km) else None
+        changed = 0
+        for guid, obj in objects.items():
+            latitude = getattr(obj, "latitude", None)
+            longitude = getattr(obj, "longitude", None)
+            if latitude is None or longitude is None:
+                changed += self.remove(side, layer, guid)
+                continue
+            radius = radius_of(obj) if radius_of is not None else radius_km
+            changed += self.update(side, layer, guid, latitude, longitude, radius)
+        stale = [guid for guid in self._stamps.get((side, layer), ()) if guid not in objects]
+        for guid in stale:
+            self.remove(side, layer, guid)
+        return changed + len(stale)
+
+    def get_counts(self, side: str, layer: str) -> NDArray[np.uint16]:
+        """
+        获取图层的覆盖计数
+
+        Returns:
+            NDArray[np.uint16]: 形状 (纬度单元数, 经度单元数) 的只读视图，图层不存在时为全 0 数组
+        """
+        counts = self._counts.get((side, layer))
+        if counts is None:
+            counts = np.zeros(self.shape, dtype=np.uint16)
+        view = counts.view()
+        view.flags.writeable = False
+        return view
+
+    def get_mask(self, side: str, layer: str) -> NDArray[np.bool_]:
+        """获取图层的覆盖掩码，形状 (纬度单元数, 经度单元数)"""
+        return self.get_counts(side, layer) > 0
+
+    def get_grid_ids(self, side: str, layer: str) -> list[int]:
+        """
+        获取图层覆盖的网格ID（纬度索引 * ID_LAT_FACTOR + 经度索引，与 Grid.get_grids_within_distance 一致）
+        """
+        rows, cols = np.nonzero(self.get_counts(side, layer))
+        return (rows * self.grid.ID_LAT_FACTOR + cols).tolist()
+
+    def pack(self, side: str, layers: str | Sequence[str]) -> np.ndarray:
+        """
+        将图层的覆盖掩码按 np3_to_np1 格式打包
+
+        Args:
+            side: 推演方 GUID
+            layers: 图层名，多个图层时按顺序作为三维数组的第一维
+
+        Returns:
+            np.ndarray: 1维 uint8 数组，解包时使用形状 (图层数, 纬度单元数, 经度单元数)
+        """
+        names = [layers] if isinstance(layers, str) else list(layers)
+        masks = np.stack([self.get_mask(side, name) for name in names])
+        return np3_to_np1(masks)
+
+    def clear(self, sides: Iterable[str] | None = None) -> None:
+        """清空推演方的全部图层，sides 为 None 时清空全部图层"""
+        if sides is None:
+            self._counts.clear()
+            self._stamps.clear()
+            return
+        sides = set(sides)
+        for key in [key for key in self._counts if key[0] in sides]:
+            del self._counts[key]
+            del self._stamps[key]
+
+    def _unstamp(self, key: tuple[str, str], stamp: _Stamp) -> None:
+        area = stamp.area
+        view = self._counts[key][
+            stamp.min_lat_idx : stamp.min_lat_idx + area.shape[0], stamp.min_lon_idx : stamp.min_lon_idx + area.shape[1]
+        ]
+        view -= area
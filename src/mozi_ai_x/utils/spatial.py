@@ -0,0 +1,273 @@
+"""
+经纬度网格空间索引
+
+按固定大小的经纬度网格划分地球表面，每个网格保存其中的对象。对象位置变化时只在跨越网格时
+移动一次，查询时只检查与查询范围相交的网格，再按大圆距离精确筛选，
+避免对全部对象逐一计算距离。
+"""
+
+import math
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from .geo import EARTH_RADIUS, degree2radian
+
+# 地球半周长（km），大于该值的半径覆盖整个地球
+HALF_CIRCUMFERENCE_KM = math.pi * EARTH_RADIUS / 1000
+
+
+def point_in_polygon(latitude: float, longitude: float, points: Sequence[tuple[float, float]]) -> bool:
+    """
+    判断点是否在多边形内（射线法）
+
+    多边形的边按经纬度平面上的直线处理，不支持跨越 180° 经线的多边形。
+
+    Args:
+        latitude: 纬度
+        longitude: 经度
+        points: 多边形顶点 [(lat, lon), ...]
+
+    Returns:
+        bool: 是否在多边形内
+    """
+    inside = False
+    lat_j, lon_j = points[-1]
+    for lat_i, lon_i in points:
+        if (lat_i > latitude) != (lat_j > latitude):
+            cross_lon = lon_i + (latitude - lat_i) * (lon_j - lon_i) / (lat_j - lat_i)
+            if longitude < cross_lon:
+                inside = not inside
+        lat_j, lon_j = lat_i, lon_i
+    return inside
+
+
+class SpatialIndex:
+    """
+    经纬度网格空间索引
+
+    支持半径查询、最近邻查询和多边形区域查询，距离单位为 km（与 get_horizontal_distance 一致）。
+
+    示例
+    ```python
+    index = SpatialIndex(cell_size=1.0)
+    index.update(guid, obj, latitude=40.9, longitude=140.0)
+
+    index.within_radius(40.0, 140.0, 200)       # [(距离, guid, obj), ...]，按距离升序
+    index.nearest(40.0, 140.0, k=5)              # 最近的 5 个对象
+    index.within_polygon([(40, 139), (41, 139), (41, 141), (40, 141)])
+    ```
+    """
+
+    __slots__ = ("cell_size", "_lat_count", "_lon_count", "_cells", "_entries")
+
+    def __init__(self, cell_size: float = 1.0):
+        """
+        Args:
+            cell_size: 网格大小（度），默认 1°（约 111 km）
+
+        Raises:
+            ValueError: 网格大小不在 (0, 90] 范围内
+        """
+        if not 0 < cell_size <= 90:
+            raise ValueError(f"网格大小应在 (0, 90] 范围内: {cell_size}")
+        self.cell_size = cell_size
+        self._lat_count = math.ceil(180 / cell_size)
+        self._lon_count = math.ceil(360 / cell_size)
+        # {(纬度网格, 经度网格): {guid: obj}}
+        self._cells: dict[tuple[int, int], dict[str, Any]] = {}
+        # {guid: (纬度, 经度, 所在网格)}
+        self._entries: dict[str, tuple[float, float, tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, guid: object) -> bool:
+        return guid in self._entries
+
+    def _row(self, latitude: float) -> int:
+        return min(max(int((latitude + 90) // self.cell_size), 0), self._lat_count - 1)
+
+    def _col(self, longitude: float) -> int:
+        return int(((longitude + 180) % 360) // self.cell_size) % self._lon_count
+
+    def update(self, guid: str, obj: Any, latitude: float | None, longitude: float | None) -> None:
+        """
+        添加对象或更新对象位置，位置为 None 或不是有限值（NaN、inf）时移除对象
+
+        Args:
+            guid: 对象 GUID
+            obj: 对象
+            latitude: 纬度
+            longitude: 经度
+        """
+        entry = self._entries.get(guid)
+        if entry is not None and entry[0] == latitude and entry[1] == longitude:
+            return
+        if latitude is None or longitude is None or not (math.isfinite(latitude) and math.isfinite(longitude)):
+            self.remove(guid)
+            return
+        cell = (self._row(latitude), self._col(longitude))
+        if entry is None or entry[2] != cell:
+            if entry is not None:
+                self._discard_from_cell(entry[2], guid)
+            self._cells.setdefault(cell, {})[guid] = obj
+        self._entries[guid] = (latitude, longitude, cell)
+
+    def remove(self, guid: str) -> None:
+        """移除对象，不存在时忽略"""
+        entry = self._entries.pop(guid, None)
+        if entry is not None:
+            self._discard_from_cell(entry[2], guid)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._entries.clear()
+
+    def _discard_from_cell(self, cell: tuple[int, int], guid: str) -> None:
+        objects = self._cells[cell]
+        del objects[guid]
+        if not objects:
+            del self._cells[cell]
+
+    def position(self, guid: str) -> tuple[float, float] | None:
+        """获取对象被索引的位置 (lat, lon)，不存在时返回 None"""
+        entry = self._entries.get(guid)
+        return None if entry is None else (entry[0], entry[1])
+
+    def _col_range(self, lon_min: float, lon_max: float) -> range | None:
+        """覆盖经度 [lon_min, lon_max] 的经度网格范围，可超出经度网格数（按环绕处理），None 表示全部经度"""
+        if lon_max - lon_min >= 360 - self.cell_size:
+            return None
+        start = self._col(lon_min)
+        # 最后一列可能窄于网格大小，多取一列
+        return range(start, start + int((lon_max - lon_min) // self.cell_size) + 2)
+
+    def _iter_cells(self, row_min: int, row_max: int, cols: range | None) -> Iterator[dict[str, Any]]:
+        """
+        遍历纬度网格在 [row_min, row_max]、经度网格在 cols 中的非空网格
+
+        Args:
+            cols: 经度网格范围，可超出 [0, 经度网格数)，按经度环绕处理；None 表示全部经度
+        """
+        if cols is not None and len(cols) >= self._lon_count:
+            cols = None
+        col_count = self._lon_count if cols is None else len(cols)
+        cells = self._cells
+        if (row_max - row_min + 1) * col_count > len(cells):
+            # 查询范围内的网格比非空网格还多，直接遍历非空网格
+            col_set = None if cols is None else {col % self._lon_count for col in cols}
+            for (row, col), objects in cells.items():
+                if row_min <= row <= row_max and (col_set is None or col in col_set):
+                    yield objects
+            return
+
+        col_list = range(self._lon_count) if cols is None else [col % self._lon_count for col in cols]
+        for row in range(row_min, row_max + 1):
+            for col in col_list:
+                objects = cells.get((row, col))
+                if objects:
+                    yield objects
+
+    def within_radius(self, latitude: float, longitude: float, radius_km: float) -> list[tuple[float, str, Any]]:
+        """
+        查询与某点大圆距离不超过 radius_km 的对象
+
+        Args:
+            latitude: 纬度
+            longitude: 经度
+            radius_km: 半径（km）
+
+        Returns:
+            list[tuple[float, str, Any]]: [(距离 km, guid, obj), ...]，按距离升序
+        """
+        if radius_km < 0 or not self._entries:
+            return []
+        angle = min(radius_km * 1000 / EARTH_RADIUS, math.pi)
+        angle_degree = math.degrees(angle)
+        lat_min = latitude - angle_degree
+        lat_max = latitude + angle_degree
+        cos_lat = math.cos(latitude * degree2radian)
+        if lat_min <= -90 or lat_max >= 90 or math.sin(angle) >= cos_lat:
+            # 覆盖极点，经度方向不受限
+            cols = None
+        else:
+            # 球冠在经度方向的最大跨度
+            lon_span = math.degrees(math.asin(math.sin(angle) / cos_lat))
+            cols = self._col_range(longitude - lon_span, longitude + lon_span)
+
+        lat1 = latitude * degree2radian
+        lon1 = longitude * degree2radian
+        # 按半正矢比较，避免对每个候选对象计算反三角函数
+        max_hav = math.sin(angle / 2) ** 2
+        entries = self._entries
+        result = []
+        for objects in self._iter_cells(self._row(lat_min), self._row(lat_max), cols):
+            for guid, obj in objects.items():
+                lat2, lon2, _ = entries[guid]
+                lat2 *= degree2radian
+                hav = (
+                    math.sin((lat2 - lat1) / 2) ** 2 + cos_lat * math.cos(lat2) * math.sin((lon2 * degree2radian - lon1) / 2) ** 2
+                )
+                if hav <= max_hav:
+                    result.append((hav, guid, obj))
+        result.sort(key=lambda item: item[0])
+        return [(2 * math.asin(math.sqrt(min(hav, 1.0))) * EARTH_RADIUS / 1000, guid, obj) for hav, guid, obj in result]
+
+    def nearest(
+        self, latitude: float, longitude: float, k: int = 1, max_radius_km: float | None = None
+    ) -> list[tuple[float, str, Any]]:
+        """
+        查询距离某点最近的 k 个对象
+
+        从一个网格大小的半径开始，每次加倍查询范围，直到找到 k 个对象或覆盖整个地球。
+
+        Args:
+            latitude: 纬度
+            longitude: 经度
+            k: 数量
+            max_radius_km: 最大查询半径（km），默认不限制
+
+        Returns:
+            list[tuple[float, str, Any]]: [(距离 km, guid, obj), ...]，按距离升序
+        """
+        if k <= 0:
+            return []
+        limit = HALF_CIRCUMFERENCE_KM if max_radius_km is None else min(max_radius_km, HALF_CIRCUMFERENCE_KM)
+        radius = min(self.cell_size * EARTH_RADIUS * degree2radian / 1000, limit)
+        while True:
+            result = self.within_radius(latitude, longitude, radius)
+            if len(result) >= k or radius >= limit or len(result) == len(self._entries):
+                return result[:k]
+            radius = min(radius * 2, limit)
+
+    def within_polygon(self, points: Sequence[tuple[float, float]]) -> dict[str, Any]:
+        """
+        查询多边形区域内的对象
+
+        多边形的边按经纬度平面上的直线处理，不支持跨越 180° 经线的多边形。
+
+        Args:
+            points: 多边形顶点 [(lat, lon), ...]，至少 3 个
+
+        Returns:
+            dict[str, Any]: {guid: obj}
+
+        Raises:
+            ValueError: 顶点少于 3 个
+        """
+        if len(points) < 3:
+            raise ValueError(f"多边形至少需要 3 个顶点: {points}")
+        lats = [point[0] for point in points]
+        lons = [point[1] for point in points]
+        lat_min, lat_max = min(lats), max(lats)
+        lon_min, lon_max = min(lons), max(lons)
+        cols = self._col_range(lon_min, lon_max)
+
+        entries = self._entries
+        result = {}
+        for objects in self._iter_cells(self._row(lat_min), self._row(lat_max), cols):
+            for guid, obj in objects.items():
+                lat, lon, _ = entries[guid]
+                if lat_min <= lat <= lat_max and lon_min <= lon <= lon_max and point_in_polygon(lat, lon, points):
+                    result[guid] = obj
+        return result
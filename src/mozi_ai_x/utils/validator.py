@@ -1,29 +1,169 @@
 # src/mozi_ai_x/utils/validator.py
+"""
+参数校验装饰器
 
+函数签名、类型标注在装饰时（Literal 标注在首次调用时）解析一次，每次调用只按参数位置取值并校验。
+
+校验可以全局关闭：
+- 环境变量 MOZI_VALIDATION=0：导入 SDK 前设置，装饰器直接返回原函数，没有任何额外开销
+- set_validation_enabled(False)：运行时关闭，已装饰的函数只多一次开关判断；
+  环境变量关闭时装饰的函数不受影响，无法再开启校验
+"""
+
+import os
 import re
 import uuid
 from functools import wraps
-from inspect import signature
+from inspect import Parameter, signature
 from typing import get_type_hints, Literal, Any
 
+_enabled = os.getenv("MOZI_VALIDATION", "1").lower() not in ("0", "false", "off")
+
+# 缺少必需参数时的占位值，此时不校验，由原函数抛出 TypeError
+_REQUIRED = Parameter.empty
+
+# 标准格式的 UUID4（带-或不带-），版本位为 4，变体位为 8/9/a/b
+_UUID4_PATTERN = re.compile(r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?4[0-9a-fA-F]{3}-?[89abAB][0-9a-fA-F]{3}-?[0-9a-fA-F]{12}")
+
+
+def set_validation_enabled(enabled: bool) -> None:
+    """
+    开启或关闭参数校验
+
+    Args:
+        enabled: 是否校验
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def is_validation_enabled() -> bool:
+    """是否开启参数校验"""
+    return _enabled
+
+
+def _locate_args(func, names) -> list[tuple[str, int | None, bool, Any]] | None:
+    """
+    确定参数的取值位置
+
+    Returns:
+        list | None: [(参数名, 位置参数序号, 能否按关键字传入, 默认值)]；参数为 *args/**kwargs 时返回 None，
+            由调用方每次使用 sig.bind 绑定
+    """
+    params = signature(func).parameters
+    locators = []
+    for name in names:
+        param = params.get(name)
+        if param is None:
+            # 签名中没有该参数，取值始终为 None
+            locators.append((name, None, False, None))
+            continue
+        if param.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            return None
+        index = list(params).index(name) if param.kind != Parameter.KEYWORD_ONLY else None
+        locators.append((name, index, param.kind != Parameter.POSITIONAL_ONLY, param.default))
+    return locators
+
+
+def _make_checker(func, names, check):
+    """
+    生成按参数名取值并校验的函数
+
+    Args:
+        func: 被装饰的函数
+        names: 需要校验的参数名
+        check: check(name, value)，不合法时抛出 ValueError
+
+    Returns:
+        Callable: checker(args, kwargs)
+    """
+    locators = _locate_args(func, names)
+
+    if locators is None:
+        sig = signature(func)
+
+        def checker(args, kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            for name in names:
+                check(name, bound.arguments.get(name))
+
+        return checker
+
+    if len(locators) == 1:
+        # 常见情况只校验一个参数，省去循环
+        ((name, index, keyword, default),) = locators
+        if index is None:
+            index = -1
+
+        def checker(args, kwargs):
+            if index >= 0 and index < len(args):
+                value = args[index]
+            elif keyword and name in kwargs:
+                value = kwargs[name]
+            else:
+                value = default
+            if value is not _REQUIRED:
+                check(name, value)
+
+        return checker
+
+    def checker(args, kwargs):
+        count = len(args)
+        for name, index, keyword, default in locators:
+            if index is not None and index < count:
+                value = args[index]
+            elif keyword and name in kwargs:
+                value = kwargs[name]
+            else:
+                value = default
+            if value is not _REQUIRED:
+                check(name, value)
+
+    return checker
+
+
+def _no_check(args, kwargs):
+    pass
+
+
+def _validated(func, checker):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _enabled:
+            checker(args, kwargs)
+        return func(*args, **kwargs)
+
+    return wrapper
+
 
 def validate_literal_args(func):
     """
     自动校验带 Literal 标注的参数，值必须合法
     """
+    if not _enabled:
+        return func
+
+    literal_choices: dict[str, tuple] = {}
+
+    def check(name, value):
+        choices = literal_choices[name]
+        if value not in choices:
+            raise ValueError(f"参数{name}={value!r} 不符合约束，期望值之一为 {choices}")
+
+    def checker(args, kwargs):
+        # 类型标注可能引用之后才定义的类，首次调用时再解析
+        nonlocal checker
+        for name, typ in get_type_hints(func).items():
+            if getattr(typ, "__origin__", None) is Literal:
+                literal_choices[name] = typ.__args__
+        checker = _make_checker(func, list(literal_choices), check) if literal_choices else _no_check
+        checker(args, kwargs)
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        hints = get_type_hints(func)
-
-        sig = signature(func)
-        bound = sig.bind(*args, **kwargs)
-        bound.apply_defaults()
-        for name, value in bound.arguments.items():
-            typ = hints.get(name)
-            if typ is not None and getattr(typ, "__origin__", None) is Literal:
-                if value not in typ.__args__:
-                    raise ValueError(f"参数{name}={value!r} 不符合约束，期望值之一为 {typ.__args__}")
+        if _enabled:
+            checker(args, kwargs)
         return func(*args, **kwargs)
 
     return wrapper
@@ -34,19 +174,14 @@ def validate_uuid4_args(param_names):
     检查指定参数列表是否为合法的UUID4
     """
 
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            sig = signature(func)
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-            for name in param_names:
-                value = bound.arguments.get(name)
-                if not (isinstance(value, str) and _is_uuid4_string(value)):
-                    raise ValueError(f"参数{name}={value!r} 不是合法的UUID4字符串")
-            return func(*args, **kwargs)
+    def check(name, value):
+        if not (isinstance(value, str) and (_UUID4_PATTERN.fullmatch(value) or _is_uuid4_string(value))):
+            raise ValueError(f"参数{name}={value!r} 不是合法的UUID4字符串")
 
-        return wrapper
+    def decorator(func):
+        if not _enabled:
+            return func
+        return _validated(func, _make_checker(func, list(param_names), check))
 
     return decorator
 
@@ -56,20 +191,16 @@ def validate_regex_args(arg_regex_map: dict[str, str]):
     检查参数是否满足指定正则表达式
     用法: @validate_regex_args({"param": r"your_regex"})
     """
+    patterns = {name: re.compile(pattern) for name, pattern in arg_regex_map.items()}
 
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            sig = signature(func)
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-            for name, pattern in arg_regex_map.items():
-                s = bound.arguments.get(name)
-                if not isinstance(s, str) or not re.fullmatch(pattern, s):
-                    raise ValueError(f"参数{name}={s!r} 不符合正则 {pattern}")
-            return func(*args, **kwargs)
+    def check(name, s):
+        if not isinstance(s, str) or not patterns[name].fullmatch(s):
+            raise ValueError(f"参数{name}={s!r} 不符合正则 {arg_regex_map[name]}")
 
-        return wrapper
+    def decorator(func):
+        if not _enabled:
+            return func
+        return _validated(func, _make_checker(func, list(arg_regex_map), check))
 
     return decorator
 
@@ -80,19 +211,15 @@ def validate_range_args(arg_range_map: dict[str, tuple[Any, Any]]):
     用法: @validate_range_args({"x": (0,1)})
     """
 
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            sig = signature(func)
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-            for name, (low, high) in arg_range_map.items():
-                v = bound.arguments.get(name)
-                if not (low <= v <= high):
-                    raise ValueError(f"参数{name}={v!r} 超出有效区间[{low},{high}]")
-            return func(*args, **kwargs)
+    def check(name, v):
+        low, high = arg_range_map[name]
+        if not (low <= v <= high):
+            raise ValueError(f"参数{name}={v!r} 超出有效区间[{low},{high}]")
 
-        return wrapper
+    def decorator(func):
+        if not _enabled:
+            return func
+        return _validated(func, _make_checker(func, list(arg_range_map), check))
 
     return decorator
 
@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+from mozi_ai_x.simulation.server.batch import (
+    LUA_ERROR,
+    LUA_SUCCESS,
+    CommandBatch,
+    build_batch_script,
+    is_batchable,
+    parse_batch_results,
+)
+from mozi_ai_x.simulation.server.response import ServerResponse
+
+
+def test_build_batch_script_wraps_each_command():
+    cmds = ["ScenEdit_SetUnit({guid='a'})", "print(ScenEdit_GetUnit({guid='b'}).name)"]
+    script = build_batch_script(cmds)
+    for cmd in cmds:
+        assert f"__batch_run(function()\n{cmd}\nend)\n" in script
+    assert script.index(cmds[0]) < script.index(cmds[1])
+    assert script.rstrip().endswith("__batch_print('[' .. table.concat(__batch_results, ',') .. ']')")
+
+
+def test_parse_batch_results():
+    raw = json.dumps([[1, ""], [1, "F-16\nF-15"], [0, "attempt to index a nil value"]])
+    responses = parse_batch_results(raw, 3)
+    assert [response.success for response in responses] == [True, True, False]
+    assert responses[0].raw_data == LUA_SUCCESS and responses[0].lua_success
+    assert responses[1].raw_data == "F-16\nF-15"
+    assert responses[2].raw_data == LUA_ERROR
+    assert "nil value" in str(responses[2].error)
+
+
+def test_parse_batch_results_rejects_unexpected_output():
+    assert parse_batch_results("脚本执行出错", 1) is None
+    assert parse_batch_results(json.dumps([[1, ""]]), 2) is None
+    assert parse_batch_results(json.dumps({"a": 1}), 1) is None
+
+
+def test_is_batchable():
+    assert is_batchable("ScenEdit_SetUnit({guid='a'})")
+    assert not is_batchable("GetAllState")
+    assert not is_batchable("ReturnObj(ScenEdit_GetUnit({guid='a'}))")
+
+
+class _Server:
+    """代替 MoziServer，批处理脚本返回固定的输出，逐条发送时记录命令"""
+
+    def __init__(self, batch_output: str):
+        self.batch_output = batch_output
+        self.resent: list[str] = []
+
+    async def _send_and_recv(self, cmd, raise_error, timeout):
+        return ServerResponse.create_success(raw_data=self.batch_output, data=self.batch_output)
+
+    async def send_and_recv_many(self, cmds, ordered=False):
+        self.resent += cmds
+        return [ServerResponse.create_success(raw_data=LUA_SUCCESS, data=LUA_SUCCESS) for _ in cmds]
+
+
+def test_batch_resends_only_when_script_fails_to_compile():
+    cmds = ["ScenEdit_SetUnit({guid='a'})", "ScenEdit_SetUnit({guid='b'})"]
+
+    server = _Server(LUA_ERROR)
+    responses = asyncio.run(CommandBatch(server)._execute(cmds))
+    assert server.resent == cmds
+    assert all(response.lua_success for response in responses)
+
+    # 输出被截断等情况下部分命令可能已执行，不重发
+    server = _Server('[[1,""],[1,"trunc')
+    responses = asyncio.run(CommandBatch(server)._execute(cmds))
+    assert server.resent == []
+    assert [response.status_code for response in responses] == [1002, 1002]
+    assert not any(response.success for response in responses)
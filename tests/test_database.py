@@ -0,0 +1,344 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from mozi_ai_x.database.database import WEAPON_COLUMNS, DBConfig, DBType, ModelDatabase, ModelInfo, SQLiteBackend, _PooledBackend
+
+
+def _config(path, pool_size: int) -> DBConfig:
+    return DBConfig(db_type=DBType.SQLITE, host="", port=0, database=str(path), username="", password="", pool_size=pool_size)
+
+
+class _SQLitePool(_PooledBackend):
+    """用 SQLite 连接代替 MySQL/PostgreSQL 连接；blocker 被设置时，查询在执行前等待其放行"""
+
+    def __init__(self, config: DBConfig):
+        super().__init__(config)
+        self.opened = 0
+        self.started = threading.Semaphore(0)
+        self.blocker: threading.Event | None = None
+
+    def _open(self):
+        self.opened += 1
+        return sqlite3.connect(self.config.database, check_same_thread=False)
+
+    def _execute(self, conn, query, params):
+        blocker = self.blocker
+        if blocker is not None:
+            self.started.release()
+            blocker.wait()
+        return conn.execute(query, params).fetchall()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "model.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (ID INTEGER PRIMARY KEY, Name TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", [(i, f"n{i}") for i in range(10)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _run_in_threads(backend, count: int) -> tuple[list[threading.Thread], list]:
+    results = []
+
+    def query():
+        results.append(backend.execute_query("SELECT Name FROM t WHERE ID = ?", (1,)).fetchone())
+
+    threads = [threading.Thread(target=query, daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_pool_reuses_connections(db_path):
+    backend = _SQLitePool(_config(db_path, 2))
+    for _ in range(5):
+        assert backend.execute_query("SELECT COUNT(*) FROM t").fetchone() == (10,)
+    assert backend.opened == 1
+
+
+def test_pool_bounds_concurrent_connections(db_path):
+    backend = _SQLitePool(_config(db_path, 2))
+    backend.blocker = threading.Event()
+    threads, results = _run_in_threads(backend, 4)
+    for _ in range(2):
+        assert backend.started.acquire(timeout=5)
+    # 两个连接都在使用中，其余查询等待归还
+    assert not backend.started.acquire(timeout=0.2)
+    assert backend.opened == 2
+    backend.blocker.set()
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    assert results == [("n1",)] * 4
+    assert backend.opened == 2
+
+
+def test_pool_disconnect_with_queries_in_flight(db_path):
+    backend = _SQLitePool(_config(db_path, 2))
+    backend.blocker = threading.Event()
+    threads, results = _run_in_threads(backend, 2)
+    for _ in range(2):
+        assert backend.started.acquire(timeout=5)
+
+    backend.disconnect()
+    backend.blocker.set()
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    assert results == [("n1",)] * 2
+
+    # disconnect 前取出的连接归还时关闭，之后的查询可以建立新连接
+    backend.blocker = None
+    threads, results = _run_in_threads(backend, 3)
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    assert results == [("n1",)] * 3
+    assert backend._size <= 2
+
+
+def test_pool_waiter_wakes_after_disconnect(db_path):
+    backend = _SQLitePool(_config(db_path, 2))
+    backend.blocker = threading.Event()
+    threads, _ = _run_in_threads(backend, 2)
+    for _ in range(2):
+        assert backend.started.acquire(timeout=5)
+
+    # 池已满时等待的查询，在 disconnect 前取出的连接归还后继续
+    waiter, results = _run_in_threads(backend, 1)
+    backend.disconnect()
+    backend.blocker.set()
+    for thread in threads + waiter:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    assert results == [("n1",)]
+
+
+def test_pool_drops_failed_connection(db_path):
+    backend = _SQLitePool(_config(db_path, 1))
+    with pytest.raises(sqlite3.OperationalError):
+        backend.execute_query("SELECT * FROM missing")
+    assert backend._size == 0
+    assert backend.execute_query("SELECT COUNT(*) FROM t").fetchone() == (10,)
+    assert backend.opened == 2
+
+
+def test_sqlite_connection_per_thread(db_path):
+    backend = SQLiteBackend(_config(db_path, 1))
+    main = backend.connect()
+    assert backend.connect() is main
+
+    connections = []
+    thread = threading.Thread(target=lambda: connections.append(backend.connect()))
+    thread.start()
+    thread.join()
+    assert connections[0] is not main
+    assert backend.execute_query("SELECT Name FROM t WHERE ID = ?", (2,)).fetchone() == ("n2",)
+
+    backend.disconnect()
+    with pytest.raises(sqlite3.ProgrammingError):
+        connections[0].execute("SELECT 1")
+    assert backend.connect() is not main
+    assert backend.execute_query("SELECT COUNT(*) FROM t").fetchone() == (10,)
+
+
+def test_sqlite_read_only(db_path):
+    backend = SQLiteBackend(_config(db_path, 1))
+    with pytest.raises(sqlite3.OperationalError):
+        backend.execute_query("DELETE FROM t")
+    assert backend.execute_query("SELECT COUNT(*) FROM t").fetchone() == (10,)
+
+
+class _CountingBackend(SQLiteBackend):
+    """记录执行的查询及其参数"""
+
+    def __init__(self, config: DBConfig):
+        super().__init__(config)
+        self.queries: list[tuple[str, tuple]] = []
+
+    def execute_query(self, query, params=()):
+        self.queries.append((query, params))
+        return super().execute_query(query, params)
+
+
+@pytest.fixture
+def model_db_path(tmp_path):
+    """dataweapon 中 ID 1~5，dataaircraft/datafacility 中 ID 1~3"""
+    path = tmp_path / "modeldata.db"
+    columns = [name.strip() for name in WEAPON_COLUMNS.split(",")]
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE dataweapon ({', '.join(columns)})")
+    conn.executemany(
+        f"INSERT INTO dataweapon VALUES ({', '.join('?' * len(columns))})",
+        [(i, f"weapon_{i}", 1000 + i, *[float(i)] * (len(columns) - 3)) for i in range(1, 6)],
+    )
+    for category in ("aircraft", "facility"):
+        conn.execute(f"CREATE TABLE data{category} (ID INTEGER PRIMARY KEY, Name TEXT, Type INTEGER)")
+        conn.executemany(f"INSERT INTO data{category} VALUES (?, ?, ?)", [(i, f"{category}_{i}", 2000 + i) for i in range(1, 4)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _model_db(path, **kwargs) -> ModelDatabase:
+    return ModelDatabase(_CountingBackend(_config(path, 1)), **kwargs)
+
+
+def test_cache_evicts_least_recently_used(model_db_path):
+    db = _model_db(model_db_path, cache_size=2)
+    for weapon_id in (1, 2, 1, 3):
+        db.get_weapon_name_type(weapon_id)
+    # 3 加入时淘汰最久未使用的 2
+    assert db.get_weapon_type(1) == 1001
+    assert len(db.backend.queries) == 3
+    assert db.get_weapon_name_type(2) == ("weapon_2", 1002)
+    assert len(db.backend.queries) == 4
+    assert len(db._weapon_rows) == 2
+    assert db.cache_stats == {"hits": 2, "misses": 4, "queries": 4}
+
+
+@pytest.mark.parametrize(("cache_size", "queries"), [(0, 6), (None, 3)])
+def test_cache_size_disabled_and_unbounded(model_db_path, cache_size, queries):
+    db = _model_db(model_db_path, cache_size=cache_size)
+    for _ in range(2):
+        assert [db.get_weapon_type(weapon_id) for weapon_id in (1, 2)] == [1001, 1002]
+        assert db.get_model_info("aircraft", 1).name == "aircraft_1"
+    assert len(db.backend.queries) == queries
+    assert db.cache_stats["queries"] == queries
+    assert db.cache_stats["hits"] == 6 - queries
+
+
+def test_cache_remembers_missing_ids(model_db_path):
+    db = _model_db(model_db_path)
+    for _ in range(3):
+        assert db.get_weapon_info(99) is None
+        assert db.get_weapon_name_type(99) == ("", 0)
+        assert db.get_model_info("facility", 99) is None
+    assert len(db.backend.queries) == 2
+    assert db.cache_stats == {"hits": 7, "misses": 2, "queries": 2}
+
+
+def test_preload_on_first_lookup(model_db_path):
+    db = _model_db(model_db_path, preload=True)
+    assert db.get_weapon_info(2).name == "weapon_2"
+    assert db.get_weapon_info(99) is None
+    assert db.get_model_info("aircraft", 3).type == 2003
+    assert db.get_model_info("aircraft", 99) is None
+    # 每个表只整表读取一次
+    assert [query for query, _ in db.backend.queries] == [
+        f"SELECT {WEAPON_COLUMNS} FROM dataweapon",
+        "SELECT ID, Name, Type FROM dataaircraft",
+    ]
+    assert db.cache_stats == {"hits": 4, "misses": 0, "queries": 2}
+
+
+def test_preload_tables(model_db_path):
+    db = _model_db(model_db_path)
+    db.preload_tables(("facility",))
+    assert db.get_model_info("facility", 1).name == "facility_1"
+    assert db.get_model_info("facility", 2).name == "facility_2"
+    assert len(db.backend.queries) == 1
+    # 未预加载的表仍逐条查询
+    assert db.get_weapon_type(1) == 1001
+    assert len(db.backend.queries) == 2
+
+    with pytest.raises(ValueError):
+        db.preload_tables(("ship",))
+
+
+def test_clear_cache(model_db_path):
+    db = _model_db(model_db_path)
+    db.preload_tables(("aircraft",))
+    db.get_weapon_type(1)
+    db.clear_cache()
+    assert db.cache_stats == {"hits": 0, "misses": 0, "queries": 0}
+    assert len(db._weapon_rows) == 0
+
+    db.get_weapon_type(1)
+    db.get_model_info("aircraft", 1)
+    assert db.cache_stats == {"hits": 0, "misses": 2, "queries": 2}
+    assert len(db.backend.queries) == 4
+
+
+def test_bulk_queries_chunked_by_max_params(model_db_path):
+    db = _model_db(model_db_path, cache_size=0)
+    db.backend.max_params = 2
+    infos = db.get_weapon_infos([1, 2, 3, 4, 5, 99])
+    assert [params for _, params in db.backend.queries] == [(1, 2), (3, 4), (5, 99)]
+    assert db.cache_stats["queries"] == 3
+
+    single = _model_db(model_db_path, cache_size=0)
+    assert infos == {weapon_id: single.get_weapon_info(weapon_id) for weapon_id in (1, 2, 3, 4, 5, 99)}
+    models = db.get_model_infos("aircraft", [1, 2, 3, 99])
+    assert models == {db_id: single.get_model_info("aircraft", db_id) for db_id in (1, 2, 3, 99)}
+    assert len(db.backend.queries) == 5
+
+
+def test_bulk_queries_only_fetch_uncached_ids(model_db_path):
+    db = _model_db(model_db_path)
+    db.get_weapon_type(1)
+    db.get_weapon_info(99)
+    db.get_model_info("aircraft", 2)
+    db.backend.queries.clear()
+
+    assert db.get_weapon_name_types([1, 2, 99, 3]) == {
+        1: ("weapon_1", 1001),
+        2: ("weapon_2", 1002),
+        99: ("", 0),
+        3: ("weapon_3", 1003),
+    }
+    assert db.get_model_infos("aircraft", [2, 3])[3].name == "aircraft_3"
+    assert [params for _, params in db.backend.queries] == [(2, 3), (3,)]
+
+    # 批量查询的结果（包括不存在的 ID）同样进入缓存
+    assert db.get_weapon_info(2).name == "weapon_2"
+    assert db.get_model_infos("weapon", [3, 99]) == {3: ModelInfo(name="weapon_3", type=1003), 99: None}
+    assert len(db.backend.queries) == 2
+
+
+def test_bulk_queries_deduplicate_ids(model_db_path):
+    db = _model_db(model_db_path)
+    infos = db.get_weapon_infos([3, 3, 1, 3])
+    assert list(infos) == [3, 1]
+    assert [params for _, params in db.backend.queries] == [(3, 1)]
+    assert list(db.get_model_infos("facility", [2, 2])) == [2]
+    assert db.cache_stats == {"hits": 0, "misses": 3, "queries": 2}
+
+
+def test_bulk_queries_unknown_category(model_db_path):
+    db = _model_db(model_db_path)
+    assert db.get_model_infos("ship", [1, 2, 1]) == {1: None, 2: None}
+    assert db.get_model_info("ship", 1) is None
+    assert db.backend.queries == []
+
+
+def test_concurrent_first_lookup_loads_table_once(model_db_path):
+    db = _model_db(model_db_path, preload=True)
+    execute_query = db.backend.execute_query
+
+    def slow_query(query, params=()):
+        time.sleep(0.05)
+        return execute_query(query, params)
+
+    db.backend.execute_query = slow_query
+    barrier = threading.Barrier(8)
+    results = []
+
+    def lookup():
+        barrier.wait()
+        results.append([db.get_weapon_type(weapon_id) for weapon_id in range(1, 6)])
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert results == [[1001, 1002, 1003, 1004, 1005]] * 8
+    assert len(db.backend.queries) == 1
+    assert db.cache_stats == {"hits": 40, "misses": 0, "queries": 1}
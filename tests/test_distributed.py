@@ -0,0 +1,230 @@
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from grpclib import GRPCError
+from grpclib.const import Status
+
+from mozi_ai_x.simulation.proto.grpc import GrpcReply, GrpcRequest
+from mozi_ai_x.simulation.scenario import CScenario
+from mozi_ai_x.simulation.server import MoziServer
+from mozi_ai_x.simulation.server.distributed import MoziProxyServer
+
+SIDE_GUID = "a1b2c3d4-0000-4000-8000-000000000001"
+
+
+def _side_state(name: str) -> str:
+    return json.dumps({SIDE_GUID: {"ClassName": "CSide", "strGuid": SIDE_GUID, "strName": name}}, ensure_ascii=False)
+
+
+class _Stub:
+    """代替墨子服务器，按命令返回固定的回复；gate 被设置时，调用在其放行前等待"""
+
+    def __init__(self, replies: dict[str, str]):
+        self.replies = replies
+        self.calls: list[str] = []
+        self.gate: asyncio.Event | None = None
+
+    async def grpc_connect(self, grpc_request, timeout=None):
+        self.calls.append(grpc_request.name)
+        if self.gate is not None:
+            await self.gate.wait()
+        message = self.replies.get(grpc_request.name, "")
+        return GrpcReply(message=message, length=len(message))
+
+
+def _proxy(replies: dict[str, str], scenario=None) -> tuple[MoziProxyServer, _Stub]:
+    proxy = MoziProxyServer(SimpleNamespace(scenario=scenario), 0, cache_ttl=None)
+    stub = _Stub(replies)
+    proxy._mozi_stub = stub
+    return proxy, stub
+
+
+def test_situation_applied_on_event_loop_thread():
+    async def run():
+        scenario = CScenario(None)
+        proxy, _ = _proxy({"GetAllState": _side_state("红方"), "UpdateState": _side_state("蓝方")}, scenario)
+        proxy._apply_task = asyncio.create_task(proxy._apply_loop())
+        applied_threads = []
+        apply_situation = proxy._apply_situation
+
+        def record_thread(command, records):
+            applied_threads.append(threading.get_ident())
+            apply_situation(command, records)
+
+        proxy._apply_situation = record_thread
+        try:
+            await proxy._forward(GrpcRequest(name="GetAllState"))
+            await proxy.wait_applied()
+            assert scenario.situation.side_dict[SIDE_GUID].name == "红方"
+            await proxy._forward(GrpcRequest(name="UpdateState"))
+            await proxy.wait_applied()
+            assert scenario.situation.side_dict[SIDE_GUID].name == "蓝方"
+        finally:
+            proxy._apply_task.cancel()
+        assert applied_threads == [threading.get_ident()] * 2
+        assert proxy.apply_stats["applied"] == 2
+
+    asyncio.run(run())
+
+
+def test_concurrent_reads_share_one_upstream_call():
+    async def run():
+        proxy, stub = _proxy({"UpdateState": _side_state("红方")})
+        stub.gate = asyncio.Event()
+        tasks = [asyncio.create_task(proxy._forward(GrpcRequest(name="UpdateState"))) for _ in range(5)]
+        await asyncio.sleep(0)
+        stub.gate.set()
+        replies = await asyncio.gather(*tasks)
+        assert len({id(reply) for reply in replies}) == 1
+        assert stub.calls == ["UpdateState"]
+        assert proxy.cache_stats["coalesced"] == 4
+
+        # 同一 epoch 内命中缓存
+        assert await proxy._forward(GrpcRequest(name="UpdateState")) is replies[0]
+        assert proxy.cache_stats["hits"] == 1
+
+    asyncio.run(run())
+
+
+def test_other_commands_invalidate_cache():
+    async def run():
+        proxy, stub = _proxy({"UpdateState": _side_state("红方")})
+        await proxy._forward(GrpcRequest(name="UpdateState"))
+        await proxy._forward(GrpcRequest(name="ReturnObj(VP_GetScenarioIsRun())"))
+        await proxy._forward(GrpcRequest(name="UpdateState"))
+        assert stub.calls.count("UpdateState") == 2
+
+        proxy.invalidate()
+        await proxy._forward(GrpcRequest(name="UpdateState"))
+        assert stub.calls.count("UpdateState") == 3
+
+    asyncio.run(run())
+
+
+def test_master_commands_invalidate_proxy_cache():
+    async def run():
+        server = MoziServer("127.0.0.1", 6060, mode="master")
+        stub = _Stub({"Hs_OneTimeStop()": "lua执行成功"})
+        server.grpc_client = stub
+        server.is_connected = True
+        proxy = server.proxy_server
+        proxy._mozi_stub = stub
+        stub.replies["UpdateState"] = _side_state("红方")
+
+        await proxy._forward(GrpcRequest(name="UpdateState"))
+        await server.send_and_recv("UpdateState")
+        await proxy._forward(GrpcRequest(name="UpdateState"))
+        assert stub.calls.count("UpdateState") == 2  # Master 自身的只读命令不使缓存失效
+
+        await server.send_and_recv("Hs_OneTimeStop()")
+        await proxy._forward(GrpcRequest(name="UpdateState"))
+        assert stub.calls.count("UpdateState") == 3
+
+    asyncio.run(run())
+
+
+RED = "a1b2c3d4-0000-4000-8000-0000000000aa"
+BLUE = "a1b2c3d4-0000-4000-8000-0000000000bb"
+
+
+def _sides_state(*items: dict) -> str:
+    state = {
+        RED: {"ClassName": "CSide", "strGuid": RED, "strName": "红方"},
+        BLUE: {"ClassName": "CSide", "strGuid": BLUE, "strName": "蓝方"},
+    }
+    state.update({item["strGuid"]: item for item in items})
+    return json.dumps(state, ensure_ascii=False)
+
+
+def test_side_fallback_uses_master_situation_on_loop_thread():
+    async def run():
+        lookups = []
+
+        def get_object_side(guid):
+            lookups.append((guid, threading.get_ident()))
+            return {"known-unit": BLUE}.get(guid)
+
+        scenario = SimpleNamespace(situation=SimpleNamespace(get_object_side=get_object_side))
+        # 增量数据中的已有对象只有变化的字段，推演方只能从 Master 本地态势得到
+        update = _sides_state({"ClassName": "CAircraft", "strGuid": "known-unit", "dLatitude": 1.0})
+        proxy, _ = _proxy({"UpdateState": update}, scenario)
+        proxy._intercept_response = lambda command, response: asyncio.sleep(0)
+
+        red = json.loads((await proxy._forward(GrpcRequest(name="UpdateState?side=红方"))).message)
+        blue = json.loads((await proxy._forward(GrpcRequest(name="UpdateState?side=蓝方"))).message)
+        assert "known-unit" not in red and "known-unit" in blue
+        assert lookups == [("known-unit", threading.get_ident())]
+
+    asyncio.run(run())
+
+
+def _side_view(proxy, command: str, side: str) -> dict:
+    return json.loads(asyncio.run(proxy._forward(GrpcRequest(name=f"{command}?side={side}"))).message)
+
+
+def test_side_filter_resolves_side_fields_and_owners():
+    state = _sides_state(
+        # 传感器排在所属飞机之前
+        {"ClassName": "CSensor", "strGuid": "radar", "m_ParentPlatform": "red-air"},
+        {"ClassName": "CAircraft", "strGuid": "red-air", "m_Side": RED},
+        {"ClassName": "CLoadout", "strGuid": "loadout", "m_AircraftGuid": "red-air"},
+        {"ClassName": "CContact", "strGuid": "contact", "m_OriginalDetectorSide": BLUE, "m_Side": RED},
+        {"ClassName": "CDoctrine", "strGuid": "doctrine", "m_DoctrineOwner": BLUE},
+        {"ClassName": "CWeather", "strGuid": "weather"},
+    )
+    proxy, _ = _proxy({"GetAllState": state})
+
+    red = _side_view(proxy, "GetAllState", "红方")
+    blue = _side_view(proxy, "GetAllState", BLUE)
+    assert set(red) == {RED, BLUE, "radar", "red-air", "loadout", "weather"}
+    assert set(blue) == {RED, BLUE, "contact", "doctrine", "weather"}
+    assert proxy.side_stats["served"] == 2
+
+
+def test_side_filter_caches_message_per_side():
+    proxy, stub = _proxy({"GetAllState": _sides_state({"ClassName": "CAircraft", "strGuid": "red-air", "m_Side": RED})})
+
+    async def run():
+        first = await proxy._forward(GrpcRequest(name="GetAllState?side=红方"))
+        entry = proxy._side_filters["GetAllState"]
+        assert set(entry.messages) == {RED}
+        # 按名称或 GUID 请求同一推演方，复用已序列化的结果
+        second = await proxy._forward(GrpcRequest(name=f"GetAllState?side={RED}"))
+        assert second.message is first.message
+        assert proxy._side_filters["GetAllState"] is entry
+        assert stub.calls == ["GetAllState"]
+
+    asyncio.run(run())
+
+
+def test_side_filter_update_and_delete_use_known_sides():
+    red_air = {"ClassName": "CAircraft", "strGuid": "red-air", "m_Side": RED}
+    proxy, stub = _proxy({"GetAllState": _sides_state(red_air)})
+    _side_view(proxy, "GetAllState", "红方")
+
+    # 增量数据中的已有对象和删除记录没有推演方字段，按之前划分的结果确定
+    stub.replies["UpdateState"] = json.dumps(
+        {
+            "red-air": {"ClassName": "CAircraft", "strGuid": "red-air", "dLatitude": 1.0},
+            "gone": {"ClassName": "Delete", "strGuid": "red-air"},
+        }
+    )
+    assert set(_side_view(proxy, "UpdateState", "红方")) == {"red-air", "gone"}
+    assert _side_view(proxy, "UpdateState", "蓝方") == {}
+    assert "red-air" not in proxy._guid_side
+
+
+def test_side_filter_fails_closed():
+    proxy, stub = _proxy({"GetAllState": _sides_state(), "UpdateState": "not json"})
+
+    with pytest.raises(GRPCError) as error:
+        _side_view(proxy, "GetAllState", "绿方")
+    assert error.value.status == Status.NOT_FOUND
+
+    with pytest.raises(GRPCError) as error:
+        _side_view(proxy, "UpdateState", "红方")
+    assert error.value.status == Status.INTERNAL
+    assert proxy.side_stats["served"] == 0
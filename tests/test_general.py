@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from mozi_ai_x.utils.general import np1_to_np3, np3_to_memoryview, np3_to_np1
+
+
+def test_pack_round_trip():
+    rng = np.random.default_rng(0)
+    np_3 = (rng.random((3, 5, 7)) < 0.3).astype(np.uint8)
+    packed = np3_to_np1(np_3)
+    assert packed.dtype == np.uint8 and packed.shape == (14,)
+    assert np.array_equal(np1_to_np3(packed, np_3.shape), np_3)
+    assert np.array_equal(np1_to_np3(np3_to_memoryview(np_3), np_3.shape), np_3)
+
+    batch = np.stack([np_3, 1 - np_3])
+    assert np.array_equal(np1_to_np3(np3_to_np1(batch), np_3.shape), batch)
+
+
+def test_pack_rejects_wrong_dimensions():
+    with pytest.raises(ValueError):
+        np3_to_np1(np.zeros((2, 2)))
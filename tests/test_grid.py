@@ -0,0 +1,175 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from mozi_ai_x.utils import geo_vector
+from mozi_ai_x.utils.grid import Grid
+
+# 重构前的 Grid（类常量与类方法）在这些位置上给出的网格 ID 和索引
+BASELINE_IDS = [
+    ((43.5, 38.5, 0), 0, (0, 0, 0)),
+    ((45.5, 39.5, 1500), 3120240, (240, 120, 3)),
+    ((48.49, 41.99, 5), 418598, (598, 418, 0)),
+    ((48.5, 40.0, 450), 2180600, (600, 180, 2)),
+    ((50.45, 38.51, 12000), 6001623, (623, 1, 6)),
+    ((47.123, 40.456, -3), 6234434, (434, 234, 6)),
+    ((43.49, 40.0, 0), None, None),
+    ((50.5, 40.0, 0), None, None),
+    ((45.0, 42.0, 0), None, None),
+    ((46.0, 38.4, 0), None, None),
+]
+BASELINE_POSITIONS = [
+    ((0, 0, 0), (43.50416666666667, 38.50416666666667, 0)),
+    ((599, 10, 2), (48.49583333333334, 38.587500000000006, 450)),
+    ((600, 419, 6), (48.541666666666664, 41.99583333333334, 10000)),
+    ((623, 0, 3), (50.45833333333333, 38.50416666666667, 1000)),
+]
+
+
+@pytest.mark.parametrize(("location", "grid_id", "indices"), BASELINE_IDS)
+def test_default_grid_matches_baseline(location, grid_id, indices):
+    assert Grid.get_grid_id(*location) == grid_id
+    assert Grid.get_index(*location) == indices
+
+
+@pytest.mark.parametrize(("indices", "position"), BASELINE_POSITIONS)
+def test_default_grid_positions_match_baseline(indices, position):
+    assert Grid.get_position(*indices) == pytest.approx(position)
+
+
+def _random_locations(grid: Grid, count: int = 2000) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    # 范围两侧各扩展一些，覆盖区域外的位置
+    lons = rng.uniform(grid.MIN_LONGITUDE - 0.5, grid.MAX_LONGITUDE + 0.5, count)
+    lats = rng.uniform(grid.MIN_LATITUDE - 0.5, grid.MAX_LATITUDE + 0.5, count)
+    alts = rng.uniform(-100, 12000, count)
+    return lons, lats, alts
+
+
+@pytest.mark.parametrize(
+    "grid",
+    [Grid.default(), Grid(120, 126, 20, 26, degree_unit=1 / 60, sparse_longitude=None, altitude_bands=(0, 1000, 5000))],
+    ids=["default", "custom"],
+)
+def test_array_methods_match_scalar(grid):
+    lons, lats, alts = _random_locations(grid)
+    lon_idx, lat_idx, alt_idx = grid.get_indices(lons, lats, alts)
+    grid_ids = grid.get_grid_ids(lons, lats, alts)
+    for i in range(len(lons)):
+        indices = grid.get_index(lons[i], lats[i], alts[i])
+        assert (lon_idx[i], lat_idx[i], alt_idx[i]) == (indices or (-1, -1, -1))
+        grid_id = grid.get_grid_id(lons[i], lats[i], alts[i])
+        assert grid_ids[i] == (-1 if grid_id is None else grid_id)
+
+    inside = lon_idx >= 0
+    assert 0 < inside.sum() < len(lons)
+    positions = grid.get_positions(lon_idx, lat_idx, alt_idx)
+    for i in np.flatnonzero(inside):
+        assert tuple(array[i] for array in positions) == grid.get_position(lon_idx[i], lat_idx[i], alt_idx[i])
+    assert all(np.isnan(array[~inside]).all() for array in positions)
+
+
+def test_custom_grid_geometry():
+    grid = Grid(120, 126, 20, 26, degree_unit=1 / 60, sparse_longitude=None)
+    assert (grid.LON_UNIT_COUNT, grid.LAT_UNIT_COUNT) == (360, 360)
+    assert (grid.ID_LAT_FACTOR, grid.ID_ALT_FACTOR) == (1000, 1000000)
+    assert grid.get_index(121.5, 23.0, 1500) == (90, 180, 3)
+    assert grid.get_grid_id(126.0, 23.0, 0) is None
+    assert grid.get_position(359, 359, 0) == pytest.approx((126 - 1 / 120, 26 - 1 / 120, 0))
+
+    # 范围不是划分单元的整数倍时向外扩展
+    grid = Grid(0, 1.05, 0, 0.95, degree_unit=0.1, sparse_longitude=None)
+    assert (grid.LON_UNIT_COUNT, grid.LAT_UNIT_COUNT) == (11, 10)
+    assert grid.MAX_LONGITUDE == pytest.approx(1.1)
+    assert grid.get_index(1.08, 0.99, 0) == (10, 9, 0)
+
+    # 单元数超过 1000 时 ID 系数随之增大，不同位置的 ID 不冲突
+    grid = Grid(0, 20, 0, 1, degree_unit=1 / 100, sparse_longitude=None)
+    assert grid.ID_LAT_FACTOR == 10000
+    assert grid.get_grid_id(19.995, 0.005, 0) != grid.get_grid_id(0.005, 0.015, 0)
+
+
+def test_custom_grid_independent_of_default():
+    grid = Grid(120, 126, 20, 26, degree_unit=1 / 60, sparse_longitude=None)
+    assert Grid.get_grid_id(121.5, 23.0, 0) is None
+    assert Grid.default().DEGREE_UNIT == Grid.DEGREE_UNIT == 1 / 120
+    assert grid.DEGREE_UNIT == 1 / 60
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_longitude": 50, "max_longitude": 40},
+        {"min_latitude": 30, "max_latitude": 30},
+        {"degree_unit": 0},
+        {"sparse_degree_unit": -1},
+        {"sparse_longitude": 43.5},
+        {"sparse_longitude": 51.0},
+        {"altitude_bands": ()},
+        {"altitude_bands": (0, 100, 100)},
+    ],
+)
+def test_invalid_grid(kwargs):
+    with pytest.raises(ValueError):
+        Grid(**kwargs)
+
+
+def test_from_situation():
+    calls = []
+
+    def get_extent(key, side_guid):
+        calls.append((key, side_guid))
+        return 30.2, 31.0, 120.3, 121.9
+
+    grid = Grid.from_situation(SimpleNamespace(get_extent=get_extent), degree_unit=0.1, margin=0.5, side_guid="side")
+    assert calls == [("units", "side")]
+    assert (grid.MIN_LATITUDE, grid.MIN_LONGITUDE) == pytest.approx((29.7, 119.8))
+    assert (grid.MAX_LATITUDE, grid.MAX_LONGITUDE) == pytest.approx((31.5, 122.4))
+    assert grid.LEFT_LON_COUNT == grid.LON_UNIT_COUNT == 26
+    assert grid.get_index(121.9, 31.0, 0) is not None
+
+    with pytest.raises(ValueError):
+        Grid.from_situation(SimpleNamespace(get_extent=lambda key, side_guid: None))
+
+
+def test_class_calls_use_default_grid():
+    default = Grid.default()
+    assert Grid.default() is default
+    assert Grid.get_grid_id.__self__ is default
+    assert Grid._get_longitude_index.__self__ is default
+
+    # 默认网格的距离核缓存由类调用和实例调用共用
+    default.clear_kernel_cache()
+    grids = Grid.get_grids_within_distance((40.0, 45.0), 10)
+    assert grids == default.get_grids_within_distance((40.0, 45.0), 10)
+    assert len(default._kernel_cache) == 1
+
+
+@pytest.mark.parametrize(
+    "grid",
+    [Grid.default(), Grid(43.5, 48.5, 38.5, 42, degree_unit=1 / 60, sparse_longitude=None)],
+    ids=["default", "coarse"],
+)
+@pytest.mark.parametrize("distance", [20.0, 50.0])
+def test_distance_kernel_matches_exact_mask_at_band_edges(grid, distance):
+    assert grid.KERNEL_LAT_BAND_ROWS * grid.DEGREE_UNIT == pytest.approx(Grid.KERNEL_LAT_BAND_DEGREES)
+    rows = grid.KERNEL_LAT_BAND_ROWS
+    lon_idx = grid.LEFT_LON_COUNT // 2
+    # 距离核按纬度带中间一行计算，带边缘处与逐网格计算的差别只出现在距离非常接近边界的网格上
+    tolerance = distance * 0.002
+    for lat_idx in sorted({i for band in range(grid.LAT_UNIT_COUNT // rows) for i in (band * rows, band * rows + rows - 1)}):
+        kernel, (start_lat, start_lon) = grid._place_distance_kernel(lat_idx, lon_idx, distance)
+        placed = np.zeros((grid.LAT_UNIT_COUNT, grid.LEFT_LON_COUNT), dtype=bool)
+        first = max(start_lat, 0)
+        area = kernel[first - start_lat : grid.LAT_UNIT_COUNT - start_lat]
+        placed[first : first + area.shape[0], start_lon : start_lon + area.shape[1]] = area
+
+        distances = geo_vector.horizontal_distance(
+            grid.lat_centers[lat_idx],
+            grid.lon_centers[lon_idx],
+            grid.lat_centers[:, None],
+            grid.lon_centers[None, : grid.LEFT_LON_COUNT],
+        )
+        mismatch = placed != (distances < distance)
+        assert np.all(np.abs(distances[mismatch] - distance) < tolerance), lat_idx
@@ -0,0 +1,35 @@
+import pytest
+
+from mozi_ai_x.simulation.guid_registry import GuidRegistry
+
+
+def test_keeps_insertion_order_and_list_interface():
+    registry = GuidRegistry(["a", "b"])
+    registry.add("c")
+    registry.append("a")  # 已存在时保持原位置
+    registry.extend(["d", "b"])
+    assert list(registry) == ["a", "b", "c", "d"]
+    assert registry == ["a", "b", "c", "d"]
+    assert registry[0] == "a" and registry[-1] == "d" and registry[1:3] == ["b", "c"]
+    assert registry + ["e"] == ["a", "b", "c", "d", "e"]
+    assert ["z"] + registry == ["z", "a", "b", "c", "d"]
+    assert list(reversed(registry)) == ["d", "c", "b", "a"]
+    assert "c" in registry and "e" not in registry
+    assert len(registry) == 4
+
+
+def test_remove_and_discard():
+    registry = GuidRegistry(["a", "b"])
+    registry.remove("a")
+    with pytest.raises(ValueError):
+        registry.remove("a")
+    registry.discard("a")
+    registry.discard("b")
+    assert len(registry) == 0
+
+
+def test_copy_is_independent():
+    registry = GuidRegistry(["a"])
+    copy = registry.copy()
+    copy.add("b")
+    assert registry == ["a"] and copy == GuidRegistry(["a", "b"])
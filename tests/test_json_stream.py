@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from mozi_ai_x.utils.json_stream import JsonObjectStreamDecoder
+
+DATA = {
+    "guid-1": {"ClassName": "CAircraft", "dLatitude": 40.5, "items": [1, 2, {"a": "}"}]},
+    "guid-2": {"ClassName": "CSide", "strName": "红方 {,:}"},
+    "guid-3": 12345,
+    "guid-4": {"strName": 'quote " backslash \\ {[', "path": ["a\\", "\\}"]},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 10000])
+def test_chunked_input_matches_json_loads(chunk_size):
+    text = json.dumps(DATA, ensure_ascii=False, indent=1)
+    decoder = JsonObjectStreamDecoder()
+    items = []
+    for start in range(0, len(text), chunk_size):
+        items += decoder.feed(text[start : start + chunk_size])
+    decoder.close()
+    assert decoder.finished
+    assert dict(items) == DATA
+    assert [key for key, _ in items] == list(DATA)
+
+
+def test_scalar_is_not_returned_before_it_is_complete():
+    decoder = JsonObjectStreamDecoder()
+    assert decoder.feed('{"a": 12') == []
+    assert decoder.feed("34") == []
+    assert decoder.feed("}") == [("a", 1234)]
+
+
+def test_invalid_and_incomplete_input():
+    with pytest.raises(ValueError):
+        JsonObjectStreamDecoder().feed("[1, 2]")
+
+    decoder = JsonObjectStreamDecoder()
+    decoder.feed('{"a": {"b": 1}')
+    with pytest.raises(ValueError):
+        decoder.close()
+
+    decoder = JsonObjectStreamDecoder()
+    decoder.feed("{}")
+    with pytest.raises(ValueError):
+        decoder.feed("{}")
+
+    # 已完整的成员格式错误时立即报错，不等待更多数据
+    decoder = JsonObjectStreamDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed('{"a": tru')
+        decoder.feed('x, "b": 1}')
+
+
+class _CountingDecoder:
+    def __init__(self, decoder):
+        self.decoder = decoder
+        self.calls = 0
+
+    def raw_decode(self, s, idx=0):
+        self.calls += 1
+        return self.decoder.raw_decode(s, idx)
+
+
+def test_large_member_split_over_many_chunks_is_decoded_once():
+    big = {f"field_{i}": [i, {"name": f'\\{i}"}}', "nested": {"x": i}}] for i in range(2000)}
+    text = json.dumps({"first": 1, "big": big, "last": {"a": 1}})
+    decoder = JsonObjectStreamDecoder()
+    counter = decoder._decoder = _CountingDecoder(decoder._decoder)
+    items = []
+    for start in range(0, len(text), 16):
+        items += decoder.feed(text[start : start + 16])
+    decoder.close()
+    assert items == [("first", 1), ("big", big), ("last", {"a": 1})]
+    # 每个成员的键和值最多各解码两次（一次失败的尝试和完整后的一次），与数据块的数量无关
+    assert counter.calls <= 12
@@ -0,0 +1,47 @@
+import pytest
+
+from mozi_ai_x.utils import Grid, GridRaster
+
+
+def _expected(latitude: float, longitude: float, radius: float) -> set[int]:
+    return set(Grid.get_grids_within_distance((latitude, longitude), radius))
+
+
+@pytest.mark.parametrize(
+    ("latitude", "longitude"),
+    [
+        (40.0, 48.2),  # 覆盖范围涉及稀疏区域，逐网格计算
+        (40.0, 45.0),  # 完全位于左侧区域，使用距离核
+    ],
+)
+def test_update_matches_grid_after_small_moves(latitude, longitude):
+    raster = GridRaster()
+    raster.update("side", "sensor", "unit", latitude, longitude, 40.0)
+    assert set(raster.get_grid_ids("side", "sensor")) == _expected(latitude, longitude, 40.0)
+
+    for _ in range(5):
+        latitude += 0.004
+        longitude += 0.004
+        raster.update("side", "sensor", "unit", latitude, longitude, 40.0)
+        assert set(raster.get_grid_ids("side", "sensor")) == _expected(latitude, longitude, 40.0)
+
+
+def test_update_skips_same_cell_in_kernel_region():
+    raster = GridRaster()
+    assert raster.update("side", "sensor", "unit", 40.0, 45.0, 40.0)
+    assert not raster.update("side", "sensor", "unit", 40.0, 45.0, 40.0)
+    lat_idx = Grid._get_latitude_index(40.0)
+    lon_idx = Grid._get_longitude_index(45.0)
+    assert Grid._get_latitude_index(40.001) == lat_idx and Grid._get_longitude_index(45.001) == lon_idx
+    assert not raster.update("side", "sensor", "unit", 40.001, 45.001, 40.0)
+
+
+def test_remove_and_sync():
+    raster = GridRaster()
+    raster.update("side", "occupancy", "a", 40.0, 45.0)
+    raster.update("side", "occupancy", "b", 40.0, 45.0)
+    assert raster.get_counts("side", "occupancy").max() == 2
+    assert raster.remove("side", "occupancy", "a")
+    assert not raster.remove("side", "occupancy", "a")
+    raster.sync("side", "occupancy", {})
+    assert not raster.get_mask("side", "occupancy").any()
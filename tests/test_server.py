@@ -0,0 +1,46 @@
+import asyncio
+
+from mozi_ai_x.simulation.proto.grpc import GrpcReply
+from mozi_ai_x.simulation.server import MoziServer
+
+
+class _BrokenStub:
+    """旧 Channel 上的调用都失败：第一个调用在其他调用触发重建之后才失败"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def grpc_connect(self, grpc_request, timeout=None):
+        self.calls += 1
+        if self.calls == 1:
+            await asyncio.sleep(0.05)
+        raise ConnectionError("connection reset")
+
+
+class _Stub:
+    async def grpc_connect(self, grpc_request, timeout=None):
+        return GrpcReply(message=f"ok:{grpc_request.name}", length=0)
+
+
+def test_late_failure_reuses_rebuilt_channel():
+    async def run():
+        server = MoziServer("127.0.0.1", 6060, retry_times=1)
+        server.channel = object()
+        server.grpc_client = _BrokenStub()
+        server.is_connected = True
+        rebuilds = 0
+
+        async def connect_grpc_server():
+            nonlocal rebuilds
+            rebuilds += 1
+            server.channel = object()
+            server.grpc_client = _Stub()
+            return True
+
+        server.connect_grpc_server = connect_grpc_server
+        responses = await asyncio.gather(server.send_and_recv("a"), server.send_and_recv("b"))
+        assert [response.raw_data for response in responses] == ["ok:a", "ok:b"]
+        assert rebuilds == 1
+        assert server.is_connected
+
+    asyncio.run(run())
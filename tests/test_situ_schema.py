@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from mozi_ai_x.simulation.scenario import CScenario
+from mozi_ai_x.simulation.situ_schema import decode_situation
+
+SIDE_GUID = "a1b2c3d4-0000-4000-8000-000000000001"
+AIRCRAFT_GUID = "a1b2c3d4-0000-4000-8000-000000000002"
+
+STATE = json.dumps(
+    {
+        SIDE_GUID: {"ClassName": "CSide", "strGuid": SIDE_GUID, "strName": "红方"},
+        AIRCRAFT_GUID: {
+            "ClassName": "CAircraft",
+            "strGuid": AIRCRAFT_GUID,
+            "strName": "F-16",
+            "m_Side": SIDE_GUID,
+            "dLatitude": 40.5,
+            "dLongitude": 45.25,
+        },
+    },
+    ensure_ascii=False,
+)
+
+
+@pytest.mark.parametrize("backend", ["msgspec", "json"])
+def test_typed_and_dict_decoding_apply_the_same_fields(backend):
+    pytest.importorskip(backend)
+    scenario = CScenario(None)
+    records = list(decode_situation(STATE, backend=backend))
+    scenario.situation._parse_full_situation(records, scenario)
+
+    aircraft = scenario.situation.get_obj_by_guid(AIRCRAFT_GUID)
+    assert (aircraft.name, aircraft.side, aircraft.latitude, aircraft.longitude) == ("F-16", SIDE_GUID, 40.5, 45.25)
+    if backend == "msgspec":
+        assert not isinstance(records[1], dict)
+        assert (records[1].class_name, records[1].strGuid) == ("CAircraft", AIRCRAFT_GUID)
@@ -0,0 +1,14 @@
+import math
+
+from mozi_ai_x.utils.spatial import SpatialIndex
+
+
+def test_non_finite_position_removes_object():
+    index = SpatialIndex()
+    index.update("a", "obj", 30.0, 120.0)
+    for latitude, longitude in ((math.nan, 120.0), (30.0, math.inf), (None, 120.0)):
+        index.update("a", "obj", latitude, longitude)
+        assert "a" not in index
+        assert index.within_radius(30.0, 120.0, 100.0) == []
+        index.update("a", "obj", 30.0, 120.0)
+        assert index.position("a") == (30.0, 120.0)
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from mozi_ai_x.utils.geo import get_horizontal_distance
+from mozi_ai_x.utils.spatial import SpatialIndex, point_in_polygon
+
+
+@pytest.fixture
+def points():
+    rng = random.Random(0)
+    points = {f"u{i}": (rng.uniform(-89, 89), rng.uniform(-180, 180)) for i in range(300)}
+    # 跨越 180° 经线和靠近极点的对象
+    points.update({"east": (10.0, 179.9), "west": (10.0, -179.9), "pole": (89.9, 0.0)})
+    return points
+
+
+def _index(points, cell_size=1.0) -> SpatialIndex:
+    index = SpatialIndex(cell_size)
+    for guid, (latitude, longitude) in points.items():
+        index.update(guid, guid, latitude, longitude)
+    return index
+
+
+@pytest.mark.parametrize("cell_size", [0.5, 1.0, 5.0])
+@pytest.mark.parametrize(("center", "radius"), [((10.0, 179.95), 50.0), ((89.0, 45.0), 300.0), ((0.0, 0.0), 2000.0)])
+def test_within_radius_matches_brute_force(points, cell_size, center, radius):
+    index = _index(points, cell_size)
+    expected = {guid for guid, point in points.items() if get_horizontal_distance(center, point) <= radius}
+    result = index.within_radius(*center, radius)
+    assert {guid for _, guid, _ in result} == expected
+    distances = [distance for distance, _, _ in result]
+    assert distances == sorted(distances)
+
+
+def test_nearest_and_move(points):
+    index = _index(points)
+    center = (10.0, 179.99)
+    expected = sorted(points, key=lambda guid: get_horizontal_distance(center, points[guid]))[:3]
+    assert [guid for _, guid, _ in index.nearest(*center, k=3)] == expected
+
+    index.update("east", "east", -45.0, 10.0)
+    assert index.position("east") == (-45.0, 10.0)
+    assert "east" not in {guid for _, guid, _ in index.within_radius(10.0, 179.9, 10.0)}
+    index.remove("east")
+    assert "east" not in index and len(index) == len(points) - 1
+
+
+def test_within_polygon(points):
+    index = _index(points)
+    polygon = [(-30.0, -60.0), (40.0, -60.0), (40.0, 30.0), (-30.0, 10.0)]
+    expected = {guid for guid, (latitude, longitude) in points.items() if point_in_polygon(latitude, longitude, polygon)}
+    assert set(index.within_polygon(polygon)) == expected
+    with pytest.raises(ValueError):
+        index.within_polygon(polygon[:2])
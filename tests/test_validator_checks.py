@@ -0,0 +1,100 @@
+import uuid
+from typing import Literal
+
+import pytest
+
+from mozi_ai_x.utils import validator
+from mozi_ai_x.utils.validator import (
+    is_validation_enabled,
+    set_validation_enabled,
+    validate_literal_args,
+    validate_range_args,
+    validate_regex_args,
+    validate_uuid4_args,
+)
+
+GUID = str(uuid.uuid4())
+
+
+class Unit:
+    @validate_uuid4_args(["guid"])
+    def get(self, guid: str, default=None):
+        return guid
+
+    @validate_uuid4_args(["a", "b"])
+    def pair(self, a: str, *, b: str = GUID):
+        return a, b
+
+    @validate_literal_args
+    def set_state(self, state: Literal["on", "off"], mode: "Mode" = 1):
+        return state, mode
+
+    @validate_range_args({"x": (0, 1)})
+    @validate_regex_args({"name": r"[a-z]+"})
+    def misc(self, x: float, name: str = "abc"):
+        return x, name
+
+
+Mode = Literal[1, 2]  # Literal 标注在首次调用时解析，可引用之后定义的名称
+
+
+@pytest.fixture(autouse=True)
+def _enabled():
+    yield
+    set_validation_enabled(True)
+
+
+def test_uuid4_positional_keyword_and_default():
+    unit = Unit()
+    assert unit.get(GUID) == GUID
+    assert unit.get(guid=GUID.upper()) == GUID.upper()
+    assert unit.get(GUID.replace("-", ""), default=1)
+    for bad in ("", "123", GUID[:-1], str(uuid.uuid1()), None):
+        with pytest.raises(ValueError):
+            unit.get(bad)
+    with pytest.raises(TypeError):
+        unit.get()  # 缺少参数时由原函数抛出 TypeError
+
+    assert unit.pair(GUID) == (GUID, GUID)
+    with pytest.raises(ValueError):
+        unit.pair(GUID, b="x")
+
+
+def test_literal_with_forward_reference():
+    unit = Unit()
+    assert unit.set_state("on") == ("on", 1)
+    assert unit.set_state(state="off", mode=2) == ("off", 2)
+    with pytest.raises(ValueError):
+        unit.set_state("bad")
+    with pytest.raises(ValueError):
+        unit.set_state("on", 3)
+
+
+def test_range_and_regex():
+    unit = Unit()
+    assert unit.misc(0.5) == (0.5, "abc")
+    with pytest.raises(ValueError):
+        unit.misc(2)
+    with pytest.raises(ValueError):
+        unit.misc(0.5, name="ABC")
+
+
+def test_runtime_switch():
+    unit = Unit()
+    set_validation_enabled(False)
+    assert not is_validation_enabled()
+    assert unit.get("not-a-guid") == "not-a-guid"
+    assert unit.set_state("bad") == ("bad", 1)
+    set_validation_enabled(True)
+    with pytest.raises(ValueError):
+        unit.get("not-a-guid")
+
+
+def test_disabled_at_import_returns_original_function(monkeypatch):
+    monkeypatch.setattr(validator, "_enabled", False)
+
+    def func(guid):
+        return guid
+
+    assert validate_uuid4_args(["guid"])(func) is func
+    assert validate_literal_args(func) is func